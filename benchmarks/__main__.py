@@ -0,0 +1,68 @@
+"""
+Runs the benchmark suite or compares two result files:
+
+    python -m benchmarks run [-k PATTERN] [--output FILE] [--repeat N]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.15]
+    python -m benchmarks scaling [RESULTS] [--max-exponent 1.3]
+
+compare exits with status 1 if a benchmark got slower than the threshold,
+scaling if a benchmark grows faster than size^max-exponent with its parameter.
+"""
+import argparse
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+from benchmarks.harness import (DEFAULT_MAX_EXPONENT, DEFAULT_REPEAT, DEFAULT_RESULTS_PATH,
+                                DEFAULT_THRESHOLD, compare_results, format_comparison,
+                                format_scaling, get_scaling, load_results, run_benchmarks,
+                                save_results)
+
+
+def load_benchmark_modules():
+    """Imports benchmarks/bench_*.py, their benchmarks register themselves."""
+    for module in pkgutil.iter_modules([str(Path(__file__).resolve().parent)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and save results as JSON")
+    run_parser.add_argument("-k", dest="pattern", default="*", help="fnmatch pattern of benchmark names")
+    run_parser.add_argument("--output", default=str(DEFAULT_RESULTS_PATH))
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative slowdown of the median reported as a regression")
+
+    scaling_parser = commands.add_parser("scaling", help="Flag benchmarks growing super-linearly with size")
+    scaling_parser.add_argument("results", nargs="?", default=str(DEFAULT_RESULTS_PATH))
+    scaling_parser.add_argument("--max-exponent", type=float, default=DEFAULT_MAX_EXPONENT,
+                                help="Largest accepted exponent of time ~ size^exponent")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        load_benchmark_modules()
+        results = run_benchmarks(args.pattern, args.repeat)
+        print(f"Results saved → {save_results(results, args.output)}")
+        return 0
+
+    if args.command == "scaling":
+        rows = get_scaling(load_results(args.results))
+        print(format_scaling(rows, args.max_exponent))
+        return 1 if any(row[3] > args.max_exponent for row in rows) else 0
+
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(format_comparison(rows, args.threshold))
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import importlib.util
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from benchmarks.harness import benchmark
+from helpers import record_mode_helper
+from helpers.placeholder_manager import PlaceholderManager
+from helpers.record_mode_helper import fix_noname_parameter_value, update_value_in_source_file
+from helpers.test_context import set_current_param_row
+from utils.code_utils import get_caller_info, get_parameter_index_from_function_def, get_parameter_name_by_index
+
+CONFIG = {"record_mode": True}
+# Generated test module sizes (lines), every tenth line is a row of the target parametrize table
+TEST_MODULE_LINES = (1_000, 10_000, 50_000)
+PAGE_OBJECT_FIELDS = (100, 500, 2_000)
+DEFAULT_PAGE_FIELDS = 300
+# Test frames are this deep in the call stack when get_caller_info walks it
+STACK_DEPTH = 20
+NEW_VALUE = "standard_user"
+
+
+class RecordModePage:
+    """Playwright page stand-in: fill() with a None value starts the record-mode fix."""
+
+    def __init__(self):
+        self.placeholder_manager = PlaceholderManager(CONFIG)
+
+    def locator(self, selector: str) -> str:
+        return selector
+
+    def fill(self, selector: str, value: str | None):
+        return fix_noname_parameter_value("value", None, 1, str(value), None, self.placeholder_manager)
+
+
+def generate_page_object(fields: int) -> str:
+    lines = ["class GeneratedPage:", "",
+             "    def __init__(self, page):",
+             "        self.page = page"]
+    lines += [f'        self.field_{i} = page.locator("[data-test=\'field-{i}\']")' for i in range(fields)]
+
+    for i in range(fields):
+        lines += ["", f"    def fill_field_{i}(self, value):", f"        self.page.fill(self.field_{i}, value)"]
+
+    lines += ["", "    def fill_user_name(self, user_name):", '        self.page.fill("#user-name", user_name)']
+    return "\n".join(lines) + "\n"
+
+
+def generate_test_module(lines: int) -> str:
+    """A test module of about 'lines' lines, the last test has a parametrize table of lines // 10 rows."""
+    source = ["import pytest", "", "",
+              "def call_nested(func, depth):",
+              "    return func() if depth == 0 else call_nested(func, depth - 1)", "", ""]
+    rows = max(lines // 10, 1)
+
+    for i in range((lines - rows) // 8):
+        source += ['@pytest.mark.parametrize("user_name, password", [',
+                   f'    ("user_{i}_0", "secret_sauce"),',
+                   f'    ("user_{i}_1", "secret_sauce"),',
+                   "])",
+                   f"def test_filler_{i}(page, user_name, password):",
+                   "    page.fill_user_name(user_name)", "", ""]
+
+    source += ["def test_inline(page):",
+               f'    page.fill_user_name("{NEW_VALUE}")', "", "",
+               '@pytest.mark.parametrize("user_name, password", [']
+    source += [f'    ("user_{i}", "secret_sauce"),' for i in range(rows)]
+    source += ["])",
+               "def test_target(page, user_name, password):",
+               "    page.fill_user_name(user_name)"]
+    return "\n".join(source) + "\n"
+
+
+def import_module_from_file(path: Path):
+    spec = importlib.util.spec_from_file_location(f"generated_{path.parent.name}_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    # inspect finds module sources through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_record_mode_project(lines: int, fields: int) -> SimpleNamespace:
+    """
+    Writes and imports a generated test module, a page object in a pages/ directory
+    and a python.py runner calling tests, the file record mode stops its stack walk at.
+    """
+    root = Path(tempfile.mkdtemp(prefix="bench_record_mode_"))
+    (root / "pages").mkdir()
+    (root / "pages" / "generated_page.py").write_text(generate_page_object(fields), encoding="utf-8")
+    (root / "test_generated.py").write_text(generate_test_module(lines), encoding="utf-8")
+    (root / "python.py").write_text("def run_test(test, *args):\n    return test(*args)\n", encoding="utf-8")
+
+    test_path = root / "test_generated.py"
+    source_lines = test_path.read_text(encoding="utf-8").splitlines()
+
+    return SimpleNamespace(
+        test_path=test_path,
+        page_path=root / "pages" / "generated_page.py",
+        test_module=import_module_from_file(test_path),
+        page_class=import_module_from_file(root / "pages" / "generated_page.py").GeneratedPage,
+        runner=import_module_from_file(root / "python.py"),
+        inline_lineno=source_lines.index(f'    page.fill_user_name("{NEW_VALUE}")') + 1,
+        target_lineno=len(source_lines),
+        rows=max(lines // 10, 1),
+    )
+
+
+def stub_dialogs():
+    """Answers the record-mode value prompt with NEW_VALUE instead of opening a Tk dialog."""
+    record_mode_helper.simpledialog = SimpleNamespace(askstring=lambda *args, **kwargs: NEW_VALUE)
+
+
+@benchmark("record_mode.get_caller_info", params=TEST_MODULE_LINES)
+def get_caller_info_in_test_module(lines: int):
+    project = write_record_mode_project(lines, DEFAULT_PAGE_FIELDS)
+    return partial(project.test_module.call_nested, partial(get_caller_info, 2), STACK_DEPTH)
+
+
+@benchmark("record_mode.get_parameter_index_from_function_def", params=PAGE_OBJECT_FIELDS)
+def get_parameter_index_in_page_object(fields: int):
+    project = write_record_mode_project(TEST_MODULE_LINES[0], fields)
+    lineno = len(project.page_path.read_text(encoding="utf-8").splitlines())
+    return partial(get_parameter_index_from_function_def, str(project.page_path), lineno, 1)
+
+
+@benchmark("record_mode.get_parameter_name_by_index", params=TEST_MODULE_LINES)
+def get_parameter_name_in_test_module(lines: int):
+    project = write_record_mode_project(lines, DEFAULT_PAGE_FIELDS)
+    # Called from a frame of the test module, it is searched before imported modules
+    find_name = partial(get_parameter_name_by_index, "page.fill_user_name(user_name)", 0)
+    return partial(project.test_module.call_nested, find_name, 0)
+
+
+@benchmark("record_mode.update_value_in_source_file.inline", params=TEST_MODULE_LINES)
+def update_inline_value(lines: int):
+    project = write_record_mode_project(lines, DEFAULT_PAGE_FIELDS)
+    values = [NEW_VALUE, "locked_out_user"]
+
+    def update():
+        update_value_in_source_file("value", str(project.test_path), project.inline_lineno, 0, *values)
+        values.reverse()
+
+    return update
+
+
+@benchmark("record_mode.update_value_in_source_file.data_provider", params=TEST_MODULE_LINES)
+def update_data_provider_value(lines: int):
+    project = write_record_mode_project(lines, DEFAULT_PAGE_FIELDS)
+    set_current_param_row(project.rows - 1)
+    return partial(update_value_in_source_file, "value", str(project.test_path),
+                   project.target_lineno, 0, "None", NEW_VALUE)
+
+
+@benchmark("record_mode.fix_noname_parameter_value", params=TEST_MODULE_LINES)
+def fix_none_value_in_data_provider(lines: int):
+    # Test -> page object method -> page.fill(None) -> fix_noname_parameter_value -> update of the last row
+    project = write_record_mode_project(lines, DEFAULT_PAGE_FIELDS)
+    stub_dialogs()
+    set_current_param_row(project.rows - 1)
+    page = project.page_class(RecordModePage())
+    return partial(project.runner.run_test, project.test_module.test_target, page, None, "secret_sauce")
@@ -0,0 +1,140 @@
+import atexit
+import random
+import statistics
+import time
+from functools import partial
+from benchmarks.harness import SkipBenchmark, benchmark, summarize_times
+from helpers.demo_server import DemoServer, SYNTHETIC_PAGE_PATH
+from helpers.roundtrip_counter import count_roundtrips, install_roundtrip_counter
+from utils import web_utils
+from utils.synthetic_dom import get_synthetic_page_query
+
+# Synthetic page sizes and shares of cards with duplicated data-test/name values
+PAGE_SIZES = (1_000, 10_000, 50_000)
+DUPLICATION_LEVELS = (0.1, 0.5)
+COLLISIONS = 0.1
+SEED = 7
+TARGETS_PER_PAGE = 20
+# Selector strategies of utils.web_utils taking the target locator only
+STRATEGIES = (
+    "get_simple_css_selector",
+    "get_complex_css_selector",
+    "get_not_unique_complex_css_selector",
+    "get_css_selector_by_parent",
+    "get_css_selector_by_sibling",
+    "get_xpath_selector_by_text",
+    "get_xpath_selector_by_parent_text",
+    "get_complex_xpath_selector_by_index",
+    "get_unique_element_selector",
+)
+TARGETS_SELECTOR = "#synthetic-root *"
+IS_TARGET_SCRIPT = "(el, index) => el === document.querySelectorAll('#synthetic-root *')[index]"
+
+# Demo server, Playwright, headless browser and open synthetic pages, started on first use
+_browser_state = {}
+
+
+def get_synthetic_page(nodes: int, duplicates: float):
+    """Opens a synthetic page of the local demo server in the shared headless browser."""
+    if _browser_state.get("error"):
+        raise SkipBenchmark(_browser_state["error"])
+
+    if not _browser_state:
+        from playwright.sync_api import Error, sync_playwright
+
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=True)
+        except Error:
+            playwright.stop()
+            _browser_state["error"] = "headless Chromium is not installed (playwright install chromium)"
+            raise SkipBenchmark(_browser_state["error"])
+
+        server = DemoServer().start()
+        _browser_state.update(server=server, playwright=playwright, browser=browser, pages={})
+        atexit.register(close_browser)
+        install_roundtrip_counter()
+
+    pages = _browser_state["pages"]
+
+    if (nodes, duplicates) not in pages:
+        page = _browser_state["browser"].new_page()
+        query = get_synthetic_page_query(nodes, duplicates, COLLISIONS, SEED)
+        page.goto(_browser_state["server"].url(f"{SYNTHETIC_PAGE_PATH}?{query}"))
+        pages[(nodes, duplicates)] = page
+
+    return pages[(nodes, duplicates)]
+
+
+def close_browser():
+    if _browser_state:
+        _browser_state["browser"].close()
+        _browser_state["playwright"].stop()
+        _browser_state["server"].stop()
+        _browser_state.clear()
+
+
+def is_unique_match(page, selector: str | None, index: int) -> bool:
+    """True if the selector matches exactly the target element."""
+    if not selector:
+        return False
+
+    try:
+        matches = page.locator(selector)
+        return matches.count() == 1 and matches.evaluate(IS_TARGET_SCRIPT, index)
+    except Exception:
+        return False
+
+
+def make_selector_run(strategy: str, variant: str):
+    """Returns a run over randomly sampled targets: [(seconds, round trips, success)]."""
+    nodes, duplicates = variant.split("-")
+    page = get_synthetic_page(int(nodes), float(duplicates))
+    count = page.locator(TARGETS_SELECTOR).count()
+    indices = random.Random(SEED).sample(range(count), min(TARGETS_PER_PAGE, count))
+    get_selector = getattr(web_utils, strategy)
+
+    def run() -> list:
+        samples = []
+
+        for index in indices:
+            target = page.locator(TARGETS_SELECTOR).nth(index)
+
+            with count_roundtrips() as counts:
+                start = time.perf_counter()
+                try:
+                    selector = get_selector(target)
+                except Exception:
+                    selector = None
+                seconds = time.perf_counter() - start
+
+            samples.append((seconds, counts.total, is_unique_match(page, selector, index)))
+
+        return samples
+
+    return run
+
+
+def measure_targets(run, repeat: int) -> dict:
+    """
+    One timed pass over the sampled targets, browser calls are too slow to loop.
+    Times are per target, round trips and success rate are reported as metrics.
+    """
+    samples = run()
+
+    return {
+        "loops": len(samples),
+        "rounds": 1,
+        **summarize_times([seconds * 1_000_000 for seconds, _, _ in samples]),
+        "metrics": {
+            "targets": len(samples),
+            "success_rate": round(sum(success for _, _, success in samples) / len(samples), 3),
+            "roundtrips": statistics.median(roundtrips for _, roundtrips, _ in samples),
+        },
+    }
+
+
+for _strategy in STRATEGIES:
+    benchmark(f"selector.{_strategy}",
+              params=tuple(f"{nodes}-{duplicates}" for nodes in PAGE_SIZES for duplicates in DUPLICATION_LEVELS),
+              measure=measure_targets)(partial(make_selector_run, _strategy))
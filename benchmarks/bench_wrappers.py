@@ -0,0 +1,100 @@
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+from benchmarks.harness import benchmark
+from helpers.placeholder_manager import PlaceholderManager, get_simple_placeholder_from_name
+from tests.fakes.fake_playwright import FakePage
+from utils.code_utils import normalize_args
+from wrappers.smart_expect import SmartExpect
+from wrappers.smart_locator import SmartLocator
+from wrappers.smart_page import SmartPage
+
+CONFIG = {"record_mode": False, "highlight": False, "element_cache": False, "step_delay": 0}
+PAGE_OBJECT_FIELDS = 100
+LOGIN_HTML = '<input id="user-name"><input id="password">'
+
+
+class BenchPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.username_input = SmartLocator(self, "#user-name")
+
+    def add_password_input(self):
+        self.password_input = SmartLocator(self, "#password")
+
+
+def make_page_object() -> BenchPage:
+    return BenchPage(FakePage(LOGIN_HTML), CONFIG)
+
+
+def write_page_object_module(fields: int) -> type:
+    """Writes a page object module with 'fields' locators and imports its class.
+    SmartLocator reads field names from source lines, so the class needs a real file."""
+    lines = ["from wrappers.smart_locator import SmartLocator",
+             "from wrappers.smart_page import SmartPage", "", "",
+             "class GeneratedPage(SmartPage):", "",
+             "    def __init__(self, page, config):",
+             "        super().__init__(page, config)"]
+    lines += [f'        self.field_{i} = SmartLocator(self, "[data-test=\'field-{i}\']")'
+              for i in range(fields)]
+
+    path = Path(tempfile.mkdtemp(prefix="bench_")) / f"generated_page_{fields}.py"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    # inspect.getfile() finds classes through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.GeneratedPage
+
+
+@benchmark("smart_locator.construct")
+def construct_smart_locator():
+    # Includes _get_field_info, which walks the call stack for the field name
+    return make_page_object().add_password_input
+
+
+@benchmark("smart_locator.getattr_dispatch")
+def dispatch_smart_locator_attribute():
+    username_input = make_page_object().username_input
+    return lambda: username_input.click
+
+
+@benchmark("smart_locator.call")
+def call_smart_locator_method():
+    username_input = make_page_object().username_input
+    return lambda: username_input.fill("standard_user")
+
+
+@benchmark("code_utils.normalize_args")
+def normalize_locator_args():
+    fill = FakePage(LOGIN_HTML).locator("#user-name").fill
+    return lambda: normalize_args(fill, value="standard_user", timeout=1000)
+
+
+@benchmark("placeholder_manager.replace", params=(1, 10, 100, 1000))
+def replace_placeholders(count: int):
+    manager = PlaceholderManager(CONFIG)
+
+    for i in range(count):
+        manager.add_placeholder(f"name_{i}", f"value_{i}")
+
+    # A URL with the first, middle and last placeholders
+    text = "https://example.com/" + "/".join(
+        get_simple_placeholder_from_name(f"name_{i}") for i in {0, count // 2, count - 1})
+    return lambda: manager.replace_placeholders_with_values(text)
+
+
+@benchmark("smart_expect.construct")
+def construct_smart_expect():
+    username_input = make_page_object().username_input
+    return lambda: SmartExpect(username_input)
+
+
+@benchmark("page_object.construct", params=(PAGE_OBJECT_FIELDS,))
+def construct_page_object(fields: int):
+    page_class = write_page_object_module(fields)
+    page = FakePage()
+    return lambda: page_class(page, CONFIG)
@@ -0,0 +1,171 @@
+import fnmatch
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_RESULTS_PATH = Path(__file__).resolve().parent / "results" / "latest.json"
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_REPEAT = 5
+# Time ~ size^exponent above this is reported as super-linear, 1 is linear, 2 quadratic
+DEFAULT_MAX_EXPONENT = 1.3
+
+# Benchmark name -> (setup function, parameter, measure function)
+BENCHMARKS = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function when the benchmark cannot run here, e.g. no browser installed."""
+
+
+def benchmark(name: str, params: tuple = (None,), measure=None):
+    """
+    Registers a benchmark. The decorated setup function returns the callable to time,
+    it gets the parameter for every value of params, e.g. name[100] for params=(100,).
+    measure(func, repeat) -> result replaces time_callable for benchmarks timing
+    their own samples, e.g. browser calls too slow to loop.
+    """
+    def decorator(setup):
+        for param in params:
+            full_name = name if param is None else f"{name}[{param}]"
+            BENCHMARKS[full_name] = (setup, param, measure or time_callable)
+        return setup
+
+    return decorator
+
+
+def time_callable(func, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Times func like timeit: loops per round are calibrated to about 0.2s, times are per call."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    times = [total / loops * 1_000_000 for total in timer.repeat(repeat=repeat, number=loops)]
+
+    return {"loops": loops, "rounds": repeat, **summarize_times(times)}
+
+
+def summarize_times(times: list) -> dict:
+    """Min, median, mean and stdev of times in microseconds."""
+    return {
+        "min_us": min(times),
+        "median_us": statistics.median(times),
+        "mean_us": statistics.mean(times),
+        "stdev_us": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def run_benchmarks(pattern: str = "*", repeat: int = DEFAULT_REPEAT) -> dict:
+    """Runs registered benchmarks matching the fnmatch pattern, returns results by name."""
+    results = {}
+
+    for name, (setup, param, measure) in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+
+        try:
+            func = setup() if param is None else setup(param)
+        except SkipBenchmark as error:
+            print(f"{name:<60} skipped: {error}")
+            continue
+
+        start = time.perf_counter()
+        results[name] = measure(func, repeat)
+        # Benchmarks may report counters besides time, e.g. round trips
+        metrics = " ".join(f"{key}={value}" for key, value in results[name].get("metrics", {}).items())
+        print(f"{name:<60} {results[name]['median_us']:>14.2f} us "
+              f"({time.perf_counter() - start:.1f}s) {metrics}".rstrip())
+
+    return results
+
+
+def save_results(results: dict, path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {"python": sys.version.split()[0], "platform": platform.platform(),
+                    "processor": platform.processor()},
+        "benchmarks": results,
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+def load_results(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["benchmarks"]
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Compares median times of benchmarks found in both results.
+    Returns rows (name, baseline us, current us, relative change, regressed).
+    """
+    rows = []
+
+    for name in sorted(baseline.keys() & current.keys()):
+        before = baseline[name]["median_us"]
+        after = current[name]["median_us"]
+        change = (after - before) / before if before else 0.0
+        rows.append((name, before, after, change, change > threshold))
+
+    return rows
+
+
+def format_comparison(rows: list, threshold: float) -> str:
+    lines = [f"{'benchmark':<60} {'baseline us':>14} {'current us':>14} {'change':>9}"]
+
+    for name, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        lines.append(f"{name:<60} {before:>14.2f} {after:>14.2f} {change:>+9.1%}{flag}")
+
+    regressions = sum(1 for row in rows if row[4])
+    lines.append(f"{regressions} regression(s) above {threshold:.0%}")
+    return "\n".join(lines)
+
+
+def get_scaling(results: dict) -> list:
+    """
+    Fits median time ~ size^exponent (least squares on log-log) per benchmark family
+    with numeric parameters, e.g. name[1000], name[10000].
+    Returns rows (family, smallest size, largest size, exponent).
+    """
+    families = {}
+
+    for name, result in results.items():
+        match = re.fullmatch(r"(.+)\[(\d+)\]", name)
+        if match and result["median_us"] > 0:
+            families.setdefault(match.group(1), []).append((int(match.group(2)), result["median_us"]))
+
+    rows = []
+
+    for family, points in sorted(families.items()):
+        sizes = [math.log(size) for size, _ in points]
+        times = [math.log(median) for _, median in points]
+
+        if len(set(sizes)) < 2:
+            continue
+
+        mean_size = statistics.mean(sizes)
+        mean_time = statistics.mean(times)
+        exponent = (sum((x - mean_size) * (y - mean_time) for x, y in zip(sizes, times))
+                    / sum((x - mean_size) ** 2 for x in sizes))
+        rows.append((family, min(points)[0], max(points)[0], exponent))
+
+    return rows
+
+
+def format_scaling(rows: list, max_exponent: float) -> str:
+    lines = [f"{'benchmark':<60} {'sizes':>16} {'exponent':>9}"]
+
+    for family, smallest, largest, exponent in rows:
+        flag = "  SUPER-LINEAR" if exponent > max_exponent else ""
+        lines.append(f"{family:<60} {f'{smallest}..{largest}':>16} {exponent:>9.2f}{flag}")
+
+    super_linear = sum(1 for row in rows if row[3] > max_exponent)
+    lines.append(f"{super_linear} benchmark(s) scaling above size^{max_exponent}")
+    return "\n".join(lines)
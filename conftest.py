@@ -1,22 +1,48 @@
 import datetime
 import json
+from html import escape
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
 import pytest
-import time
 import re
 from enums.update_type import UpdateType
 from playwright.sync_api import sync_playwright
-from helpers.test_context import set_current_param_row, get_current_param_row
+from helpers.asset_cache import AssetCache, DEFAULT_ASSET_CACHE_DIR, DEFAULT_ASSET_CACHE_MAX_MB
+from helpers.auth_cache import AUTH_CACHE
+from helpers.concurrent_runner import CONCURRENT_MARKER, is_concurrent_item, run_test_loop
+from helpers.scenario_cache import SCENARIO_CACHE
+from helpers.context_pool import ContextPool, FRESH_CONTEXT_MARKER
+from helpers.demo_server import DemoServer
+from helpers.har_manager import HarManager, NETWORK_MODES, UNMATCHED_POLICIES
+from helpers.resource_blocker import BLOCK_MARKER, ResourceBlocker
+from helpers.roundtrip_counter import (MAX_ROUNDTRIPS_MARKER, ROUNDTRIPS_KEY, RoundtripCounts,
+                                       check_roundtrip_budget, count_roundtrips,
+                                       install_roundtrip_counter, is_roundtrip_counter_installed)
+from helpers.screenshot_pipeline import ScreenshotPipeline, SCREENSHOT_MODES
+from helpers.span_recorder import SpanRecorder, SPANS_DIR_NAME
+from helpers.test_context import bind_test_context, get_param_row, listen_to_steps
+from helpers.trace_recorder import TraceRecorder, TraceSession, TRACES_DIR_NAME
+from services.test_service import TestService
+from utils.smart_selector import register_smart_selector_engine
 
 # Global maps from wrappers
 from wrappers.smart_locator import FIXED_SELECTORS, FIXED_VALUES
 from wrappers.smart_page import (FIXED_KEYWORDS, FIXED_PAGE_PARAMETERS,
-                                 FIXED_PLACEHOLDER_NAMES, FIXED_PLACEHOLDER_VALUES)
+                                 FIXED_PLACEHOLDER_NAMES, FIXED_PLACEHOLDER_VALUES,
+                                 FORM_FIELD_KINDS)
 from wrappers.smart_expect import FIXED_EXPECTS
 
 
 REPORT_DIR = Path.cwd() / "reports"
 REPORT_FILE = REPORT_DIR / "report.html"
+ASSET_CACHE_KEY = pytest.StashKey[AssetCache]()
+RESOURCE_BLOCKER_KEY = pytest.StashKey[ResourceBlocker]()
+SCREENSHOT_PIPELINE_KEY = pytest.StashKey[ScreenshotPipeline]()
+SPAN_RECORDER_KEY = pytest.StashKey[SpanRecorder]()
+TRACE_SESSION_KEY = pytest.StashKey[TraceSession]()
+TEST_FAILED_KEY = pytest.StashKey[bool]()
+TRACE_LINKED_KEY = pytest.StashKey[bool]()
 
 
 # ---------------------------------------------------------------------------
@@ -27,22 +53,13 @@ with open("config.json", encoding="utf-8") as f:
 
 
 # ---------------------------------------------------------------------------
-# Record current parametrize row
+# Bind current test context (node id, parametrize row, keyword, healing scope)
 # ---------------------------------------------------------------------------
 @pytest.fixture(autouse=True)
-def record_param_row(request):
-    """Store current pytest parametrize row index in helpers.test_context."""
-    if hasattr(request.node, "callspec"):
-        indices = getattr(request.node.callspec, "indices", None)
-        if indices:
-            set_current_param_row(list(indices.values())[0])
-        else:
-            set_current_param_row(-1)
-    else:
-        set_current_param_row(-1)
-
-    yield
-    set_current_param_row(-1)
+def record_test_context(request):
+    """Store the current test node and parametrize row index in helpers.test_context."""
+    with bind_test_context(request.node.nodeid, get_param_row(request.node)):
+        yield
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +80,68 @@ def pytest_addoption(parser):
         help="Highlight elements during tests",
     )
 
+    parser.addoption(
+        "--element_cache",
+        action="store",
+        choices=["true", "false"],
+        help="Reuse resolved elements until the page DOM changes (one DOM check call per action)",
+    )
+
+    parser.addoption(
+        "--fast_form_fill",
+        action="store",
+        choices=["true", "false"],
+        help="Fill forms by setting values in the page DOM with one call",
+    )
+
+    parser.addoption(
+        "--context_pool",
+        action="store",
+        choices=["true", "false"],
+        help="Reuse pooled browser contexts reset between tests",
+    )
+
+    parser.addoption(
+        "--auth_cache",
+        action="store",
+        choices=["true", "false"],
+        help="Restore saved sessions instead of logging in through the UI in every test",
+    )
+
+    parser.addoption(
+        "--scenario_cache",
+        action="store",
+        choices=["true", "false"],
+        help="Restore browser state snapshots of scenario prefixes instead of replaying their steps",
+    )
+
+    parser.addoption(
+        "--network_mode",
+        action="store",
+        choices=list(NETWORK_MODES),
+        help="Use the live network, record HAR archives or replay tests from them",
+    )
+
+    parser.addoption(
+        "--har_unmatched",
+        action="store",
+        choices=list(UNMATCHED_POLICIES),
+        help="Handling of requests missing in the HAR archive in replay mode",
+    )
+
+    parser.addoption(
+        "--asset_cache",
+        action="store",
+        choices=["true", "false"],
+        help="Serve static assets of live sites from a disk cache shared by contexts and sessions",
+    )
+
+    parser.addoption(
+        "--block",
+        action="store",
+        help="Comma separated resource blocking profiles, e.g. images,fonts,analytics (or none)",
+    )
+
     parser.addoption(
         "--screenshot_on_error",
         action="store",
@@ -70,6 +149,48 @@ def pytest_addoption(parser):
         help="Capture screenshot on test failure",
     )
 
+    parser.addoption(
+        "--screenshot_mode",
+        action="store",
+        choices=list(SCREENSHOT_MODES),
+        help="Failure screenshot area: viewport, full_page or element (screenshot_selector)",
+    )
+
+    parser.addoption(
+        "--trace_on_failure",
+        action="store",
+        choices=["true", "false"],
+        help="Keep Playwright traces of failed and retried tests (last trace_steps steps: service steps and page navigations)",
+    )
+
+    parser.addoption(
+        "--spans",
+        action="store",
+        choices=["true", "false"],
+        help="Record timing spans of page, locator and expect calls as Chrome trace JSON",
+    )
+
+    parser.addoption(
+        "--roundtrips",
+        action="store",
+        choices=["true", "false"],
+        help="Count Playwright round trips per test (always on for tests marked max_roundtrips)",
+    )
+
+    parser.addoption(
+        "--concurrency",
+        action="store",
+        type=int,
+        help="Number of tests marked 'concurrent' running at once on one browser",
+    )
+
+    parser.addoption(
+        "--demo_server",
+        action="store",
+        choices=["true", "false"],
+        help="Run tests against the local replicas of the demo sites",
+    )
+
     parser.addoption(
         "--step_delay",
         action="store",
@@ -94,7 +215,18 @@ def pytest_addoption(parser):
 # Config fixture
 # ---------------------------------------------------------------------------
 @pytest.fixture(scope="session")
-def config(pytestconfig):
+def config(pytestconfig, request):
+    cfg = build_config(pytestconfig)
+
+    # Demo site URLs point at the local server
+    if cfg["demo_server"]:
+        cfg.update(request.getfixturevalue("demo_server").get_config_urls())
+
+    return cfg
+
+
+def build_config(pytestconfig) -> dict:
+    """Merges config.json with command line options."""
     cfg = CONFIG.copy()
 
     # Browser and headless
@@ -123,6 +255,68 @@ def config(pytestconfig):
     else:
         cfg["highlight"] = bool(cfg.get("highlight", False))
 
+    # Element cache
+    element_cache = pytestconfig.getoption("element_cache")
+    if element_cache is not None:
+        cfg["element_cache"] = element_cache.lower() == "true"
+    else:
+        cfg["element_cache"] = bool(cfg.get("element_cache", False))
+
+    # Fast form fill
+    fast_form_fill = pytestconfig.getoption("fast_form_fill")
+    if fast_form_fill is not None:
+        cfg["fast_form_fill"] = fast_form_fill.lower() == "true"
+    else:
+        cfg["fast_form_fill"] = bool(cfg.get("fast_form_fill", False))
+
+    # Browser context pool
+    context_pool = pytestconfig.getoption("context_pool")
+    if context_pool is not None:
+        cfg["context_pool"] = context_pool.lower() == "true"
+    else:
+        cfg["context_pool"] = bool(cfg.get("context_pool", False))
+
+    # Auth cache
+    auth_cache = pytestconfig.getoption("auth_cache")
+    if auth_cache is not None:
+        cfg["auth_cache"] = auth_cache.lower() == "true"
+    else:
+        cfg["auth_cache"] = bool(cfg.get("auth_cache", False))
+
+    # Scenario cache
+    scenario_cache = pytestconfig.getoption("scenario_cache")
+    if scenario_cache is not None:
+        cfg["scenario_cache"] = scenario_cache.lower() == "true"
+    else:
+        cfg["scenario_cache"] = bool(cfg.get("scenario_cache", False))
+
+    # Network record and replay
+    network_mode = pytestconfig.getoption("network_mode")
+    if network_mode is not None:
+        cfg["network_mode"] = network_mode
+    else:
+        cfg["network_mode"] = cfg.get("network_mode", "live")
+
+    har_unmatched = pytestconfig.getoption("har_unmatched")
+    if har_unmatched is not None:
+        cfg["har_unmatched"] = har_unmatched
+    else:
+        cfg["har_unmatched"] = cfg.get("har_unmatched", "fail")
+
+    # Static asset cache
+    asset_cache = pytestconfig.getoption("asset_cache")
+    if asset_cache is not None:
+        cfg["asset_cache"] = asset_cache.lower() == "true"
+    else:
+        cfg["asset_cache"] = bool(cfg.get("asset_cache", False))
+
+    # Resource blocking profiles
+    block = pytestconfig.getoption("block")
+    if block is not None:
+        cfg["block"] = block
+    else:
+        cfg["block"] = cfg.get("block", [])
+
     # Screenshot on error
     screenshot_on_error = pytestconfig.getoption("screenshot_on_error")
     if screenshot_on_error is not None:
@@ -130,6 +324,48 @@ def config(pytestconfig):
     else:
         cfg["screenshot_on_error"] = bool(cfg.get("screenshot_on_error", False))
 
+    # Failure screenshot mode
+    screenshot_mode = pytestconfig.getoption("screenshot_mode")
+    if screenshot_mode is not None:
+        cfg["screenshot_mode"] = screenshot_mode
+    else:
+        cfg["screenshot_mode"] = cfg.get("screenshot_mode", "viewport")
+
+    # Failure-only tracing
+    trace_on_failure = pytestconfig.getoption("trace_on_failure")
+    if trace_on_failure is not None:
+        cfg["trace_on_failure"] = trace_on_failure.lower() == "true"
+    else:
+        cfg["trace_on_failure"] = bool(cfg.get("trace_on_failure", False))
+
+    # Timing spans
+    spans = pytestconfig.getoption("spans")
+    if spans is not None:
+        cfg["spans"] = spans.lower() == "true"
+    else:
+        cfg["spans"] = bool(cfg.get("spans", False))
+
+    # Playwright round-trip counting
+    roundtrips = pytestconfig.getoption("roundtrips")
+    if roundtrips is not None:
+        cfg["roundtrips"] = roundtrips.lower() == "true"
+    else:
+        cfg["roundtrips"] = bool(cfg.get("roundtrips", False))
+
+    # Concurrent tests
+    concurrency = pytestconfig.getoption("concurrency")
+    if concurrency is not None:
+        cfg["concurrency"] = concurrency
+    else:
+        cfg["concurrency"] = int(cfg.get("concurrency", 1))
+
+    # Local demo server
+    demo_server = pytestconfig.getoption("demo_server")
+    if demo_server is not None:
+        cfg["demo_server"] = demo_server.lower() == "true"
+    else:
+        cfg["demo_server"] = bool(cfg.get("demo_server", False))
+
     # Step delay
     step_delay = pytestconfig.getoption("step_delay")
     if step_delay is not None:
@@ -175,6 +411,9 @@ def reset_smart_globals():
         if value[0] == UpdateType.DATA_PROVIDER:
             del FIXED_PLACEHOLDER_VALUES[key]
 
+    # Field kinds are detected again, another test may open a different page
+    FORM_FIELD_KINDS.clear()
+
     yield
 
 # ---------------------------------------------------------------------------
@@ -187,6 +426,17 @@ def reset_fixed_selectors_after_session():
     FIXED_VALUES.clear()
     FIXED_KEYWORDS.clear()
     FIXED_EXPECTS.clear()
+    FORM_FIELD_KINDS.clear()
+
+
+# ---------------------------------------------------------------------------
+# Local demo server
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def demo_server():
+    """Local replicas of the demo sites and synthetic pages on an ephemeral port."""
+    with DemoServer() as server:
+        yield server
 
 
 # ---------------------------------------------------------------------------
@@ -196,6 +446,7 @@ def reset_fixed_selectors_after_session():
 def playwright_instance():
     """Provide a shared Playwright instance."""
     with sync_playwright() as p:
+        register_smart_selector_engine(p)
         yield p
 
 
@@ -209,37 +460,347 @@ def browser(playwright_instance, config):
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def har_manager(config):
+    """Records or replays browser traffic of tests with HAR archives (see --network_mode)."""
+    return HarManager(config)
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, config, har_manager):
+    """Pool of browser contexts reset between tests (see --context_pool)."""
+    pool = ContextPool(browser, config, context_options=har_manager.get_context_options())
+    yield pool
+    pool.close()
+    print(f"[INFO] Browser context pool: {pool.stats}")
+
+
+@pytest.fixture(scope="session")
+def asset_cache(request, config):
+    """Disk cache of static assets for live-site runs (see --asset_cache), otherwise None."""
+    # Recorded and replayed traffic goes through the HAR archives only
+    if not config.get("asset_cache") or config.get("network_mode", "live") != "live":
+        yield None
+        return
+
+    cache = AssetCache(config.get("asset_cache_dir", DEFAULT_ASSET_CACHE_DIR),
+                       int(config.get("asset_cache_max_mb", DEFAULT_ASSET_CACHE_MAX_MB)) * 1024 * 1024)
+    request.config.stash[ASSET_CACHE_KEY] = cache
+    yield cache
+    cache.save()
+
+
+@pytest.fixture(scope="session")
+def resource_blocker(request, config, asset_cache):
+    """Blocks requests matching resource blocking profiles (see --block)."""
+    size_hint = (lambda url: asset_cache.index.get(url, {}).get("size")) if asset_cache else None
+    blocker = ResourceBlocker(config, size_hint=size_hint)
+    request.config.stash[RESOURCE_BLOCKER_KEY] = blocker
+    return blocker
+
+
+def start_context_routing(context, request, har_manager, asset_cache, resource_blocker):
+    """Starts HAR record or replay, the asset cache and resource blocking in a test browser context."""
+    if asset_cache:
+        asset_cache.attach(context)
+
+    har = har_manager.start(context, request.node.nodeid)
+
+    # Routes run in reverse registration order: blocked requests never reach the HAR or the caches
+    blocked = resource_blocker.attach(context, resource_blocker.get_test_profiles(request.node))
+    if blocked is not None:
+        request.node.user_properties.append(("blocked_requests", blocked))
+
+    return har
+
+
+@pytest.fixture(scope="session")
+def trace_recorder(config):
+    """Keeps Playwright traces of failed and retried tests (see --trace_on_failure), otherwise None."""
+    if not config["trace_on_failure"]:
+        yield None
+        return
+
+    recorder = TraceRecorder(REPORT_DIR / TRACES_DIR_NAME, config)
+    yield recorder
+    print(f"[INFO] Failure-only tracing: {recorder.stats}")
+
+
+@pytest.fixture(scope="session")
+def span_recorder(request):
+    """Records timing spans of wrapper calls (see --spans), otherwise None."""
+    # Built from options, tests may have own parameters named 'config'
+    if not build_config(request.config)["spans"]:
+        return None
+
+    recorder = SpanRecorder(REPORT_DIR / SPANS_DIR_NAME)
+    request.config.stash[SPAN_RECORDER_KEY] = recorder
+    return recorder
+
+
+@pytest.fixture(autouse=True)
+def record_spans(request, span_recorder):
+    """Export timing spans of the test as Chrome trace-event JSON."""
+    if span_recorder is None:
+        yield
+        return
+
+    with span_recorder.record() as spans:
+        yield
+
+    span_recorder.export(get_spans_file_name(request.node), spans, request.node.nodeid)
+
+
+def get_spans_file_name(item) -> str:
+    # Node ids keep tests of the same name in different modules apart
+    return safe_filename(item.nodeid)
+
+
+@contextmanager
+def record_trace(context, request, trace_recorder):
+    """Traces the test in the context, the trace is kept if the test failed or is a rerun."""
+    if trace_recorder is None:
+        yield
+        return
+
+    node = request.node
+    # Node ids keep tests of the same name apart, reruns get own trace files,
+    # the trace of a failed run stays linked from its report
+    name = safe_filename(node.nodeid) + (f"-run{node.execution_count}" if is_rerun(node) else "")
+    session = trace_recorder.start(context, name)
+    node.stash[TRACE_SESSION_KEY] = session
+
+    try:
+        with listen_to_steps(lambda title: trace_recorder.step(session, title)):
+            yield
+    finally:
+        keep = node.stash.get(TEST_FAILED_KEY, False) or is_rerun(node)
+        try:
+            trace_recorder.finish(session, keep)
+        except Exception as e:
+            print(f"[WARN] Trace stop failed: {e}")
+
+
+def is_rerun(node) -> bool:
+    # pytest-rerunfailures counts executions of retried tests
+    return getattr(node, "execution_count", 1) > 1
+
+
+def use_context_pool(request, config) -> bool:
+    # Recorded HARs are written when the context closes, so recording needs fresh contexts
+    return (config.get("context_pool") and config.get("network_mode") != "record"
+            and not request.node.get_closest_marker(FRESH_CONTEXT_MARKER))
+
+
 @pytest.fixture(scope="function")
-def context(browser, config):
-    """New browser context per test."""
-    context = browser.new_context()
+def context(request, browser, config, har_manager, asset_cache, resource_blocker, trace_recorder):
+    """New browser context per test, or a reset one from the context pool."""
+    if use_context_pool(request, config):
+        pool = request.getfixturevalue("context_pool")
+        entry = pool.acquire()
+        har = start_context_routing(entry.context, request, har_manager, asset_cache, resource_blocker)
+        with record_trace(entry.context, request, trace_recorder):
+            yield entry.context
+        pool.release(entry)
+        har_manager.finish(har)
+        return
+
+    context = browser.new_context(**har_manager.get_context_options())
     context.set_default_timeout(config.get("timeout", 30000))
-    yield context
+    har = start_context_routing(context, request, har_manager, asset_cache, resource_blocker)
+    with record_trace(context, request, trace_recorder):
+        yield context
     context.close()
+    har_manager.finish(har)
 
 
 @pytest.fixture(scope="function")
-def page(context, config):
-    """New page per test."""
+def page(request, context, config):
+    """New page per test, or the page of a pooled context."""
+    if use_context_pool(request, config):
+        pooled_page = request.getfixturevalue("context_pool").get_page(context)
+
+        if pooled_page is not None:
+            # The pool resets and keeps the page with its context
+            yield pooled_page
+            return
+
     page = context.new_page()
     page.set_default_timeout(config.get("timeout", 30000))
     yield page
     page.close()
 
 
+# ---------------------------------------------------------------------------
+# Authenticated sessions
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session", autouse=True)
+def auth_cache():
+    """Session-wide cache of authenticated storage states (see --auth_cache)."""
+    yield AUTH_CACHE
+    print(f"[INFO] Auth cache: {AUTH_CACHE.stats}")
+    AUTH_CACHE.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def scenario_cache():
+    """Session-wide cache of scenario prefix snapshots (see --scenario_cache)."""
+    yield SCENARIO_CACHE
+    print(f"[INFO] Scenario cache: {SCENARIO_CACHE.stats}")
+    SCENARIO_CACHE.clear()
+
+
+@pytest.fixture(scope="function")
+def login_user(page, config, auth_cache):
+    """Logs the test page in with the auth cache, e.g. login_user('standard_user', 'secret_sauce')."""
+    test_service = TestService()
+
+    def login(username, password) -> bool:
+        return test_service.login_with_auth_cache(page, config, username, password)
+
+    return login
+
+
 def pytest_configure(config):
-    """Make sure reports/ exists and direct pytest-html there."""
+    """Make sure reports/ exists, direct pytest-html there and drop stale HAR recordings."""
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
     config.option.htmlpath = str(REPORT_FILE)
     print(f"[INFO] HTML report → {REPORT_FILE}")
+    if not hasattr(config, "workerinput"):
+        HarManager(build_config(config)).clear_recordings()
+    config.addinivalue_line(
+        "markers",
+        f"{CONCURRENT_MARKER}: async test run concurrently with others on one browser "
+        "(see --concurrency)")
+    config.addinivalue_line(
+        "markers",
+        f"{BLOCK_MARKER}(*profiles): use only these resource blocking profiles in the test, "
+        "no profiles to block nothing (see --block)")
+    config.addinivalue_line(
+        "markers",
+        f"{FRESH_CONTEXT_MARKER}: always create a new browser context, even with --context_pool")
+    config.addinivalue_line(
+        "markers",
+        f"{MAX_ROUNDTRIPS_MARKER}(n): fail the test if it makes more than n Playwright round trips")
+    config.addinivalue_line(
+        "markers",
+        "fake_contract: unit test on the in-memory fake page whose evaluate hooks stand in for page scripts")
+
+
+# ---------------------------------------------------------------------------
+# Concurrent async tests
+# ---------------------------------------------------------------------------
+def get_concurrent_disabled_reason(config) -> str | None:
+    """Returns why concurrent async tests cannot run in this session, or None."""
+    if getattr(config.option, "numprocesses", None) or hasattr(config, "workerinput"):
+        return "concurrent tests are not supported with pytest-xdist"
+    if build_config(config).get("record_mode"):
+        return "concurrent tests do not support record mode"
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip concurrent async tests where the concurrent runner cannot run them."""
+    reason = get_concurrent_disabled_reason(config)
+
+    if reason:
+        for item in items:
+            if is_concurrent_item(item):
+                item.add_marker(pytest.mark.skip(reason=reason))
+
+    # Round trips are counted if enabled or if any test has a budget
+    if (build_config(config)["roundtrips"]
+            or any(item.get_closest_marker(MAX_ROUNDTRIPS_MARKER) for item in items)):
+        install_roundtrip_counter()
+        config.stash[ROUNDTRIPS_KEY] = RoundtripCounts()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Count Playwright round trips of the test and enforce @pytest.mark.max_roundtrips(n)."""
+    if not is_roundtrip_counter_installed():
+        yield
+        return
+
+    with count_roundtrips() as counts:
+        outcome = yield
+
+    item.stash[ROUNDTRIPS_KEY] = counts
+
+    if outcome.excinfo is None:
+        try:
+            check_roundtrip_budget(item, counts)
+        except pytest.fail.Exception as e:
+            outcome.force_exception(e)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """Run async tests marked 'concurrent' on one browser after the regular tests."""
+    if session.config.option.collectonly or get_concurrent_disabled_reason(session.config):
+        return None
+
+    return True if run_test_loop(session, build_config(session.config)) else None
+
+
+def get_session_summaries(config) -> dict:
+    """Returns summaries of the asset cache, resource blocking, timing spans and round trips of the session."""
+    summaries = {}
+    cache = config.stash.get(ASSET_CACHE_KEY, None)
+    blocker = config.stash.get(RESOURCE_BLOCKER_KEY, None)
+    recorder = config.stash.get(SPAN_RECORDER_KEY, None)
+    roundtrips = config.stash.get(ROUNDTRIPS_KEY, None)
+
+    if cache:
+        summaries["Asset cache"] = cache.get_summary()
+    if blocker and blocker.stats["blocked"]:
+        summaries["Resource blocking"] = blocker.get_summary()
+    if recorder:
+        summaries["Timing spans"] = recorder.get_summary()
+    if roundtrips and roundtrips.tests:
+        summaries["Round trips"] = f"{roundtrips.tests} tests, {roundtrips.get_summary(10)}"
+
+    return summaries
+
+
+def get_locator_table_html(recorder: SpanRecorder) -> str:
+    """HTML table of the slowest locators by total time of their calls."""
+    header = "".join(f"<th>{title}</th>" for title in (
+        "Locator", "Calls", "Total ms", "Playwright ms", "Overhead ms", "Max ms", "Retries"))
+    rows = "".join(
+        f"<tr><td>{escape(key)}</td><td>{calls}</td><td>{total:.1f}</td><td>{wait:.1f}</td>"
+        f"<td>{overhead:.1f}</td><td>{longest:.1f}</td><td>{retries}</td></tr>"
+        for key, calls, total, wait, overhead, longest, retries in recorder.get_locator_table())
+    return f'<table class="locator-spans"><tr>{header}</tr>{rows}</table>'
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report static asset cache and resource blocking efficiency and timing spans."""
+    for title, summary in get_session_summaries(terminalreporter.config).items():
+        terminalreporter.write_sep("-", title.lower())
+        terminalreporter.write_line(summary)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Add cache and blocking efficiency and the per-locator timing table to the HTML report."""
+    for title, session_summary in get_session_summaries(session.config).items():
+        prefix.append(f"<p>{title}: {session_summary}</p>")
+
+    recorder = session.config.stash.get(SPAN_RECORDER_KEY, None)
+    if recorder and recorder.locators:
+        prefix.append(get_locator_table_html(recorder))
 
 
 def pytest_sessionstart(session):
-    """Delete old report & screenshots before the session begins."""
+    """Delete old report, screenshots & traces before the session begins."""
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
     for f in REPORT_DIR.glob("*"):
         try:
-            f.unlink()
+            if f.is_dir():
+                shutil.rmtree(f)
+            else:
+                f.unlink()
         except Exception as e:
             print(f"[WARN] Could not remove {f}: {e}")
 
@@ -259,12 +820,88 @@ def safe_filename(name: str) -> str:
     return name[:150]  # limit length to avoid OS path length issues
 
 
+def get_screenshot_pipeline(config) -> ScreenshotPipeline:
+    """Returns the failure screenshot pipeline of the session, created on first failure."""
+    if SCREENSHOT_PIPELINE_KEY not in config.stash:
+        config.stash[SCREENSHOT_PIPELINE_KEY] = ScreenshotPipeline(REPORT_DIR, build_config(config))
+    return config.stash[SCREENSHOT_PIPELINE_KEY]
+
+
+def add_report_html(item, rep, content: str):
+    """Add an HTML extra to the test row of pytest-html report."""
+    html = item.config.pluginmanager.getplugin("html")
+
+    if html:
+        rep.extras = getattr(rep, "extras", [])
+        rep.extras.append(html.extras.html(content))
+
+
+def attach_trace_links(item, rep):
+    """Link the trace files kept for a failed test from pytest-html report."""
+    session = item.stash.get(TRACE_SESSION_KEY, None)
+
+    if session is None:
+        return
+
+    links = "<br>".join(
+        f'<a href="{path.relative_to(REPORT_DIR).as_posix()}" target="_blank">Trace {path.name}</a>'
+        for path in session.get_trace_files())
+    add_report_html(item, rep, f"{links}<br>Open with: playwright show-trace &lt;file&gt;")
+
+
+def attach_spans_link(item, rep):
+    """Link the Chrome trace JSON of the test timing spans from pytest-html report."""
+    path = f"{SPANS_DIR_NAME}/{get_spans_file_name(item)}.json"
+    add_report_html(item, rep, f'<a href="{path}" target="_blank">Timing spans</a> '
+                               "(open in chrome://tracing or ui.perfetto.dev)")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Finish writing failure screenshots and recorded HAR archives before reports are generated."""
+    pipeline = session.config.stash.get(SCREENSHOT_PIPELINE_KEY, None)
+
+    if pipeline:
+        pipeline.close()
+
+    # The controller stores the recordings of all pytest-xdist workers once
+    if not hasattr(session.config, "workerinput"):
+        HarManager(build_config(session.config)).store_recordings()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Reset the failure state of the test, pytest-rerunfailures runs the same item again."""
+    item.stash[TEST_FAILED_KEY] = False
+    item.stash[TRACE_LINKED_KEY] = False
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Capture a Playwright screenshot and attach it to the HTML report."""
+    """Capture a Playwright screenshot and link it and the kept trace from the HTML report."""
     outcome = yield
     rep = outcome.get_result()
 
+    # Round trips of the test call
+    counts = item.stash.get(ROUNDTRIPS_KEY, None)
+    if rep.when == "call" and counts is not None:
+        item.config.stash[ROUNDTRIPS_KEY].merge(counts)
+        rep.user_properties.append(("roundtrips", counts.total))
+        add_report_html(item, rep, f"<p>Playwright: {escape(counts.get_summary())}</p>")
+
+    # Timing spans are exported when the test finishes
+    if rep.when == "call" and SPAN_RECORDER_KEY in item.config.stash:
+        attach_spans_link(item, rep)
+
+    # The context fixture keeps traces of failed tests and of reruns, linked once per run
+    if rep.failed:
+        item.stash[TEST_FAILED_KEY] = True
+
+    if ((rep.failed or (rep.when == "call" and is_rerun(item)))
+            and not item.stash.get(TRACE_LINKED_KEY, False)):
+        item.stash[TRACE_LINKED_KEY] = True
+        attach_trace_links(item, rep)
+
     # Run only when the test itself failed
     if rep.when != "call" or not rep.failed:
         return
@@ -284,29 +921,14 @@ def pytest_runtest_makereport(item, call):
         if not page or not isinstance(page, Page):
             return
 
-        from datetime import datetime
-
-        # Build unique name: {test-name}-yyyy-MM-dd-hh-mm-ss-sss.png
-        ts = datetime.now().strftime("%Y-%m-%d-%H-%M-%S-%f")[:-3]
-        safe_test_name = safe_filename(item.name)
-        screenshot_name = f"{safe_test_name}-{ts}.png"
-        screenshot_path = REPORT_DIR / screenshot_name
-
-        # Give browser time to render any failure overlay
-        time.sleep(0.2)
-
-        # Take screenshot
-        page.screenshot(path=str(screenshot_path), full_page=True)
-        print(f"[INFO] Screenshot saved → {screenshot_path}")
-
-        # Attach to pytest-html report
-        html = item.config.pluginmanager.getplugin("html")
-        if html:
-            rel_path = screenshot_path.name
-            link_html = f'<a href="{rel_path}" target="_blank">Open Screenshot</a>'
-            rep.extra = getattr(rep, "extra", [])
-            rep.extra.append(html.extras.html(link_html))
-            rep.extra.append(html.extras.image(rel_path))
+        # Capture now, the file is written in the background
+        pipeline = get_screenshot_pipeline(item.config)
+        screenshot_name = pipeline.capture(page, safe_filename(item.name))
+        print(f"[INFO] Screenshot saved → {REPORT_DIR / screenshot_name}")
+
+        # Link the file from pytest-html report instead of embedding it
+        add_report_html(item, rep, f'<a href="{screenshot_name}" target="_blank">Open Screenshot</a><br>'
+                                   f'<img src="{screenshot_name}" loading="lazy" style="max-width: 320px">')
 
     except Exception as e:
         print(f"[WARN] Screenshot capture failed: {e}")
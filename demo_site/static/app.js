@@ -0,0 +1,240 @@
+// Local replica of the Sauce Demo application (https://www.saucedemo.com/)
+// with the same markup, classes, ids and data-test attributes as the original.
+(function () {
+    const PASSWORD = "secret_sauce";
+    const USERS = ["standard_user", "locked_out_user", "problem_user",
+                   "performance_glitch_user", "error_user", "visual_user"];
+    const SESSION_COOKIE = "session-username";
+    const CART_KEY = "cart-contents";
+
+    const PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: "29.99",
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: "9.99",
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: "15.99",
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: "49.99",
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: "7.99",
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: "15.99",
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."},
+    ];
+
+    function slug(name) {
+        return name.toLowerCase().replace(/\s+/g, "-");
+    }
+
+    function getUser() {
+        const match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+        renderCartBadge();
+    }
+
+    function headerHtml(title) {
+        return `
+<div class="header_container" data-test="header-container" id="header_container">
+  <div class="primary_header" data-test="primary-header">
+    <div id="menu_button_container"><div class="bm-burger-button"><button type="button" id="react-burger-menu-btn">Open Menu</button></div></div>
+    <div class="header_label"><div class="app_logo">Swag Labs</div></div>
+    <div id="shopping_cart_container" class="shopping_cart_container"><a class="shopping_cart_link" data-test="shopping-cart-link" href="cart.html"></a></div>
+  </div>
+  <div class="header_secondary_container" data-test="secondary-header">
+    <span class="title" data-test="title">${title}</span>
+  </div>
+</div>`;
+    }
+
+    function renderCartBadge() {
+        const link = document.querySelector(".shopping_cart_link");
+        if (!link) return;
+        const count = getCart().length;
+        link.innerHTML = count
+            ? `<span class="shopping_cart_badge" data-test="shopping-cart-badge">${count}</span>`
+            : "";
+    }
+
+    function itemButtonHtml(product, inCart) {
+        const action = inCart ? "remove" : "add-to-cart";
+        const kind = inCart ? "btn_secondary" : "btn_primary";
+        const id = `${action}-${slug(product.name)}`;
+        return `<button class="btn ${kind} btn_small btn_inventory " data-test="${id}" id="${id}" name="${id}">${inCart ? "Remove" : "Add to cart"}</button>`;
+    }
+
+    function inventoryItemHtml(product, cart) {
+        return `
+<div class="inventory_item" data-test="inventory-item">
+  <div class="inventory_item_img">
+    <a href="#" id="item_${product.id}_img_link" data-test="item-${product.id}-img-link">
+      <img alt="${product.name}" class="inventory_item_img" src="static/product.svg" data-test="inventory-item-${slug(product.name)}-img">
+    </a>
+  </div>
+  <div class="inventory_item_description" data-test="inventory-item-description">
+    <div class="inventory_item_label">
+      <a href="#" id="item_${product.id}_title_link" data-test="item-${product.id}-title-link"><div class="inventory_item_name " data-test="inventory-item-name">${product.name}</div></a>
+      <div class="inventory_item_desc" data-test="inventory-item-desc">${product.desc}</div>
+    </div>
+    <div class="pricebar">
+      <div class="inventory_item_price" data-test="inventory-item-price">$${product.price}</div>
+      ${itemButtonHtml(product, cart.includes(product.id))}
+    </div>
+  </div>
+</div>`;
+    }
+
+    function cartItemHtml(product) {
+        const id = `remove-${slug(product.name)}`;
+        return `
+<div class="cart_item" data-test="inventory-item">
+  <div class="cart_quantity" data-test="item-quantity">1</div>
+  <div class="cart_item_label">
+    <a href="#" id="item_${product.id}_title_link" data-test="item-${product.id}-title-link"><div class="inventory_item_name" data-test="inventory-item-name">${product.name}</div></a>
+    <div class="inventory_item_desc" data-test="inventory-item-desc">${product.desc}</div>
+    <div class="item_pricebar" data-test="item-pricebar">
+      <div class="inventory_item_price" data-test="inventory-item-price">$${product.price}</div>
+      <button class="btn btn_secondary btn_small cart_button" data-test="${id}" id="${id}" name="${id}">Remove</button>
+    </div>
+  </div>
+</div>`;
+    }
+
+    function requireLogin(path) {
+        if (getUser()) return true;
+        window.sessionStorage.setItem("login-error",
+            `Epic sadface: You can only access '/${path}' when you are logged in.`);
+        window.location.replace("./");
+        return false;
+    }
+
+    function renderLogin(root) {
+        root.innerHTML = `
+<div class="login_container">
+  <div class="login_logo">Swag Labs</div>
+  <div class="login_wrapper"><div class="login_wrapper-inner"><div id="login_button_container" class="form_column"><div class="login-box">
+    <form>
+      <div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>
+      <div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>
+      <div class="error-message-container"></div>
+      <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+    </form>
+  </div></div></div></div>
+</div>`;
+
+        const errorContainer = root.querySelector(".error-message-container");
+        const showError = (message) => {
+            errorContainer.classList.add("error");
+            errorContainer.innerHTML = `<h3 data-test="error">${message}</h3>`;
+        };
+
+        const pendingError = window.sessionStorage.getItem("login-error");
+        if (pendingError) {
+            window.sessionStorage.removeItem("login-error");
+            showError(pendingError);
+        }
+
+        root.querySelector("form").addEventListener("submit", (event) => {
+            event.preventDefault();
+            const username = root.querySelector("#user-name").value;
+            const password = root.querySelector("#password").value;
+
+            if (!username) return showError("Epic sadface: Username is required");
+            if (!password) return showError("Epic sadface: Password is required");
+            if (!USERS.includes(username) || password !== PASSWORD) {
+                return showError("Epic sadface: Username and password do not match any user in this service");
+            }
+            if (username === "locked_out_user") {
+                return showError("Epic sadface: Sorry, this user has been locked out.");
+            }
+
+            const expires = new Date(Date.now() + 10 * 60 * 1000).toUTCString();
+            document.cookie = `${SESSION_COOKIE}=${encodeURIComponent(username)}; expires=${expires}; path=/`;
+            window.location.href = "inventory.html";
+        });
+    }
+
+    function renderInventory(root) {
+        if (!requireLogin("inventory.html")) return;
+        const cart = getCart();
+
+        root.innerHTML = `
+<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">
+  ${headerHtml("Products")}
+  <div id="inventory_container" class="inventory_container"><div><div id="inventory_container" class="inventory_container" data-test="inventory-container">
+    <div class="inventory_list" data-test="inventory-list">${PRODUCTS.map(p => inventoryItemHtml(p, cart)).join("")}</div>
+  </div></div></div>
+</div></div>`;
+
+        renderCartBadge();
+
+        root.querySelector(".inventory_list").addEventListener("click", (event) => {
+            const button = event.target.closest("button.btn_inventory");
+            if (!button) return;
+
+            const name = button.closest(".inventory_item").querySelector(".inventory_item_name").textContent;
+            const product = PRODUCTS.find(p => p.name === name);
+            const ids = getCart();
+            const inCart = ids.includes(product.id);
+
+            setCart(inCart ? ids.filter(id => id !== product.id) : ids.concat([product.id]));
+            button.outerHTML = itemButtonHtml(product, !inCart);
+        });
+    }
+
+    function renderCart(root) {
+        if (!requireLogin("cart.html")) return;
+        const items = getCart().map(id => PRODUCTS.find(p => p.id === id)).filter(Boolean);
+
+        root.innerHTML = `
+<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">
+  ${headerHtml("Your Cart")}
+  <div id="cart_contents_container" class="cart_contents_container"><div>
+    <div class="cart_list" data-test="cart-list">
+      <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>
+      <div class="cart_desc_label" data-test="cart-desc-label">Description</div>
+      ${items.map(cartItemHtml).join("")}
+    </div>
+    <div class="cart_footer">
+      <button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" name="continue-shopping">Continue Shopping</button>
+      <button class="btn btn_action btn_medium checkout_button " data-test="checkout" id="checkout" name="checkout">Checkout</button>
+    </div>
+  </div></div>
+</div></div>`;
+
+        renderCartBadge();
+
+        root.querySelector(".cart_list").addEventListener("click", (event) => {
+            const button = event.target.closest("button.cart_button");
+            if (!button) return;
+
+            const item = button.closest(".cart_item");
+            const name = item.querySelector(".inventory_item_name").textContent;
+            const product = PRODUCTS.find(p => p.name === name);
+            setCart(getCart().filter(id => id !== product.id));
+            item.remove();
+        });
+
+        root.querySelector("#continue-shopping").addEventListener("click", () => {
+            window.location.href = "inventory.html";
+        });
+    }
+
+    const pages = {login: renderLogin, inventory: renderInventory, cart: renderCart};
+    pages[document.body.dataset.page](document.getElementById("root"));
+})();
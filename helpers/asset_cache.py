@@ -0,0 +1,214 @@
+import email.utils
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+CACHED_RESOURCE_TYPES = ("script", "stylesheet", "font", "image")
+DEFAULT_ASSET_CACHE_DIR = ".asset_cache"
+DEFAULT_ASSET_CACHE_MAX_MB = 200
+# Headers that describe the transfer, the cached body is stored decoded
+SKIPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection",
+                   "set-cookie", "date", "age")
+
+
+class AssetCache:
+    """
+    AssetCache serves static assets (scripts, styles, fonts, images) of live sites
+    from a content-addressed disk cache through context.route:
+    - Bodies are stored once per content hash, the index keeps URL, headers,
+      validators (ETag, Last-Modified) and freshness.
+    - Fresh entries are served locally, stale entries are revalidated with
+      conditional requests, no-store and private responses are not stored.
+    - The least recently used entries are evicted above max_bytes.
+    - The index is saved with save(), so later sessions reuse the cache.
+    """
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_ASSET_CACHE_DIR,
+                 max_bytes: int = DEFAULT_ASSET_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0,
+                      "evicted": 0, "bytes_saved": 0}
+        self.index = self._load_index()
+
+    def attach(self, context):
+        """Routes static asset requests of the browser context through the cache."""
+        context.route("**/*", self.handle)
+
+    def handle(self, route):
+        request = route.request
+
+        if request.method != "GET" or request.resource_type not in CACHED_RESOURCE_TYPES:
+            return route.fallback()
+
+        try:
+            self._handle_asset(route, request.url)
+        except Exception as e:
+            print(f"[WARN] Asset cache failed for {request.url}: {e}")
+            route.fallback()
+
+    def get_hit_ratio(self) -> float:
+        requests = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / requests if requests else 0.0
+
+    def get_summary(self) -> str:
+        return (f"hits: {self.stats['hits']} (revalidated: {self.stats['revalidated']}), "
+                f"misses: {self.stats['misses']}, hit ratio: {self.get_hit_ratio():.0%}, "
+                f"bytes saved: {self.stats['bytes_saved']}, evicted: {self.stats['evicted']}")
+
+    def save(self):
+        """Writes the cache index to disk."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+
+        os.replace(temp_path, self.index_path)
+
+    def _handle_asset(self, route, url: str):
+        entry = self.index.get(url)
+        now = time.time()
+
+        if entry and entry["expires_at"] > now and self._object_path(entry).exists():
+            return self._fulfill_from_cache(route, entry, now)
+
+        headers = dict(route.request.headers)
+
+        if entry and self._object_path(entry).exists():
+            if entry.get("etag"):
+                headers["if-none-match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["if-modified-since"] = entry["last_modified"]
+
+        response = route.fetch(headers=headers)
+
+        if response.status == 304 and entry:
+            self.stats["revalidated"] += 1
+            entry["expires_at"] = now + get_freshness_lifetime(response.headers)
+            return self._fulfill_from_cache(route, entry, now)
+
+        self.stats["misses"] += 1
+        body = response.body()
+
+        if is_cacheable(response.status, response.headers):
+            self._store(url, response.status, response.headers, body, now)
+
+        route.fulfill(response=response)
+
+    def _fulfill_from_cache(self, route, entry: dict, now: float):
+        body = self._object_path(entry).read_bytes()
+        entry["last_used"] = now
+        self.stats["hits"] += 1
+        self.stats["bytes_saved"] += len(body)
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    def _store(self, url: str, status: int, headers: dict, body: bytes, now: float):
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "hash": digest,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in SKIPPED_HEADERS},
+            "size": len(body),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "expires_at": now + get_freshness_lifetime(headers),
+            "last_used": now,
+        }
+
+        object_path = self._object_path(entry)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            object_path.write_bytes(body)
+
+        self.index[url] = entry
+        self.stats["stored"] += 1
+        self._evict()
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in {e["hash"]: e for e in self.index.values()}.values())
+
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+
+            del self.index[url]
+            self.stats["evicted"] += 1
+
+            # Objects are shared by URLs with the same content
+            if not any(e["hash"] == entry["hash"] for e in self.index.values()):
+                self._object_path(entry).unlink(missing_ok=True)
+                total -= entry["size"]
+
+    def _object_path(self, entry: dict) -> Path:
+        return self.objects_dir / entry["hash"][:2] / entry["hash"]
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def parse_cache_control(headers: dict) -> dict:
+    """Returns Cache-Control directives, e.g. {"max-age": "600", "public": None}."""
+    directives = {}
+
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    return directives
+
+
+def get_freshness_lifetime(headers: dict) -> float:
+    """Returns seconds a response stays fresh: max-age, Expires or the Last-Modified heuristic."""
+    directives = parse_cache_control(headers)
+
+    if "no-cache" in directives:
+        return 0.0
+
+    max_age = directives.get("max-age")
+    if max_age and re.fullmatch(r"\d+", max_age):
+        return float(max_age)
+
+    date = _parse_http_date(headers.get("date")) or time.time()
+    expires = _parse_http_date(headers.get("expires"))
+    if expires:
+        return max(expires - date, 0.0)
+
+    # Heuristic freshness: 10% of the time since the last modification
+    last_modified = _parse_http_date(headers.get("last-modified"))
+    if last_modified:
+        return max((date - last_modified) / 10, 0.0)
+
+    return 0.0
+
+
+def is_cacheable(status: int, headers: dict) -> bool:
+    """Returns True for complete responses the cache may store and revalidate later."""
+    directives = parse_cache_control(headers)
+
+    if status != 200 or "no-store" in directives or "private" in directives:
+        return False
+    if headers.get("vary", "").strip().lower() not in ("", "accept-encoding"):
+        return False
+
+    return (get_freshness_lifetime(headers) > 0
+            or bool(headers.get("etag") or headers.get("last-modified")))
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
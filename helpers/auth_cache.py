@@ -0,0 +1,39 @@
+from helpers.snapshot_cache import SnapshotCache, restore_storage_state
+
+DEFAULT_AUTH_CACHE_TTL = 600
+
+
+class AuthCache(SnapshotCache):
+    """
+    AuthCache keeps the authenticated storage state (cookies and local storage)
+    of UI logins per (base_url, username) key for the test session:
+    - The first login of a user runs the UI login flow and saves the storage state.
+    - Later logins restore the saved state into the test browser context and
+      open the landing page without the login form.
+    - Entries expire after a TTL, when a saved cookie expires, or when the
+      validation probe fails after a restore; the UI login runs again then.
+    """
+
+    CREATED_STAT = "logins"
+    FAILED_RESTORE_STAT = "invalid"
+
+    def restore_or_login(self, page, base_url: str, username: str, login_flow, probe,
+                         landing_url: str = None, ttl: float = DEFAULT_AUTH_CACHE_TTL) -> bool:
+        """
+        Logs the page in, restoring a saved session when possible.
+        login_flow() performs the UI login, probe(page) returns True for a logged in page.
+        Returns True if the session was restored from the cache.
+        """
+        def restore(snapshot: dict) -> bool:
+            restore_storage_state(page, snapshot["state"], landing_url or base_url)
+            return probe(page)
+
+        def take() -> dict | None:
+            # Failed logins are not cached
+            return {"state": page.context.storage_state()} if probe(page) else None
+
+        return self.restore_or_create((base_url, username), page, login_flow, take, restore, ttl)
+
+
+# Session-wide cache used by TestService and the auth_cache fixture
+AUTH_CACHE = AuthCache()
@@ -0,0 +1,291 @@
+import asyncio
+import inspect
+import os
+import platform
+import sys
+import time
+import pytest
+from playwright.async_api import async_playwright
+from helpers.roundtrip_counter import (ROUNDTRIPS_KEY, check_roundtrip_budget, count_roundtrips,
+                                       is_roundtrip_counter_installed)
+from helpers.test_context import bind_test_context, get_param_row
+from utils.smart_selector import register_smart_selector_engine_async
+
+CONCURRENT_MARKER = "concurrent"
+# Fixtures the concurrent runner provides to async tests, other fixtures (autouse ones too) do not run
+CONCURRENT_FIXTURES = ("browser", "context", "page", "config")
+# Reason of a non-strict xfail test that passed, set on its call report
+XPASS_KEY = pytest.StashKey[str]()
+
+
+def is_concurrent_item(item) -> bool:
+    """Returns True for async test functions marked with @pytest.mark.concurrent."""
+    return (isinstance(item, pytest.Function)
+            and item.get_closest_marker(CONCURRENT_MARKER) is not None
+            and inspect.iscoroutinefunction(item.obj))
+
+
+def run_test_loop(session, config: dict) -> bool:
+    """
+    Runs regular tests through the pytest protocol first, then runs async tests
+    marked 'concurrent' on one shared browser, up to config["concurrency"] at once.
+    Returns False if there are no concurrent tests and pytest should run its own loop.
+    """
+    concurrent_items = [item for item in session.items if is_concurrent_item(item)]
+
+    if not concurrent_items:
+        return False
+
+    if session.testsfailed and not session.config.option.continue_on_collection_errors:
+        raise session.Interrupted(f"{session.testsfailed} error(s) during collection")
+
+    concurrent_ids = {id(item) for item in concurrent_items}
+    regular_items = [item for item in session.items if id(item) not in concurrent_ids]
+
+    # Regular tests run first, their session fixtures (sync Playwright) are torn down
+    # with the last one before the asyncio loop starts
+    for index, item in enumerate(regular_items):
+        next_item = regular_items[index + 1] if index + 1 < len(regular_items) else None
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=next_item)
+        _check_session_state(session)
+
+    concurrency = max(int(config.get("concurrency", 1)), 1)
+    asyncio.run(_run_items(session, concurrent_items, config, concurrency))
+    _check_session_state(session)
+
+    return True
+
+
+async def _run_items(session, items: list, config: dict, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with async_playwright() as playwright:
+        await register_smart_selector_engine_async(playwright)
+        browser_type = getattr(playwright, config.get("browser", "chromium"))
+
+        try:
+            browser = await browser_type.launch(headless=config.get("headless", True))
+        except Exception as e:
+            # Every test gets a setup error, like with a failing browser fixture
+            for item in items:
+                _log_item(item, [await _call(lambda: _raise_async(e), "setup")])
+            return
+
+        tasks = [asyncio.create_task(_run_item(item, browser, config, semaphore))
+                 for item in items]
+
+        try:
+            # Reports are logged from the main task in completion order
+            for next_done in asyncio.as_completed(tasks):
+                item, calls = await next_done
+                _log_item(item, calls)
+
+                if session.shouldfail or session.shouldstop:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await browser.close()
+
+
+async def _run_item(item, browser, config: dict, semaphore) -> tuple:
+    resources = {"browser": browser, "config": config}
+    timeout = config.get("timeout", 30000)
+
+    async def setup():
+        skip_reason = get_skip_reason(item)
+
+        if skip_reason is not None:
+            pytest.skip(skip_reason)
+
+        unsupported = get_unsupported_fixtures(item)
+
+        if unsupported:
+            pytest.skip(f"Concurrent tests get only {', '.join(CONCURRENT_FIXTURES)} and parameters, "
+                        f"not fixtures: {', '.join(unsupported)}")
+
+        xfail = resources["xfail"] = get_xfail(item)
+
+        if xfail and not xfail["run"]:
+            pytest.xfail("[NOTRUN] " + xfail["reason"])
+
+        context = resources["context"] = await browser.new_context()
+        context.set_default_timeout(timeout)
+        page = resources["page"] = await context.new_page()
+        page.set_default_timeout(timeout)
+        resources["funcargs"] = _get_funcargs(item, resources)
+
+    async def run():
+        if not is_roundtrip_counter_installed():
+            return await item.obj(**resources["funcargs"])
+
+        with count_roundtrips() as counts:
+            await item.obj(**resources["funcargs"])
+
+        item.stash[ROUNDTRIPS_KEY] = counts
+        check_roundtrip_budget(item, counts)
+
+    async def call():
+        xfail = resources["xfail"]
+
+        if xfail is None:
+            return await run()
+
+        try:
+            await run()
+        except xfail["raises"]:
+            pytest.xfail(xfail["reason"])
+
+        if xfail["strict"]:
+            pytest.fail("[XPASS(strict)] " + xfail["reason"], pytrace=False)
+
+        item.stash[XPASS_KEY] = xfail["reason"]
+
+    async def teardown():
+        if "context" in resources:
+            await resources.pop("context").close()
+
+    # Every task runs in its own context copy, so concurrent tests do not share it
+    with bind_test_context(item.nodeid, get_param_row(item)):
+        async with semaphore:
+            try:
+                calls = [await _call(setup, "setup")]
+
+                if calls[0].excinfo is None:
+                    calls.append(await _call(call, "call"))
+            finally:
+                teardown_call = await _call(teardown, "teardown")
+
+    return item, calls + [teardown_call]
+
+
+async def _call(func, when: str):
+    """Awaits func and wraps the outcome into a pytest CallInfo with real timings."""
+    error = None
+    start = time.time()
+    started = time.perf_counter()
+
+    try:
+        await func()
+    except asyncio.CancelledError:
+        raise
+    except BaseException as e:
+        error = e
+
+    duration = time.perf_counter() - started
+    call = pytest.CallInfo.from_call(lambda: _raise(error), when)
+    call.start, call.stop, call.duration = start, start + duration, duration
+    return call
+
+
+def _raise(error):
+    if error is not None:
+        raise error
+
+
+async def _raise_async(error):
+    raise error
+
+
+def get_unsupported_fixtures(item) -> list:
+    """Returns fixtures requested by a concurrent test that the concurrent runner does not provide."""
+    callspec = getattr(item, "callspec", None)
+    params = callspec.params if callspec else {}
+    requested = list(inspect.signature(item.obj).parameters)
+    requested += [name for marker in item.iter_markers("usefixtures") for name in marker.args]
+
+    return [name for name in requested if name not in params and name not in CONCURRENT_FIXTURES]
+
+
+def get_skip_reason(item) -> str | None:
+    """Returns the reason of the first triggered skip or skipif marker of the test, or None."""
+    for marker in item.iter_markers("skip"):
+        return marker.kwargs.get("reason", marker.args[0] if marker.args else "unconditional skip")
+
+    for marker in item.iter_markers("skipif"):
+        reason = _get_triggered_reason(item, marker)
+
+        if reason is not None:
+            return reason
+
+    return None
+
+
+def get_xfail(item) -> dict | None:
+    """Returns reason, run, strict and raises of the first triggered xfail marker of the test, or None."""
+    if item.config.option.runxfail:
+        return None
+
+    for marker in item.iter_markers("xfail"):
+        reason = _get_triggered_reason(item, marker)
+
+        if reason is not None:
+            strict = marker.kwargs.get("strict")
+            return {"reason": reason,
+                    "run": marker.kwargs.get("run", True),
+                    "strict": bool(item.config.getini("xfail_strict")) if strict is None else strict,
+                    "raises": marker.kwargs.get("raises") or Exception}
+
+    return None
+
+
+def _get_triggered_reason(item, marker) -> str | None:
+    # Conditions are the marker args or its condition keyword, none means unconditional
+    conditions = (marker.kwargs["condition"],) if "condition" in marker.kwargs else marker.args
+
+    if not conditions:
+        return marker.kwargs.get("reason", "")
+
+    for condition in conditions:
+        if isinstance(condition, str):
+            namespace = {"os": os, "sys": sys, "platform": platform, "config": item.config,
+                         **item.obj.__globals__}
+            triggered = eval(condition, namespace)
+        else:
+            triggered = condition
+
+        if triggered:
+            return marker.kwargs.get("reason", f"condition: {condition}")
+
+    return None
+
+
+def _get_funcargs(item, resources: dict) -> dict:
+    callspec = getattr(item, "callspec", None)
+    params = callspec.params if callspec else {}
+    funcargs = {}
+
+    for name in inspect.signature(item.obj).parameters:
+        if name in params:
+            funcargs[name] = params[name]
+        elif name in resources:
+            funcargs[name] = resources[name]
+        else:
+            raise LookupError(
+                f"Fixture '{name}' is not available for concurrent tests, "
+                f"use parameters or one of: {', '.join(CONCURRENT_FIXTURES)}")
+
+    return funcargs
+
+
+def _log_item(item, calls: list):
+    ihook = item.ihook
+    ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+
+    for call in calls:
+        report = ihook.pytest_runtest_makereport(item=item, call=call)
+
+        if call.when == "call" and report.passed and XPASS_KEY in item.stash:
+            report.wasxfail = item.stash[XPASS_KEY]
+
+        ihook.pytest_runtest_logreport(report=report)
+
+    ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+
+def _check_session_state(session):
+    if session.shouldfail:
+        raise session.Failed(session.shouldfail)
+    if session.shouldstop:
+        raise session.Interrupted(session.shouldstop)
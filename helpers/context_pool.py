@@ -0,0 +1,149 @@
+FRESH_CONTEXT_MARKER = "fresh_context"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_REUSE = 50
+
+# Clears web storage of the origin the page is on (about:blank has none and throws)
+CLEAR_STORAGE_SCRIPT = """() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}"""
+
+
+class PooledContext:
+    """A browser context kept by ContextPool together with its reusable page."""
+
+    def __init__(self, context, page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+def is_context_healthy(entry: PooledContext) -> bool:
+    """
+    Default health check of a reset context: the browser is connected
+    and the page is open, responsive and blank.
+    """
+    browser = entry.context.browser
+
+    if browser is not None and not browser.is_connected():
+        return False
+    if entry.page.is_closed() or entry.page.url != "about:blank":
+        return False
+    return entry.page.evaluate("() => document.readyState") == "complete"
+
+
+class ContextPool:
+    """
+    ContextPool keeps pre-created browser contexts of one pytest worker and resets
+    them between tests instead of creating a new context and page for every test:
+    - Reset clears cookies, permissions, routes and web storage and opens about:blank.
+    - A reset context must pass the health check (config "context_health_check")
+      before it is reused.
+    - A context is replaced after config "context_max_reuse" tests.
+    - A context that fails to reset is closed and a fresh one is created instead.
+    Tests that change context state the reset cannot undo (init scripts, exposed
+    bindings, extra headers) should be marked with @pytest.mark.fresh_context.
+    """
+
+    def __init__(self, browser, config: dict, health_check=None, context_options: dict = None):
+        self.browser = browser
+        self.context_options = context_options or {}
+        self.timeout = config.get("timeout", 30000)
+        self.size = max(int(config.get("context_pool_size", DEFAULT_POOL_SIZE)), 1)
+        self.max_reuse = int(config.get("context_max_reuse", DEFAULT_MAX_REUSE))
+
+        if health_check is None and config.get("context_health_check", True):
+            health_check = is_context_healthy
+
+        self.health_check = health_check
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "reset_failures": 0}
+        self._idle = []
+        self._in_use = {}
+
+    def acquire(self) -> PooledContext:
+        """Returns a clean context, pre-creating the pool on first use."""
+        if not self.stats["created"]:
+            self._idle.extend(self._create() for _ in range(self.size))
+
+        if self._idle:
+            entry = self._idle.pop()
+            if entry.uses:
+                self.stats["reused"] += 1
+        else:
+            entry = self._create()
+
+        self._in_use[id(entry.context)] = entry
+        return entry
+
+    def release(self, entry: PooledContext):
+        """Resets the context of a finished test and returns it to the pool."""
+        self._in_use.pop(id(entry.context), None)
+        entry.uses += 1
+
+        if self.max_reuse and entry.uses >= self.max_reuse:
+            self.stats["recycled"] += 1
+            _close_context(entry)
+        elif self._reset(entry):
+            self._idle.append(entry)
+        else:
+            # Fall back to a fresh context on the next acquire
+            self.stats["reset_failures"] += 1
+            _close_context(entry)
+
+    def get_page(self, context):
+        """Returns the pooled page of a context acquired from the pool, otherwise None."""
+        entry = self._in_use.get(id(context))
+        return entry.page if entry else None
+
+    def close(self):
+        """Closes all contexts of the pool."""
+        for entry in self._idle + list(self._in_use.values()):
+            _close_context(entry)
+
+        self._idle.clear()
+        self._in_use.clear()
+
+    def _create(self) -> PooledContext:
+        context = self.browser.new_context(**self.context_options)
+        context.set_default_timeout(self.timeout)
+        page = context.new_page()
+        page.set_default_timeout(self.timeout)
+        self.stats["created"] += 1
+        return PooledContext(context, page)
+
+    def _reset(self, entry: PooledContext) -> bool:
+        context, page = entry.context, entry.page
+
+        try:
+            for extra_page in context.pages:
+                if extra_page != page:
+                    extra_page.close()
+
+            if page.is_closed():
+                return False
+
+            page.evaluate(CLEAR_STORAGE_SCRIPT)
+            context.clear_cookies()
+            context.clear_permissions()
+            context.unroute_all(behavior="ignoreErrors")
+            page.unroute_all(behavior="ignoreErrors")
+            context.set_offline(False)
+            page.goto("about:blank")
+            context.set_default_timeout(self.timeout)
+            page.set_default_timeout(self.timeout)
+
+            # Local storage of other visited origins can only be dropped with the context
+            if context.storage_state()["origins"]:
+                return False
+
+            return self.health_check is None or bool(self.health_check(entry))
+        except Exception as e:
+            print(f"[WARN] Browser context reset failed: {e}")
+            return False
+
+
+def _close_context(entry: PooledContext):
+    try:
+        entry.context.close()
+    except Exception:
+        pass # Context or browser is already closed
@@ -0,0 +1,91 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from utils.synthetic_dom import generate_synthetic_page
+
+DEMO_SITE_DIR = Path(__file__).resolve().parent.parent / "demo_site"
+SYNTHETIC_PAGE_PATH = "/synthetic.html"
+WEB_FORM_PATH = "/selenium/web/web-form.html"
+
+
+class DemoRequestHandler(SimpleHTTPRequestHandler):
+    """Serves demo_site files and generated synthetic pages."""
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        if url.path != SYNTHETIC_PAGE_PATH:
+            return super().do_GET()
+
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        try:
+            body = generate_synthetic_page(
+                nodes=int(query.get("nodes", 1000)),
+                duplicates=float(query.get("duplicates", 0.2)),
+                collisions=float(query.get("collisions", 0.1)),
+                seed=int(query.get("seed", 0))).encode("utf-8")
+        except ValueError as e:
+            return self.send_error(400, str(e))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Keep test output clean
+
+
+class DemoServer:
+    """
+    DemoServer is a local stand-in for the demo web sites used by the tests:
+    - / , /inventory.html, /cart.html: replica of the Sauce Demo application.
+    - /selenium/web/web-form.html: replica of the Selenium web form.
+    - /synthetic.html?nodes=..&duplicates=..&collisions=..&seed=..: generated pages
+      of 1k-100k elements (see utils.synthetic_dom).
+    The server runs in a daemon thread on an ephemeral port.
+    """
+
+    def __init__(self, root: Path = DEMO_SITE_DIR, host: str = "127.0.0.1", port: int = 0):
+        self.root = Path(root)
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, path: str = "/") -> str:
+        return self.base_url + ("" if path.startswith("/") else "/") + path
+
+    def get_config_urls(self) -> dict:
+        """Config values pointing the tests at this server."""
+        return {"demo_base_url": self.url("/"), "web_form_url": self.url(WEB_FORM_PATH)}
+
+    def start(self) -> "DemoServer":
+        handler = partial(DemoRequestHandler, directory=str(self.root))
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="demo-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,151 @@
+import json
+import os
+import re
+import shutil
+import uuid
+from pathlib import Path
+import pytest
+
+NETWORK_MODES = ("live", "record", "replay")
+HAR_SCOPES = ("test", "module")
+UNMATCHED_POLICIES = ("fail", "passthrough", "404")
+# Recordings of the session, one directory per HAR archive, stored when the session ends
+RECORDING_DIR_NAME = ".recording"
+
+
+class HarSession:
+    """Network recording or replay of one test browser context."""
+
+    def __init__(self, node_id: str, har_path: Path, record_path: Path = None):
+        self.node_id = node_id
+        self.har_path = har_path
+        self.record_path = record_path
+        self.unmatched = []
+
+
+class HarManager:
+    """
+    HarManager records browser traffic of tests into HAR archives and replays it:
+    - live: requests go to the network.
+    - record: responses of every test context are saved into a HAR per test or per
+      module (config "har_scope") under config "har_dir". Every context records its own
+      file, store_recordings() merges them into the archives once per session, so
+      pytest-xdist workers never write the same archive.
+    - replay: requests are served from the HAR through context routing. Requests missing
+      in the archive are handled by config "har_unmatched": fail the test (the request
+      is aborted), passthrough to the network, or answer 404.
+    """
+
+    def __init__(self, config: dict):
+        self.mode = config.get("network_mode", "live")
+        self.scope = config.get("har_scope", "module")
+        self.har_dir = Path(config.get("har_dir", "hars"))
+        self.unmatched_policy = config.get("har_unmatched", "fail")
+        self.recording_dir = self.har_dir / RECORDING_DIR_NAME
+
+        if self.mode not in NETWORK_MODES:
+            raise ValueError(f"Unknown network_mode '{self.mode}', expected one of {NETWORK_MODES}")
+        if self.scope not in HAR_SCOPES:
+            raise ValueError(f"Unknown har_scope '{self.scope}', expected one of {HAR_SCOPES}")
+        if self.unmatched_policy not in UNMATCHED_POLICIES:
+            raise ValueError(f"Unknown har_unmatched '{self.unmatched_policy}', "
+                             f"expected one of {UNMATCHED_POLICIES}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "live"
+
+    def get_context_options(self) -> dict:
+        """Browser context options: service workers would bypass context routing."""
+        return {"service_workers": "block"} if self.enabled else {}
+
+    def get_har_path(self, node_id: str) -> Path:
+        """Returns the HAR file of a test node id for the configured scope."""
+        name = node_id.split("::", 1)[0] if self.scope == "module" else node_id
+        name = re.sub(r"\.py\b", "", name)
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._")
+        return self.har_dir / f"{name[:150]}.har"
+
+    def start(self, context, node_id: str) -> HarSession | None:
+        """Starts recording or replay of the test network traffic in the context."""
+        if not self.enabled:
+            return None
+
+        har_path = self.get_har_path(node_id)
+
+        if self.mode == "record":
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+            record_path = self.recording_dir / har_path.stem / f"{worker}-{uuid.uuid4().hex}.har"
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+            context.route_from_har(record_path, update=True, update_content="embed",
+                                   update_mode="minimal")
+            return HarSession(node_id, har_path, record_path)
+
+        if not har_path.exists():
+            raise FileNotFoundError(
+                f"No HAR archive {har_path} for {node_id}, record it with --network_mode=record")
+
+        session = HarSession(node_id, har_path)
+        # Routes run in reverse registration order: the archive first, then the unmatched handler
+        context.route("**/*", lambda route: self._handle_unmatched(session, route))
+        context.route_from_har(har_path, not_found="fallback")
+        return session
+
+    def finish(self, session: HarSession | None):
+        """
+        Completes the test network session after its context is closed: fails the test on
+        unmatched replay requests. Recordings stay in place until store_recordings().
+        """
+        if session is not None and session.unmatched:
+            pytest.fail(f"Requests not found in {session.har_path} (--har_unmatched=fail):\n"
+                        + "\n".join(session.unmatched), pytrace=False)
+
+    def clear_recordings(self):
+        """Removes recordings left by an interrupted session, call before tests start."""
+        if self.mode == "record":
+            shutil.rmtree(self.recording_dir, ignore_errors=True)
+
+    def store_recordings(self):
+        """
+        Replaces every recorded archive with the merged recordings of its tests, in the
+        order they finished. Call once per session after all tests (on the xdist controller).
+        """
+        if self.mode != "record" or not self.recording_dir.exists():
+            return
+
+        for parts_dir in sorted(self.recording_dir.iterdir()):
+            # Playwright writes the HAR when the context closes
+            parts = sorted(parts_dir.glob("*.har"), key=lambda path: path.stat().st_mtime_ns)
+
+            if parts:
+                har_path = self.har_dir / f"{parts_dir.name}.har"
+                temp_path = har_path.with_suffix(".har.tmp")
+                temp_path.write_text(json.dumps(merge_har_files(parts)), encoding="utf-8")
+                os.replace(temp_path, har_path)
+
+        shutil.rmtree(self.recording_dir, ignore_errors=True)
+
+    def _handle_unmatched(self, session: HarSession, route):
+        if self.unmatched_policy == "passthrough":
+            route.continue_()
+        elif self.unmatched_policy == "404":
+            route.fulfill(status=404, body="")
+        else:
+            session.unmatched.append(f"{route.request.method} {route.request.url}")
+            route.abort()
+
+
+def merge_har_files(paths: list) -> dict:
+    """Returns the HAR of the first file with the entries of all files."""
+    merged = None
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            har = json.load(f)
+
+        if merged is None:
+            merged = har
+        else:
+            merged["log"]["entries"].extend(har["log"].get("entries", []))
+
+    return merged
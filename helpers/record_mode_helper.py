@@ -1,14 +1,12 @@
 import os
 import sys
-from conftest import get_current_param_row
 import pathlib
 import re
-import tkinter as tk
 from enums.update_type import UpdateType
 from common.constnts import KEYWORD_PLACEHOLDER
 from playwright.sync_api import Page
-from tkinter import messagebox, simpledialog
 from helpers.placeholder_manager import PlaceholderManager
+from helpers.test_context import get_current_param_row, get_current_keyword, get_healing_scope
 from utils.web_utils import (select_element_on_page,
                              get_element_value_or_text,
                              get_unique_element_selector,
@@ -23,6 +21,34 @@ from utils.code_utils import (get_caller_info,
                               get_parameter_name_by_index)
 from utils.text_utils import replace_line_in_text
 
+# Tk modules used by the record-mode dialogs, imported on the first dialog
+DIALOG_MODULES = ("tk", "messagebox", "simpledialog")
+
+
+def _import_dialogs():
+    """
+    Imports tkinter on first use, so runs without record mode never load it
+    and headless machines without Tk can import the wrappers.
+    """
+    if all(name in globals() for name in DIALOG_MODULES):
+        return
+
+    import tkinter
+    from tkinter import messagebox, simpledialog
+
+    # Keep modules replaced from outside (tests, benchmarks)
+    globals().setdefault("tk", tkinter)
+    globals().setdefault("messagebox", messagebox)
+    globals().setdefault("simpledialog", simpledialog)
+
+
+def __getattr__(name):
+    # Module attribute access, e.g. patch("helpers.record_mode_helper.simpledialog.askstring")
+    if name in DIALOG_MODULES:
+        _import_dialogs()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def update_value_in_source_file(arg_type: str, file_path: str, lineno: int,
                                 param_index: int, old_value: str, new_value: str) -> UpdateType:
@@ -105,6 +131,7 @@ def update_value_in_source_file(arg_type: str, file_path: str, lineno: int,
                             update_type = UpdateType.DATA_PROVIDER
                             break
                         else:
+                            _import_dialogs()
                             messagebox.askokcancel(
                                 f"Missing {arg_type} valur",
                                 f"None {arg_type} cannot be fixed\n"
@@ -127,12 +154,16 @@ def fix_value_in_file(arg_type: str, page: Page, file_path: str, lineno: int,
                       code: str, param_index: int, old_value: str,
                       keyword: str | None, placeholder_manager: PlaceholderManager) -> tuple:
 
+    _import_dialogs()
+    keyword = keyword or get_current_keyword()
+
     while True:
         file_name = os.path.basename(file_path)
         param_name = get_parameter_name_by_index(code, param_index)
 
         new_value = simpledialog.askstring(
             f"Fix failed {arg_type} value",
+            f"Test: {get_healing_scope()} (row {get_current_param_row()})\n"
             f"File : {file_name}:{lineno}\n"
             f"Code line: {code}\n"
             f"Parameter index: {param_index}\n"
@@ -197,6 +228,7 @@ def fix_noname_parameter_value(arg_type: str, page: Page, index: int, old_value:
         if  next_filename.endswith("python.py"):
 
             if param_index == -1:
+                _import_dialogs()
                 messagebox.askokcancel(
                     "Missing value",
                     f"None {arg_type} in cannot be fixed\n"
@@ -217,13 +249,16 @@ def fix_noname_parameter_value(arg_type: str, page: Page, index: int, old_value:
 
 
 def handle_missing_locator(page: Page, cache_key: str, selector: str, keyword: str) -> str:
+    _import_dialogs()
     root = tk.Tk()
     root.withdraw()
+    keyword = keyword or get_current_keyword()
 
     while True:
 
         new_selector = simpledialog.askstring(
             "Fix failed selector",
+            f"Test: {get_healing_scope()} (row {get_current_param_row()})\n"
             f"Element name: '{cache_key}'\n"
             f"Keyword: {keyword}\n"
             f"Failed selector: '{selector}'\n"
@@ -280,6 +315,7 @@ def update_source_file(source_file: str, field_name: str, cache_key, keyword: st
     if  count and text != new_text:
         path.write_text(new_text, encoding="utf-8")
     else:
+        _import_dialogs()
         messagebox.askokcancel(
             "Locator update failed",
             f"Source file: '{source_file}'\n"
@@ -0,0 +1,147 @@
+import re
+from urllib.parse import urlsplit
+
+BLOCK_MARKER = "block"
+
+# Built-in profiles, config.json "block_profiles" adds new ones or extends them
+DEFAULT_BLOCK_PROFILES = {
+    "images": {"resource_types": ["image"]},
+    "fonts": {"resource_types": ["font"]},
+    "media": {"resource_types": ["media"]},
+    "stylesheets": {"resource_types": ["stylesheet"]},
+    "analytics": {"url_patterns": [
+        r"google-analytics\.com", r"googletagmanager\.com", r"doubleclick\.net",
+        r"\.hotjar\.com", r"\.segment\.(io|com)", r"\.mixpanel\.com",
+        r"\.backtrace\.io", r"\.sentry\.io", r"\.newrelic\.com", r"\.nr-data\.net",
+    ]},
+    "third_party": {"third_party": True},
+}
+
+
+class BlockProfile:
+    """A named set of precompiled request matchers: resource types, URL patterns, third-party hosts."""
+
+    def __init__(self, name: str, resource_types=(), url_patterns=(), third_party: bool = False):
+        self.name = name
+        self.resource_types = frozenset(resource_types)
+        self.url_pattern = (re.compile("|".join(f"(?:{p})" for p in url_patterns))
+                            if url_patterns else None)
+        self.third_party = third_party
+
+    def matches(self, url: str, host: str, resource_type: str, first_party_hosts: frozenset) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        if self.url_pattern is not None and self.url_pattern.search(url):
+            return True
+        return self.third_party and bool(host) and not _is_first_party(host, first_party_hosts)
+
+
+class ResourceBlocker:
+    """
+    ResourceBlocker aborts requests of test browser contexts matching named blocking
+    profiles (config "block", --block=images,fonts,analytics, @pytest.mark.block(...)).
+    It counts blocked requests per profile, and bytes saved where the response size
+    is known from size_hint(url), e.g. from the asset cache index.
+    """
+
+    def __init__(self, config: dict, size_hint=None):
+        profiles = _merge_profiles(DEFAULT_BLOCK_PROFILES, config.get("block_profiles", {}))
+        self.profiles = {name: BlockProfile(name, **spec) for name, spec in profiles.items()}
+        self.default_profiles = self.validate_profiles(parse_profile_names(config.get("block")))
+        self.first_party_hosts = frozenset(
+            urlsplit(config[key]).hostname for key in ("demo_base_url", "web_form_url")
+            if config.get(key)) | frozenset(config.get("first_party_hosts", []))
+        self.size_hint = size_hint
+        self.stats = {"blocked": 0, "bytes_saved": 0, "sizes_known": 0, "profiles": {}}
+
+    def validate_profiles(self, names: list) -> list:
+        unknown = [name for name in names if name not in self.profiles]
+
+        if unknown:
+            raise ValueError(f"Unknown blocking profiles {unknown}, "
+                             f"expected some of {sorted(self.profiles)}")
+        return names
+
+    def get_test_profiles(self, node) -> list:
+        """Profiles of a test: @pytest.mark.block(...) replaces the configured ones."""
+        marker = node.get_closest_marker(BLOCK_MARKER)
+
+        if marker is None:
+            return self.default_profiles
+
+        names = [name for arg in marker.args for name in parse_profile_names(arg)]
+        return self.validate_profiles(names)
+
+    def attach(self, context, profile_names: list) -> dict | None:
+        """Blocks requests of the context matching the profiles, returns the test counters."""
+        profiles = [self.profiles[name] for name in profile_names]
+
+        if not profiles:
+            return None
+
+        test_stats = {"blocked": 0, "bytes_saved": 0}
+        context.route("**/*", lambda route: self.handle(route, profiles, test_stats))
+        return test_stats
+
+    def handle(self, route, profiles: list, test_stats: dict):
+        request = route.request
+        url = request.url
+        host = urlsplit(url).hostname or ""
+        resource_type = request.resource_type
+
+        for profile in profiles:
+            if profile.matches(url, host, resource_type, self.first_party_hosts):
+                self._count(profile.name, url, test_stats)
+                return route.abort("blockedbyclient")
+
+        route.fallback()
+
+    def get_summary(self) -> str:
+        profiles = ", ".join(f"{name}: {count}" for name, count in sorted(self.stats["profiles"].items()))
+        return (f"blocked requests: {self.stats['blocked']} ({profiles or 'none'}), "
+                f"bytes saved: {self.stats['bytes_saved']} "
+                f"(sizes known for {self.stats['sizes_known']} requests)")
+
+    def _count(self, profile_name: str, url: str, test_stats: dict):
+        size = self.size_hint(url) if self.size_hint else None
+        self.stats["blocked"] += 1
+        self.stats["profiles"][profile_name] = self.stats["profiles"].get(profile_name, 0) + 1
+        test_stats["blocked"] += 1
+
+        if size:
+            self.stats["bytes_saved"] += size
+            self.stats["sizes_known"] += 1
+            test_stats["bytes_saved"] += size
+
+
+def parse_profile_names(value) -> list:
+    """Parses 'images,fonts', a list of names, or 'none' into a list of profile names."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+
+    names = [name.strip() for name in value if name and name.strip()]
+    return [] if names == ["none"] else names
+
+
+def _merge_profiles(defaults: dict, custom: dict) -> dict:
+    # Matchers of a custom profile are added to the built-in profile of the same name
+    profiles = {name: dict(spec) for name, spec in defaults.items()}
+
+    for name, spec in custom.items():
+        profile = profiles.setdefault(name, {})
+
+        for key, value in spec.items():
+            if key == "third_party":
+                profile[key] = profile.get(key, False) or value
+            else:
+                known = profile.get(key, [])
+                profile[key] = [*known, *(item for item in value if item not in known)]
+
+    return profiles
+
+
+def _is_first_party(host: str, first_party_hosts: frozenset) -> bool:
+    # Subdomains of a first-party host are first-party too
+    return any(host == fp or host.endswith("." + fp) for fp in first_party_hosts)
@@ -0,0 +1,148 @@
+import inspect
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import pytest
+
+MAX_ROUNDTRIPS_MARKER = "max_roundtrips"
+# Playwright API classes whose methods are counted
+COUNTED_CLASSES = ("Page", "Frame", "Locator", "ElementHandle", "JSHandle", "Keyboard", "Mouse",
+                   "BrowserContext", "PageAssertions", "LocatorAssertions", "APIResponseAssertions")
+
+# Round trips of the running test, None while nothing is counted
+_current_counts = ContextVar("current_roundtrips", default=None)
+# (class, method name) -> original function of the installed counter
+_original_methods = {}
+
+
+class RoundtripCounts:
+    """Playwright protocol calls grouped by calling function and API method."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.tests = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def add(self, caller: str, method: str):
+        self.calls[(caller, method)] += 1
+
+    def merge(self, other: "RoundtripCounts"):
+        self.calls.update(other.calls)
+        self.tests += 1
+
+    def get_callers(self, limit: int = 5) -> list:
+        """The calling functions with most round trips: [(caller, count)]."""
+        callers = Counter()
+
+        for (caller, _), count in self.calls.items():
+            callers[caller] += count
+
+        return callers.most_common(limit)
+
+    def get_summary(self, limit: int = 5) -> str:
+        callers = ", ".join(f"{caller}: {count}" for caller, count in self.get_callers(limit))
+        return f"{self.total} round trips ({callers or 'none'})"
+
+
+# Round trips of a test in item.stash, of the session in config.stash
+ROUNDTRIPS_KEY = pytest.StashKey[RoundtripCounts]()
+
+
+def install_roundtrip_counter():
+    """Wraps round-trip methods of the sync and async Playwright API classes with the counter."""
+    if _original_methods:
+        return
+
+    import playwright.async_api as async_api
+    import playwright.sync_api as sync_api
+
+    for module, is_async in ((sync_api, False), (async_api, True)):
+        for class_name in COUNTED_CLASSES:
+            cls = getattr(module, class_name, None)
+
+            for name, method in list(vars(cls).items()) if cls else ():
+                if not name.startswith("_") and _is_roundtrip_method(method, is_async):
+                    _original_methods[(cls, name)] = method
+                    setattr(cls, name, _count_calls(method, f"{class_name}.{name}"))
+
+
+def uninstall_roundtrip_counter():
+    for (cls, name), method in _original_methods.items():
+        setattr(cls, name, method)
+    _original_methods.clear()
+
+
+def is_roundtrip_counter_installed() -> bool:
+    return bool(_original_methods)
+
+
+@contextmanager
+def count_roundtrips():
+    """Counts round trips made in the with block (in this thread or asyncio task)."""
+    counts = RoundtripCounts()
+    token = _current_counts.set(counts)
+    try:
+        yield counts
+    finally:
+        _current_counts.reset(token)
+
+
+def get_roundtrip_budget(item) -> int | None:
+    marker = item.get_closest_marker(MAX_ROUNDTRIPS_MARKER)
+    return int(marker.args[0]) if marker and marker.args else None
+
+
+def check_roundtrip_budget(item, counts: RoundtripCounts | None):
+    """Fails the test if it made more round trips than @pytest.mark.max_roundtrips(n) allows."""
+    budget = get_roundtrip_budget(item)
+
+    if counts is not None and budget is not None and counts.total > budget:
+        pytest.fail(f"Round-trip budget of {budget} exceeded: {counts.get_summary()}", pytrace=False)
+
+
+def _is_roundtrip_method(method, is_async: bool) -> bool:
+    if not inspect.isfunction(method):
+        return False
+    if is_async:
+        return inspect.iscoroutinefunction(method)
+    # Generated sync methods wait for the protocol reply through self._sync(...)
+    return "_sync" in method.__code__.co_names
+
+
+def _count_calls(method, method_name: str):
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            counts = _current_counts.get()
+            if counts is not None:
+                counts.add(_get_caller(sys._getframe(1)), method_name)
+            return await method(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        counts = _current_counts.get()
+        if counts is not None:
+            counts.add(_get_caller(sys._getframe(1)), method_name)
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _get_caller(frame) -> str:
+    """Module and qualified name of the first calling function outside Playwright."""
+    while frame is not None and frame.f_globals.get("__name__", "").startswith("playwright"):
+        frame = frame.f_back
+
+    if frame is None:
+        return "unknown"
+
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name).replace(".<locals>", "")
+    return f"{frame.f_globals.get('__name__', '?')}.{name}"
@@ -0,0 +1,118 @@
+import functools
+import hashlib
+import inspect
+from helpers.snapshot_cache import SnapshotCache, restore_storage_state
+from utils.async_utils import is_async_object, then
+
+DEFAULT_SCENARIO_CACHE_TTL = 600
+
+# Reads session storage items of the current origin
+GET_SESSION_STORAGE_SCRIPT = """() => Object.entries(window.sessionStorage)
+    .map(([name, value]) => ({name, value}))"""
+
+
+class ScenarioCache(SnapshotCache):
+    """
+    ScenarioCache keeps browser state snapshots taken after scenario prefixes:
+    blocks of setup steps shared by many tests (login, open a page, ...).
+    - A snapshot holds cookies, local storage, the page URL and optionally session storage.
+    - Snapshots are keyed by a hash of the prefix steps and their arguments.
+    - A later run of the same prefix restores the snapshot instead of replaying the steps,
+      and falls back to the replay if the restore or its probe fails.
+    """
+
+    CREATED_STAT = "replayed"
+
+    def restore_or_replay(self, key: str, page, replay, probe=None,
+                          ttl: float = DEFAULT_SCENARIO_CACHE_TTL, session_storage: bool = False) -> bool:
+        """
+        Restores the snapshot of key into the page, or calls replay() and saves a new snapshot.
+        probe(page) confirms a restored page, by default the restored URL is checked.
+        Returns True if the snapshot was restored.
+        """
+        def restore(snapshot: dict) -> bool:
+            restore_snapshot(page, snapshot)
+            return probe(page) if probe else page.url == snapshot["url"]
+
+        return self.restore_or_create(key, page, replay, lambda: take_snapshot(page, session_storage),
+                                      restore, ttl)
+
+
+def take_snapshot(page, session_storage: bool = False) -> dict:
+    """Returns the browser state of the page: storage state, URL and optionally session storage."""
+    snapshot = {"state": page.context.storage_state(), "url": page.url}
+
+    if session_storage:
+        snapshot["session_storage"] = page.evaluate(GET_SESSION_STORAGE_SCRIPT)
+
+    return snapshot
+
+
+def restore_snapshot(page, snapshot: dict):
+    restore_storage_state(page, snapshot["state"], snapshot["url"], snapshot.get("session_storage"))
+
+
+def get_scenario_key(func, arguments: dict) -> str:
+    """
+    Returns the cache key of a scenario prefix: a hash of the function steps (its bytecode)
+    and of its arguments, except the page object.
+    """
+    digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}".encode("utf-8"))
+    digest.update(func.__code__.co_code)
+
+    for name, value in arguments.items():
+        if name not in ("self", "page"):
+            value = sorted(value.items()) if isinstance(value, dict) else value
+            digest.update(f"{name}={value!r};".encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def scenario_prefix(probe=None, session_storage: bool = None):
+    """
+    Marks a function of setup steps with page and config parameters as a cacheable
+    scenario prefix. The decorated function returns True if its browser state was
+    restored from the cache and False if its steps were replayed. With an async page
+    the steps always run: the function returns the awaitable of its steps and the
+    decorated function an awaitable resolving to False.
+    probe(page, config) confirms a restored page, session_storage=True also caches
+    session storage (default: config "scenario_session_storage").
+
+    Example:
+        @scenario_prefix()
+        def open_inventory_page(self, page, config, username, password):
+            return self.login(page, config, username, password)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            page, config = arguments.arguments["page"], arguments.arguments["config"]
+
+            # Record mode must run the steps to fix them, async steps are awaited by the caller
+            if is_async_object(page) or config.get("record_mode") or not config.get("scenario_cache", False):
+                return then(func(*args, **kwargs), lambda _: False)
+
+            use_session_storage = session_storage
+            if use_session_storage is None:
+                use_session_storage = config.get("scenario_session_storage", False)
+
+            return SCENARIO_CACHE.restore_or_replay(
+                get_scenario_key(func, arguments.arguments),
+                # SmartPage objects are unwrapped to the Playwright page
+                getattr(page, "page", page),
+                lambda: func(*args, **kwargs),
+                probe=(lambda restored_page: probe(restored_page, config)) if probe else None,
+                ttl=config.get("scenario_cache_ttl", DEFAULT_SCENARIO_CACHE_TTL),
+                session_storage=use_session_storage)
+
+        return wrapper
+
+    return decorator
+
+
+# Session-wide cache used by scenario_prefix functions and the scenario_cache fixture
+SCENARIO_CACHE = ScenarioCache()
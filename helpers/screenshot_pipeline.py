@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SCREENSHOT_MODES = ("viewport", "full_page", "element")
+SCREENSHOT_FORMATS = ("jpeg", "png")
+ELEMENT_SCREENSHOT_TIMEOUT = 2000
+
+
+class ScreenshotPipeline:
+    """
+    ScreenshotPipeline captures failure screenshots at low cost:
+    - Mode (config "screenshot_mode"): viewport, full_page, or element for the
+      config "screenshot_selector" element, with fallback to the viewport.
+    - JPEG encoding with config "screenshot_quality" is done by the browser.
+    - Files are named by content hash, identical screenshots are written once.
+    - Files are written by a background thread pool, close() waits for them.
+    The returned file names are relative to output_dir, so reports link to the files.
+    """
+
+    def __init__(self, output_dir: str | Path, config: dict):
+        self.output_dir = Path(output_dir)
+        self.mode = config.get("screenshot_mode", "viewport")
+        self.format = config.get("screenshot_format", "jpeg")
+        self.quality = int(config.get("screenshot_quality", 70)) if self.format == "jpeg" else None
+        self.selector = config.get("screenshot_selector", "body")
+        self.delay = float(config.get("screenshot_delay", 0))
+        self.stats = {"captured": 0, "deduplicated": 0, "bytes_written": 0, "capture_ms": 0.0}
+
+        if self.mode not in SCREENSHOT_MODES:
+            raise ValueError(f"Unknown screenshot_mode '{self.mode}', expected one of {SCREENSHOT_MODES}")
+        if self.format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Unknown screenshot_format '{self.format}', "
+                             f"expected one of {SCREENSHOT_FORMATS}")
+
+        self._executor = ThreadPoolExecutor(max_workers=int(config.get("screenshot_workers", 2)),
+                                            thread_name_prefix="screenshot")
+        self._files = {}
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def capture(self, page, name: str) -> str:
+        """
+        Captures a screenshot of the page and returns its file name.
+        The file is written in the background.
+        """
+        if self.delay > 0:
+            # Give the browser time to render a failure overlay
+            page.wait_for_timeout(self.delay)
+
+        start = time.perf_counter()
+        data = self._take_screenshot(page)
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        self.stats["captured"] += 1
+        self.stats["capture_ms"] += (time.perf_counter() - start) * 1000.0
+
+        if digest in self._files:
+            self.stats["deduplicated"] += 1
+            return self._files[digest]
+
+        file_name = f"{name}-{digest}.{'jpg' if self.format == 'jpeg' else 'png'}"
+        self._files[digest] = file_name
+        self._pending.append(self._executor.submit(self._write, file_name, data))
+        return file_name
+
+    def close(self):
+        """Waits for all pending screenshot files to be written."""
+        for future in self._pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"[WARN] Screenshot write failed: {e}")
+
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def _take_screenshot(self, page) -> bytes:
+        options = {"type": self.format, "animations": "disabled", "caret": "hide"}
+
+        if self.quality is not None:
+            options["quality"] = self.quality
+
+        if self.mode == "element":
+            element = page.locator(self.selector).first
+
+            try:
+                return element.screenshot(timeout=ELEMENT_SCREENSHOT_TIMEOUT, **options)
+            except Exception:
+                pass # Element is missing or hidden, take the viewport
+
+        return page.screenshot(full_page=self.mode == "full_page", **options)
+
+    def _write(self, file_name: str, data: bytes):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / file_name).write_bytes(data)
+
+        with self._lock:
+            self.stats["bytes_written"] += len(data)
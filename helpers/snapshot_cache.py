@@ -0,0 +1,115 @@
+import time
+from urllib.parse import urlsplit
+
+# Restores local and session storage items of the current origin
+SET_STORAGE_SCRIPT = """([localItems, sessionItems]) => {
+    for (const item of localItems) {
+        window.localStorage.setItem(item.name, item.value);
+    }
+    for (const item of sessionItems) {
+        window.sessionStorage.setItem(item.name, item.value);
+    }
+}"""
+
+
+class SnapshotCache:
+    """
+    SnapshotCache keeps browser state snapshots of the test session by key.
+    A snapshot is a dict with the context storage state under "state".
+    - Snapshots expire after a TTL or when one of their saved cookies expires.
+    - restore_or_create() restores a saved snapshot into a page, or runs the steps
+      creating the browser state and saves a new snapshot after them.
+    - A failed restore invalidates the snapshot and falls back to the steps.
+    Subclasses name the counters of created snapshots and failed restores.
+    """
+
+    CREATED_STAT = "created"
+    FAILED_RESTORE_STAT = "failed_restores"
+
+    def __init__(self):
+        self._entries = {}
+        self.stats = {self.CREATED_STAT: 0, "restored": 0, "expired": 0, self.FAILED_RESTORE_STAT: 0}
+
+    def get(self, key, ttl: float = None) -> dict | None:
+        """Returns the snapshot or None if it is missing or expired."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        snapshot, saved_at = entry
+
+        if (ttl is not None and time.time() - saved_at > ttl) or has_expired_cookies(snapshot["state"]):
+            self.stats["expired"] += 1
+            del self._entries[key]
+            return None
+
+        return snapshot
+
+    def put(self, key, snapshot: dict):
+        self._entries[key] = (snapshot, time.time())
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def restore_or_create(self, key, page, create, take, restore, ttl: float = None) -> bool:
+        """
+        Restores the snapshot of key with restore(snapshot), which returns True for a confirmed
+        page, or calls create() and saves the snapshot returned by take() unless it is None.
+        Returns True if the snapshot was restored.
+        """
+        snapshot = self.get(key, ttl)
+
+        if snapshot is not None:
+            try:
+                if restore(snapshot):
+                    self.stats["restored"] += 1
+                    return True
+            except Exception as e:
+                print(f"[WARN] {type(self).__name__} restore failed: {e}")
+
+            self.stats[self.FAILED_RESTORE_STAT] += 1
+            self.invalidate(key)
+            page.context.clear_cookies()
+
+        create()
+        self.stats[self.CREATED_STAT] += 1
+        snapshot = take()
+
+        if snapshot is not None:
+            self.put(key, snapshot)
+
+        return False
+
+
+def restore_storage_state(page, state: dict, url: str, session_storage: list = None):
+    """
+    Applies a saved storage state to the page browser context and opens url.
+    Local and session storage can be written only on their own origin, so they
+    are restored for the origin of url, followed by a reload.
+    """
+    if state.get("cookies"):
+        page.context.add_cookies(state["cookies"])
+
+    page.goto(url)
+    origin = _get_origin(page.url)
+    items = next((entry["localStorage"] for entry in state.get("origins", [])
+                  if entry["origin"] == origin), [])
+
+    if items or session_storage:
+        page.evaluate(SET_STORAGE_SCRIPT, [items, session_storage or []])
+        page.reload()
+
+
+def has_expired_cookies(state: dict) -> bool:
+    now = time.time()
+    # Session cookies have expires -1
+    return any(0 < cookie.get("expires", -1) < now for cookie in state.get("cookies", []))
+
+
+def _get_origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,163 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+SPANS_DIR_NAME = "spans"
+# Categories of wrapper call spans, "wait" spans are the Playwright calls inside them
+CALL_CATEGORIES = ("page", "locator", "expect")
+WAIT_CATEGORY = "wait"
+
+# Spans of the running test, None while span recording is off
+_current_spans = ContextVar("current_spans", default=None)
+
+
+class Span:
+    """A timed wrapper call, exported as a Chrome trace complete event."""
+
+    __slots__ = ("spans", "name", "category", "args", "start_ns", "end_ns")
+
+    def __init__(self, spans: list, name: str, category: str, args: dict):
+        self.spans = spans
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_ns = 0
+        self.end_ns = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_ns = time.perf_counter_ns()
+
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+
+        self.spans.append(self)
+        return False
+
+
+class _NullSpan:
+    """Span returned while recording is off, every method is a no-op."""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+def start_span(name: str, category: str, **args):
+    """Returns a span context manager for the running test, a no-op one if recording is off."""
+    spans = _current_spans.get()
+
+    if spans is None:
+        return NULL_SPAN
+    return Span(spans, name, category, args)
+
+
+class SpanRecorder:
+    """
+    SpanRecorder collects timing spans of SmartPage, SmartLocator and SmartExpect calls:
+    - record() binds a span list to the running test (context variable, so concurrent
+      tests keep their own spans). Without it start_span() returns a no-op span.
+    - export() writes the spans of a test as Chrome trace-event JSON, opened with
+      chrome://tracing or https://ui.perfetto.dev.
+    - Calls are aggregated per locator (cache key): total, Playwright wait and
+      wrapper overhead time, and healing retries.
+    """
+
+    def __init__(self, output_dir: str | Path):
+        self.output_dir = Path(output_dir)
+        self.locators = {}
+        self.stats = {"tests": 0, "spans": 0}
+
+    @contextmanager
+    def record(self):
+        spans = []
+        token = _current_spans.set(spans)
+        try:
+            yield spans
+        finally:
+            _current_spans.reset(token)
+
+    def export(self, name: str, spans: list, test_id: str = None) -> Path:
+        """Writes the spans as Chrome trace-event JSON and adds them to the locator table."""
+        self.aggregate(spans)
+        start_ns = min((span.start_ns for span in spans), default=0)
+        pid = os.getpid()
+
+        trace = {
+            "traceEvents": [
+                {"name": span.name, "cat": span.category, "ph": "X", "pid": pid, "tid": 1,
+                 "ts": (span.start_ns - start_ns) / 1000, "dur": (span.end_ns - span.start_ns) / 1000,
+                 "args": {key: _to_json_value(value) for key, value in span.args.items()}}
+                for span in sorted(spans, key=lambda span: span.start_ns)
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"test": test_id or name},
+        }
+
+        path = self.output_dir / f"{name}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(trace), encoding="utf-8")
+        return path
+
+    def aggregate(self, spans: list):
+        self.stats["tests"] += 1
+        self.stats["spans"] += len(spans)
+
+        for span in spans:
+            key = span.args.get("cache_key") or span.name
+
+            if span.category not in CALL_CATEGORIES and span.category != WAIT_CATEGORY:
+                continue
+
+            row = self.locators.setdefault(
+                key, {"calls": 0, "total_ms": 0.0, "wait_ms": 0.0, "max_ms": 0.0, "retries": 0})
+
+            if span.category == WAIT_CATEGORY:
+                row["wait_ms"] += span.duration_ms
+                continue
+
+            row["calls"] += 1
+            row["total_ms"] += span.duration_ms
+            row["max_ms"] = max(row["max_ms"], span.duration_ms)
+            row["retries"] += span.args.get("retries", 0)
+
+    def get_locator_table(self, limit: int = 50) -> list:
+        """Rows of the slowest locators: key, calls, total, wait, overhead, max (ms), retries."""
+        rows = [(key, row["calls"], row["total_ms"], row["wait_ms"],
+                 max(row["total_ms"] - row["wait_ms"], 0.0), row["max_ms"], row["retries"])
+                for key, row in self.locators.items() if row["calls"]]
+        return sorted(rows, key=lambda row: row[2], reverse=True)[:limit]
+
+    def get_summary(self) -> str:
+        total_ms = sum(row["total_ms"] for row in self.locators.values())
+        wait_ms = sum(row["wait_ms"] for row in self.locators.values())
+        return (f"spans: {self.stats['spans']} in {self.stats['tests']} tests, "
+                f"wrapper calls: {total_ms:.0f} ms, Playwright: {wait_ms:.0f} ms, "
+                f"overhead: {max(total_ms - wait_ms, 0.0):.0f} ms")
+
+
+def _to_json_value(value):
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
@@ -1,10 +1,142 @@
-_current_param_row = -1
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Test state is kept in context variables: every thread and every asyncio task
+# of the concurrent test runner sees only the values of its own test.
+_current_param_row = ContextVar("current_param_row", default=-1)
+_current_node_id = ContextVar("current_node_id", default=None)
+_current_keyword = ContextVar("current_keyword", default=None)
+_healing_scope = ContextVar("healing_scope", default=None)
+_step_listener = ContextVar("step_listener", default=None)
+_running_step = ContextVar("running_step", default=None)
 
 def set_current_param_row(value: int):
-    global _current_param_row
-    _current_param_row = value
+    _current_param_row.set(value)
 
 
 def get_current_param_row() -> int:
     """Return the current pytest parametrize row index."""
-    return _current_param_row
+    return _current_param_row.get()
+
+
+def set_current_node_id(node_id: str | None):
+    _current_node_id.set(node_id)
+
+
+def get_current_node_id() -> str | None:
+    """Return the pytest node id of the running test."""
+    return _current_node_id.get()
+
+
+def set_current_keyword(keyword: str | None):
+    _current_keyword.set(keyword)
+
+
+def get_current_keyword() -> str | None:
+    """Return the keyword last set on a page object by the running test."""
+    return _current_keyword.get()
+
+
+def set_healing_scope(scope: str | None):
+    _healing_scope.set(scope)
+
+
+def get_healing_scope() -> str | None:
+    """
+    Return the scope of record mode fixes of the running test: the test function
+    node id shared by all its parametrize rows.
+    """
+    return _healing_scope.get()
+
+
+def start_step(title: str):
+    """Mark the start of a test step, e.g. a trace chunk boundary of the running test."""
+    listener = _step_listener.get()
+
+    if listener is not None:
+        listener(title)
+
+
+def start_page_step(title: str):
+    """
+    Mark a page navigation as a test step, so tests driving page objects directly
+    get step boundaries too. Navigation inside a service step is part of that step.
+    """
+    if _running_step.get() is None:
+        start_step(title)
+
+
+def step(func):
+    """Decorator marking every call of a service function as a test step."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start_step(func.__name__)
+        token = _running_step.set(func.__name__)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _running_step.reset(token)
+
+        # Steps of async pages run when the caller awaits them
+        return _await_step(result, func.__name__) if inspect.isawaitable(result) else result
+
+    return wrapper
+
+
+async def _await_step(awaitable, title: str):
+    token = _running_step.set(title)
+    try:
+        return await awaitable
+    finally:
+        _running_step.reset(token)
+
+
+@contextmanager
+def listen_to_steps(listener):
+    """Calls listener(title) on every test step started in the with block."""
+    token = _step_listener.set(listener)
+    try:
+        yield
+    finally:
+        _step_listener.reset(token)
+
+
+def get_test_context() -> dict:
+    """Return a snapshot of the current test context."""
+    return {
+        "param_row": get_current_param_row(),
+        "node_id": get_current_node_id(),
+        "keyword": get_current_keyword(),
+        "healing_scope": get_healing_scope(),
+    }
+
+
+@contextmanager
+def bind_test_context(node_id: str | None, param_row: int = -1, healing_scope: str | None = None):
+    """
+    Binds the test context of one test for the duration of the with block
+    and restores the previous values afterwards.
+    """
+    if healing_scope is None and node_id:
+        healing_scope = node_id.split("[", 1)[0]
+
+    tokens = [
+        (_current_node_id, _current_node_id.set(node_id)),
+        (_current_param_row, _current_param_row.set(param_row)),
+        (_current_keyword, _current_keyword.set(None)),
+        (_healing_scope, _healing_scope.set(healing_scope)),
+    ]
+    try:
+        yield
+    finally:
+        for variable, token in reversed(tokens):
+            variable.reset(token)
+
+
+def get_param_row(item) -> int:
+    """Return the parametrize row index of a pytest item, -1 for tests without parameters."""
+    callspec = getattr(item, "callspec", None)
+    indices = getattr(callspec, "indices", None)
+    return list(indices.values())[0] if indices else -1
@@ -0,0 +1,90 @@
+import re
+from collections import deque
+from pathlib import Path
+
+TRACES_DIR_NAME = "traces"
+
+
+class TraceSession:
+    """Trace of one test in one browser context: saved step chunks and the running chunk."""
+
+    def __init__(self, context, trace_dir: Path):
+        self.context = context
+        self.trace_dir = trace_dir
+        self.chunks = deque()
+        self.step_index = 0
+        self.step_title = "start"
+
+    def get_chunk_path(self) -> Path:
+        """Path the running chunk is saved to."""
+        title = re.sub(r"[^\w.-]+", "_", self.step_title).strip("._")[:60]
+        return self.trace_dir / f"{self.step_index:03d}-{title or 'step'}.zip"
+
+    def get_trace_files(self) -> list[Path]:
+        """Files of a kept trace: saved step chunks and the running chunk."""
+        return [*self.chunks, self.get_chunk_path()]
+
+
+class TraceRecorder:
+    """
+    TraceRecorder keeps Playwright traces of failed and retried tests only:
+    - Tracing starts per test in its browser context, passing tests discard
+      the trace without writing it.
+    - With max_steps > 0 the trace is split into chunks at test steps: @step service
+      calls and SmartPage navigations outside them (helpers.test_context.start_step).
+      Locator actions do not split the trace. Only the last max_steps chunks are kept,
+      older ones are deleted as the test goes on, so long tests stay bounded.
+      Each step boundary writes a chunk, so passing tests pay for it.
+    """
+
+    def __init__(self, output_dir: str | Path, config: dict):
+        self.output_dir = Path(output_dir)
+        self.max_steps = int(config.get("trace_steps", 0))
+        self.options = {"screenshots": bool(config.get("trace_screenshots", True)),
+                        "snapshots": True, "sources": False}
+        self.stats = {"started": 0, "kept": 0, "discarded": 0, "steps_dropped": 0}
+
+    def start(self, context, name: str) -> TraceSession:
+        context.tracing.start(title=name, **self.options)
+        self.stats["started"] += 1
+        return TraceSession(context, self.output_dir / name)
+
+    def step(self, session: TraceSession, title: str):
+        """Starts a new chunk at a test step boundary, dropping chunks above max_steps."""
+        if self.max_steps <= 0:
+            return
+
+        path = session.get_chunk_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        session.context.tracing.stop_chunk(path=path)
+        session.chunks.append(path)
+
+        # The running chunk is one of the kept steps
+        while len(session.chunks) >= self.max_steps:
+            session.chunks.popleft().unlink(missing_ok=True)
+            self.stats["steps_dropped"] += 1
+
+        session.step_index += 1
+        session.step_title = title
+        session.context.tracing.start_chunk(title=title)
+
+    def finish(self, session: TraceSession, keep: bool) -> list[Path]:
+        """Stops tracing. Saves the trace if keep is True, otherwise discards it."""
+        if keep:
+            path = session.get_chunk_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            session.context.tracing.stop(path=path)
+            self.stats["kept"] += 1
+            return session.get_trace_files()
+
+        session.context.tracing.stop()
+
+        for path in session.chunks:
+            path.unlink(missing_ok=True)
+
+        if session.chunks and not any(session.trace_dir.iterdir()):
+            session.trace_dir.rmdir()
+
+        session.chunks.clear()
+        self.stats["discarded"] += 1
+        return []
@@ -0,0 +1,13 @@
+from wrappers.smart_component import SmartComponent
+from wrappers.smart_locator import SmartLocator
+
+
+class CartItemComponent(SmartComponent):
+
+    def __init__(self, owner, root_selector: str):
+        super().__init__(owner, root_selector)
+
+        # Locators inside one cart row
+        self.name = SmartLocator(self, "smart=|#KEYWORD#|")
+        self.price = SmartLocator(self, "div[class='inventory_item_price']")
+        self.remove_button = SmartLocator(self, "button[class='btn btn_secondary btn_small cart_button']")
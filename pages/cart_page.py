@@ -1,6 +1,7 @@
 from playwright.sync_api import Page
 from wrappers.smart_locator import SmartLocator
 from wrappers.smart_page import SmartPage
+from pages.cart_item_component import CartItemComponent
 
 
 class CartPage(SmartPage):
@@ -10,10 +11,12 @@ class CartPage(SmartPage):
 
         # Locators
         self.header = SmartLocator(self, "span[data-test='title']")
-        self.product_link = SmartLocator(self, "//*[normalize-space(text())='#KEYWORD#']")
-        self.product_price = SmartLocator(self, "xpath=//div[@class='cart_item_label'][.//*[normalize-space(text())='#KEYWORD#']]//div[@class='inventory_item_price']")
         self.checkout_button = SmartLocator(self, "#checkout")
-        self.remove_button = SmartLocator(self, "xpath=//div[@class='cart_item_label'][.//*[normalize-space(text())='#KEYWORD#']]//button[@class='btn btn_secondary btn_small cart_button']")
+        # One keyword anchored query for the cart row, scoped lookups inside it
+        self.cart_item = CartItemComponent(self, "smart=div[class='cart_item_label']|#KEYWORD#|")
+        self.product_link = self.cart_item.name
+        self.product_price = self.cart_item.price
+        self.remove_button = self.cart_item.remove_button
 
     def remove_product(self):
-        self.remove_button.click()
\ No newline at end of file
+        return self.remove_button.click()
\ No newline at end of file
@@ -0,0 +1,14 @@
+from wrappers.smart_component import SmartComponent
+from wrappers.smart_locator import SmartLocator
+
+
+class InventoryItemComponent(SmartComponent):
+
+    def __init__(self, owner, root_selector: str):
+        super().__init__(owner, root_selector)
+
+        # Locators inside one product card
+        self.name = SmartLocator(self, "smart=|#KEYWORD#|")
+        self.price = SmartLocator(self, "div[class='inventory_item_price']")
+        self.image = SmartLocator(self, "img[class='inventory_item_img']")
+        self.add_to_cart_button = SmartLocator(self, "button[class='btn btn_primary btn_small btn_inventory ']")
@@ -1,12 +1,15 @@
 from playwright.sync_api import Page
 import re
 from wrappers.smart_locator import SmartLocator
-from wrappers.smart_expect import expect
+from wrappers.smart_locator_list import SmartLocatorList
+from wrappers.smart_expect import SmartExpect
 from urllib.parse import urljoin
 
 from wrappers.smart_page import SmartPage
+from pages.inventory_item_component import InventoryItemComponent
 
 INVENTORY_PAGE_HEADER = 'Swag Labs'
+INVENTORY_LIST_SELECTOR = "div[class='inventory_list']"
 
 class InventoryPage(SmartPage):
 
@@ -14,24 +17,44 @@ class InventoryPage(SmartPage):
         super().__init__(page, config)
         # Selectors
         self.header = SmartLocator(self, "div[class='app_logo']")
-        self.product_name = SmartLocator(self, "//*[normalize-space(text())='#KEYWORD#']")
-        self.product_price = SmartLocator(self, "xpath=//div[@class='inventory_item_description'][.//*[normalize-space(text())='#KEYWORD#']]//div[@class='inventory_item_price']")
-        self.product_image = SmartLocator(self, "xpath=//div[@class='inventory_item'][.//*[normalize-space(text())='#KEYWORD#']]//img[@class='inventory_item_img']")
-        self.add_to_cart_button = SmartLocator(self, "xpath=//div[@class='inventory_item_description'][.//*[normalize-space(text())='#KEYWORD#']]//button[@class='btn btn_primary btn_small btn_inventory ']")
-        self.cart_button = SmartLocator(self, "xpath=//div[.//*[normalize-space(text())='#KEYWORD#']]//a[@class='shopping_cart_link']")
+        # One keyword anchored query for the product card, scoped lookups inside it
+        self.product_item = InventoryItemComponent(self, "smart=div[class='inventory_item']|#KEYWORD#|")
+        self.product_name = self.product_item.name
+        self.product_price = self.product_item.price
+        self.product_image = self.product_item.image
+        self.add_to_cart_button = self.product_item.add_to_cart_button
+        self.cart_button = SmartLocator(self, "smart=div|#KEYWORD#|a[class='shopping_cart_link']")
+        self.inventory_items = SmartLocatorList(self, "div[class='inventory_item']", fields={
+            "name": ".inventory_item_name",
+            "price": ".inventory_item_price",
+            "button": "button",
+        })
         self.inventory_page_url = urljoin(config['demo_base_url'], 'inventory.html')
 
     def verify_page(self, button_text):
-        expect(self.page).to_have_url(self.inventory_page_url)
-        expect(self.header).to_have_text(INVENTORY_PAGE_HEADER)
-        expect(self.product_name).to_be_visible()
-        expect(self.product_name).to_be_visible()
-        expect(self.product_image).to_be_visible()
-        expect(self.product_price).to_have_text(re.compile(r"^\$\s*\d", re.MULTILINE))
-        expect(self.add_to_cart_button).to_have_text(button_text)
+        # All conditions are polled together in one page round trip
+        group = SmartExpect.group()
+        group.expect(self.page).to_have_url(self.inventory_page_url)
+        group.expect(self.header).to_have_text(INVENTORY_PAGE_HEADER)
+        group.expect(self.product_name).to_be_visible()
+        group.expect(self.product_image).to_be_visible()
+        group.expect(self.product_price).to_have_text(re.compile(r"^\$\s*\d", re.MULTILINE))
+        group.expect(self.add_to_cart_button).to_have_text(button_text)
+        return group.verify()
+
+    def is_opened(self, timeout=None) -> bool:
+        # Without a valid session the app redirects to the login page
+        try:
+            self.page.locator(INVENTORY_LIST_SELECTOR).wait_for(timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def verify_product_prices(self, prices: dict):
+        return self.inventory_items.expect_fields_by_key("name", "price", prices)
 
     def add_product_to_cart(self):
-        self.add_to_cart_button.click()
+        return self.add_to_cart_button.click()
 
     def open_cart_page(self):
-        self.cart_button.click()
+        return self.cart_button.click()
@@ -14,8 +14,10 @@ class LoginPage(SmartPage):
         self.login_button = SmartLocator(self, "#login-button")
 
     def fill_form(self, username, password):
-        self.username_input.fill(username)
-        self.password_input.fill(password)
+        return self.fill_fields((self.username_input, self.password_input), username, password)
+
+    def fast_fill_form(self, username, password):
+        return self.fill_fields((self.username_input, self.password_input), username, password, fast=True)
 
     def submit_form(self):
-        self.login_button.click()
+        return self.login_button.click()
@@ -1,6 +1,7 @@
 from playwright.sync_api import Page
 from wrappers.smart_locator import SmartLocator
 from wrappers.smart_page import SmartPage
+from pages.inventory_item_component import InventoryItemComponent
 
 
 class ProductItemsPage(SmartPage):
@@ -10,5 +11,6 @@ class ProductItemsPage(SmartPage):
 
         # Locators
         self.header = SmartLocator(self, "div[class='app_logo']")
-        self.product_image = SmartLocator(self, "xpath=//div[@class='inventory_item'][.//*[normalize-space(text())='#KEYWORD#']]//img[@class='inventory_item_img']")
-        self.product_price = SmartLocator(self, "xpath=//div[@class='inventory_item_description'][.//*[normalize-space(text())='#KEYWORD#']]//div[@class='inventory_item_price']")
+        self.product_item = InventoryItemComponent(self, "smart=div[class='inventory_item']|#KEYWORD#|")
+        self.product_image = self.product_item.image
+        self.product_price = self.product_item.price
@@ -1,15 +1,56 @@
+from helpers.auth_cache import AUTH_CACHE, DEFAULT_AUTH_CACHE_TTL
+from helpers.scenario_cache import scenario_prefix
+from helpers.test_context import step
 from pages.inventory_page import InventoryPage
 from pages.login_page import LoginPage
+from utils.async_utils import is_async_page, then
 
 class TestService:
 
+    @step
     def login(self, page, config, username, password):
         login_page = LoginPage(page, config)
+
+        if is_async_page(page):
+            return self._login_async(login_page, config, username, password)
+
         login_page.goto(config["demo_base_url"])
         login_page.fill_form(username, password)
         login_page.submit_form()
 
+    async def _login_async(self, login_page, config, username, password):
+        await login_page.goto(config["demo_base_url"])
+        await login_page.fill_form(username, password)
+        await login_page.submit_form()
+
+    def login_with_auth_cache(self, page, config, username, password) -> bool:
+        """
+        Logs in through the UI once per (demo_base_url, username) and restores the saved
+        session in later tests. Returns True if the session was restored from the cache.
+        Async pages, record mode and auth_cache=false (the default) always use the UI login,
+        for async pages the result is an awaitable that runs it.
+        """
+        if is_async_page(page) or config.get("record_mode") or not config.get("auth_cache", False):
+            return then(self.login(page, config, username, password), lambda _: False)
+
+        inventory_page = InventoryPage(page, config)
+        probe_timeout = config.get("auth_probe_timeout", 5000)
+
+        return AUTH_CACHE.restore_or_login(
+            page, config["demo_base_url"], username,
+            login_flow=lambda: self.login(page, config, username, password),
+            probe=lambda _: inventory_page.is_opened(probe_timeout),
+            landing_url=inventory_page.inventory_page_url,
+            ttl=config.get("auth_cache_ttl", DEFAULT_AUTH_CACHE_TTL))
+
+    @scenario_prefix(probe=lambda page, config: InventoryPage(page, config).is_opened(
+        config.get("auth_probe_timeout", 5000)))
+    def open_inventory_page(self, page, config, username, password):
+        """Scenario prefix: logs in and opens the inventory page, restored from the scenario cache."""
+        return self.login(page, config, username, password)
+
+    @step
     def verify_inventory_page(self, page, config, product, button_name):
         inventory_page = InventoryPage(page, config)
         inventory_page.set_keyword(product)
-        inventory_page.verify_page(button_name)
\ No newline at end of file
+        return inventory_page.verify_page(button_name)
\ No newline at end of file
@@ -1,16 +1,11 @@
 import pytest
 from pages.cart_page import CartPage
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from wrappers.smart_expect import expect
 
 
-def test_add_product_to_cart(page, config):
-    login_page = LoginPage(page, config)
-    login_page.add_placeholder('demo_base_url')
-    login_page.goto('#DEMO_BASE_URL#')
-    login_page.fill_form('standard_user', 'secret_sauce')
-    login_page.submit_form()
+def test_add_product_to_cart(page, config, login_user):
+    login_user('standard_user', 'secret_sauce')
 
     product_name = 'Sauce Labs Bike Light'
     product_price = '$9.99'
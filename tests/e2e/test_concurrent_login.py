@@ -0,0 +1,34 @@
+import pytest
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from services.test_service import TestService
+
+
+# Async tests marked 'concurrent' run at once on one browser, each in its own context:
+# pytest tests/e2e/test_concurrent_login.py --concurrency=3
+@pytest.mark.concurrent
+@pytest.mark.parametrize("username,password,product", [
+    ('standard_user', 'secret_sauce', 'Sauce Labs Backpack'),
+    ('visual_user', 'secret_sauce', 'Sauce Labs Bolt T-Shirt'),
+    ('performance_glitch_user', 'secret_sauce', 'Sauce Labs Bike Light')
+])
+async def test_concurrent_login_with_multiple_users(page, config, username, password, product):
+    login_page = LoginPage(page, config)
+    await login_page.goto(config["demo_base_url"])
+    await login_page.fill_form(username, password)
+    await login_page.submit_form()
+
+    inventory_page = InventoryPage(page, config)
+    inventory_page.set_keyword(product)
+    await inventory_page.verify_page('Add to cart')
+
+
+@pytest.mark.concurrent
+@pytest.mark.parametrize("username,password,product", [
+    ('standard_user', 'secret_sauce', 'Sauce Labs Backpack'),
+    ('visual_user', 'secret_sauce', 'Sauce Labs Bolt T-Shirt')
+])
+async def test_concurrent_login_with_test_service(page, config, username, password, product):
+    test_service = TestService()
+    await test_service.login(page, config, username, password)
+    await test_service.verify_inventory_page(page, config, product, 'Add to cart')
@@ -0,0 +1,124 @@
+import re
+from pathlib import Path
+import pytest
+from utils.web_utils import get_dom_generation, highlight_element, reset_element_style
+from wrappers.smart_expect import ExpectGroup, SmartExpect
+from wrappers.smart_locator import SmartLocator
+from wrappers.smart_page import SmartPage, FORM_FIELD_KINDS
+
+# Page scripts of the wrappers run in the browser, the unit tests only use a fake page
+CHECKOUT_HTML = """
+<form>
+    <input id="name">
+    <input type="checkbox" id="agree">
+    <input type="file" id="avatar">
+    <select id="country"><option value="us">United States</option><option value="de">Germany</option></select>
+</form>
+"""
+INVENTORY_HTML = """
+<span class="title">Products</span>
+<input id="search" value="backpack">
+<input type="checkbox" id="remember" checked>
+<p class="error" hidden>Epic sadface</p>
+"""
+
+
+class CheckoutPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.name_input = SmartLocator(self, "#name")
+        self.agree_checkbox = SmartLocator(self, "#agree")
+        self.avatar_input = SmartLocator(self, "#avatar")
+        self.country_select = SmartLocator(self, "#country")
+
+
+class ProductsPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.title = SmartLocator(self, ".title")
+        self.search = SmartLocator(self, "#search")
+        self.remember = SmartLocator(self, "#remember")
+        self.error = SmartLocator(self, ".error")
+
+
+@pytest.fixture
+def checkout_page(page, config):
+    FORM_FIELD_KINDS.clear()
+    page.set_content(CHECKOUT_HTML)
+    yield CheckoutPage(page, config)
+    FORM_FIELD_KINDS.clear()
+
+
+# Trusted actions (FORM_FIELD_KIND_SCRIPT) and one evaluate call (FAST_FORM_FILL_SCRIPT)
+@pytest.mark.parametrize("fast", [False, True])
+def test_fill_fields_sets_dom_values(checkout_page, fast):
+    checkout_page.fill_fields({"name_input": "John", "agree_checkbox": True,
+                               "country_select": "Germany", "avatar_input": __file__}, fast=fast)
+
+    page = checkout_page.page
+    assert page.locator("#name").input_value() == "John"
+    assert page.locator("#agree").is_checked()
+    assert page.locator("#country").input_value() == "de"
+    assert page.locator("#avatar").evaluate("el => el.files[0].name") == Path(__file__).name
+    assert FORM_FIELD_KINDS == {"CheckoutPage.name_input": "fill",
+                                "CheckoutPage.agree_checkbox": "check",
+                                "CheckoutPage.avatar_input": "file",
+                                "CheckoutPage.country_select": "select"}
+
+
+# None values fill an empty value on both paths, not "null"
+@pytest.mark.parametrize("fast", [False, True])
+def test_fill_fields_none_parity(checkout_page, fast):
+    checkout_page.page.locator("#name").fill("John")
+
+    checkout_page.fill_fields({"name_input": None}, fast=fast)
+
+    assert checkout_page.page.locator("#name").input_value() == ""
+
+
+# All grouped conditions are checked by one GROUP_CHECK_SCRIPT evaluate call
+def test_expect_group_checks_dom_state(page, config):
+    page.set_content(INVENTORY_HTML)
+    products_page = ProductsPage(page, config)
+
+    with SmartExpect.group() as group:
+        group.expect(products_page.title).to_have_text(re.compile("^Prod"))
+        group.expect(products_page.search).to_have_value("backpack")
+        group.expect(products_page.remember).to_be_checked()
+        group.expect(products_page.error).to_be_hidden()
+        group.expect(products_page.page).to_have_url("about:blank")
+
+    group = ExpectGroup(timeout=0)
+    group.expect(products_page.title).to_have_text("Your Cart")
+    group.expect(products_page.error).to_be_visible()
+    group.expect(products_page.remember).to_be_checked()
+
+    with pytest.raises(AssertionError, match="2 of 3 expectations failed") as error:
+        group.verify()
+
+    assert "actual 'Products'" in str(error.value)
+    assert "actual 'hidden'" in str(error.value)
+
+
+# DOM_GENERATION_FUNCTION counts style changes and open shadow roots, not highlighting
+def test_dom_generation_tracks_styles_and_shadow_roots(page):
+    page.set_content('<button id="buy">Buy</button><div id="host"></div>')
+    generation = get_dom_generation(page)
+
+    style = highlight_element(page.locator("#buy"))
+    reset_element_style(page.locator("#buy"), style)
+    assert get_dom_generation(page) == generation
+
+    page.locator("#buy").evaluate("el => el.style.display = 'none'")
+    assert get_dom_generation(page) != generation
+
+    page.evaluate("""() => {
+        const host = document.createElement('section');
+        host.attachShadow({ mode: 'open' }).innerHTML = '<span>Cart</span>';
+        document.querySelector('#host').append(host);
+    }""")
+    generation = get_dom_generation(page)
+    page.evaluate("() => document.querySelector('section').shadowRoot.querySelector('span').textContent = 'Checkout'")
+    assert get_dom_generation(page) != generation
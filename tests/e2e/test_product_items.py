@@ -1,6 +1,8 @@
 import pytest
 from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
 from pages.product_items_page import ProductItemsPage
+from services.test_service import TestService
 from wrappers.smart_expect import expect
 
 @pytest.mark.parametrize("product,price", [
@@ -20,4 +22,17 @@ def test_product_items(page, config, product, price):
     expect(product_items_page.header).to_have_text('Swag Labs')
     product_items_page.set_keyword(product)
     expect(product_items_page.product_image).to_be_visible()
-    expect(product_items_page.product_price).to_have_text(price)
\ No newline at end of file
+    expect(product_items_page.product_price).to_have_text(price)
+
+
+def test_product_list_prices(page, config):
+    # With --scenario_cache=true the login steps are restored from the cached browser state
+    TestService().open_inventory_page(page, config, 'standard_user', 'secret_sauce')
+
+    inventory_page = InventoryPage(page, config)
+    inventory_page.inventory_items.expect_count(6)
+    inventory_page.inventory_items.expect_all_texts_match(r"^\$\d+\.\d{2}$", field="price")
+    inventory_page.verify_product_prices({
+        'Sauce Labs Bike Light': '$9.99',
+        'Sauce Labs Backpack': '$29.99',
+    })
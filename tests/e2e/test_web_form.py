@@ -4,13 +4,11 @@ from pages.web_form_page import WebFormPage
 from pages.web_form_result_page import WebFormResultPage
 from wrappers.smart_expect import expect
 
-WEB_FORM_URL = "https://www.selenium.dev/selenium/web/web-form.html"
-
 # This test is just for testing SmartPage, SmartLocator and SmartExcept
 def test_web_form_page(page, config):
     web_form_page = WebFormPage(page, config)
     # Verify web form default values
-    web_form_page.goto(WEB_FORM_URL)
+    web_form_page.goto(config["web_form_url"])
     expect(web_form_page.header).to_have_text('Web form')
     expect(web_form_page.disabled_input).to_have_value('')
     expect(web_form_page.readonly_input).to_have_value('Readonly input')
@@ -20,19 +18,20 @@ def test_web_form_page(page, config):
     expect(web_form_page.example_range).to_have_value('5')
 
     # Fill the form
-    web_form_page.text_input.fill('Text input')
-    web_form_page.password_input.fill('Secret')
-    web_form_page.textarea_input.fill('Some text in textarea')
-    web_form_page.textarea_input.fill('Some text in textarea')
-    web_form_page.dropdown_select.select_option('2')
-    web_form_page.dropdown_data_list.fill('Los Angeles')
-    web_form_page.file_input.set_input_files('README.md')
-    web_form_page.checkbox1.uncheck()
-    web_form_page.checkbox2.check()
-    web_form_page.radiobutton2.check()
-    web_form_page.color_picker.fill('#b21f75')
-    web_form_page.date_picker.fill('11/07/2025')
-    web_form_page.example_range.fill('3')
+    web_form_page.fill_fields({
+        "text_input": 'Text input',
+        "password_input": 'Secret',
+        "textarea_input": 'Some text in textarea',
+        "dropdown_select": '2',
+        "dropdown_data_list": 'Los Angeles',
+        "file_input": 'README.md',
+        "checkbox1": False,
+        "checkbox2": True,
+        "radiobutton2": True,
+        "color_picker": '#b21f75',
+        "date_picker": '11/07/2025',
+        "example_range": '3',
+    })
 
     # Verify new values on the form
     expect(web_form_page.text_input).to_have_value('Text input')
@@ -0,0 +1,908 @@
+"""
+In-memory fake of the Playwright sync API for browserless unit tests of the wrappers.
+
+FakePage parses HTML with html.parser into a small DOM. Locators resolve the selectors
+the wrapper tests use, chained with >>:
+- CSS: tag, #id, .class, [attr], [attr=value], [attr^=value], descendant and >
+  combinators and selector lists.
+- XPath (plain or with xpath=) in the forms the recorder generates: //tag and /tag
+  steps, .., [n], [last()], [@attr], [@attr='value'], [normalize-space(.)='value'],
+  [normalize-space(text())='value'], [contains(., 'value')] and (path)[n].
+- text= (case-insensitive substring, or exact when quoted) and nth= engines.
+
+Actions behave like a user on a static page without scripts: fill sets the value and
+click toggles checkboxes. Actions on missing, hidden or disabled elements fail at once
+with Playwright's TimeoutError instead of waiting.
+
+The fake runs no JavaScript. evaluate() calls the Python hooks a test registers with
+FakePage.add_evaluate_hook() and fails for any other script, page scripts of the
+wrappers are tested in a browser by tests/e2e/test_page_scripts.py. Tests relying on hooks are marked fake_contract:
+they check the wrappers against the behaviour the hook assumes, not the script itself.
+Methods without a fake implementation raise NotImplementedError.
+"""
+import re
+from functools import wraps
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from playwright.sync_api import ElementHandle, Error, Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+DEFAULT_TIMEOUT = 30000
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+                 "meta", "param", "source", "track", "wbr"}
+# Elements closed by a following sibling of the same kind
+AUTO_CLOSED_ELEMENTS = {"li", "option", "p", "tr", "td", "th"}
+# Elements never rendered and skipped by text matching
+HIDDEN_ELEMENTS = {"head", "script", "style", "template", "title", "meta", "link", "noscript"}
+DISABLEABLE_ELEMENTS = {"button", "input", "select", "textarea", "option", "fieldset"}
+# Input types without a text value to fill
+UNFILLABLE_INPUT_TYPES = {"checkbox", "radio", "file", "submit", "button", "reset", "image", "hidden"}
+
+
+# ---------------------------------------------------------------------
+# DOM
+# ---------------------------------------------------------------------
+
+class FakeText:
+    """Text node."""
+
+    def __init__(self, text: str, parent: "FakeElement"):
+        self.text = text
+        self.parent = parent
+
+
+class FakeElement:
+    """Element node with the DOM properties the fake actions change: value, checked, selected."""
+
+    def __init__(self, tag: str, attrs: dict = None, parent: "FakeElement" = None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []
+        self._value = None
+        self._checked = None
+        self._selected = None
+
+    def __repr__(self):
+        attrs = "".join(f" {name}={value!r}" for name, value in list(self.attrs.items())[:3])
+        return f"<FakeElement {self.tag}{attrs}>"
+
+    def iter(self):
+        """Descendant elements in document order."""
+        for child in self.children:
+            if isinstance(child, FakeElement):
+                yield child
+                yield from child.iter()
+
+    def ancestors(self) -> list:
+        """Parent elements up to the document, nearest first."""
+        result = []
+        node = self.parent
+        while node is not None:
+            result.append(node)
+            node = node.parent
+        return result
+
+    def is_connected(self) -> bool:
+        return (self.ancestors() or [self])[-1].tag == "#document"
+
+    @property
+    def text_content(self) -> str:
+        return "".join(child.text if isinstance(child, FakeText) else child.text_content
+                       for child in self.children)
+
+    @property
+    def inner_text(self) -> str:
+        """Text of rendered descendants, whitespace collapsed like to_have_text compares it."""
+        parts = [child.text if isinstance(child, FakeText) else child.inner_text
+                 for child in self.children if isinstance(child, FakeText) or child.is_visible()]
+        return normalize_whitespace(" ".join(parts))
+
+    @property
+    def input_type(self) -> str:
+        return self.attrs.get("type", "text").lower() if self.tag == "input" else ""
+
+    @property
+    def options(self) -> list:
+        return [element for element in self.iter() if element.tag == "option"]
+
+    @property
+    def value(self) -> str:
+        if self.tag == "select":
+            chosen = [option for option in self.options if option.selected] or self.options[:1]
+            return chosen[0].value if chosen else ""
+        if self._value is not None:
+            return self._value
+        if self.tag == "textarea":
+            return self.text_content
+        if self.tag == "option":
+            return self.attrs.get("value", normalize_whitespace(self.text_content))
+        return self.attrs.get("value", "on" if self.input_type in ("checkbox", "radio") else "")
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+
+    @property
+    def checked(self) -> bool:
+        return "checked" in self.attrs if self._checked is None else self._checked
+
+    @checked.setter
+    def checked(self, checked: bool):
+        self._checked = checked
+
+    @property
+    def selected(self) -> bool:
+        return "selected" in self.attrs if self._selected is None else self._selected
+
+    @selected.setter
+    def selected(self, selected: bool):
+        self._selected = selected
+
+    def is_visible(self) -> bool:
+        if not self.is_connected():
+            return False
+
+        for element in [self, *self.ancestors()]:
+            style = element.attrs.get("style", "").replace(" ", "").lower()
+            if (element.tag in HIDDEN_ELEMENTS or "hidden" in element.attrs or "display:none" in style
+                    or element.input_type == "hidden"):
+                return False
+        return True
+
+    def is_enabled(self) -> bool:
+        return not (self.tag in DISABLEABLE_ELEMENTS and "disabled" in self.attrs)
+
+    def is_editable(self) -> bool:
+        return self.is_enabled() and "readonly" not in self.attrs
+
+    def is_checkable(self) -> bool:
+        return self.input_type in ("checkbox", "radio")
+
+
+class _DomBuilder(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.document = FakeElement("#document")
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        if tag in AUTO_CLOSED_ELEMENTS and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+        element = FakeElement(tag, {name: "" if value is None else value for name, value in attrs},
+                              self.stack[-1])
+        self.stack[-1].children.append(element)
+
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(FakeText(data, self.stack[-1]))
+
+
+def parse_html(markup: str) -> FakeElement:
+    builder = _DomBuilder()
+    builder.feed(markup)
+    builder.close()
+    return builder.document
+
+
+def normalize_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+# ---------------------------------------------------------------------
+# Selectors
+# ---------------------------------------------------------------------
+
+_CSS_SIMPLE = re.compile(r"""
+    \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:.-]+)\s*(?:(?P<op>\^?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+""", re.VERBOSE)
+_CSS_TAG = re.compile(r"\*|[a-zA-Z][\w-]*")
+
+
+def query_selector_all(scope: FakeElement, selector: str) -> list:
+    """Elements matching a selector (chained with >>) inside scope, in document order."""
+    elements = [scope]
+
+    for part in (part.strip() for part in selector.split(">>")):
+        if part.startswith("nth="):
+            index = int(part[4:])
+            elements = elements[index:index + 1 or None] if -len(elements) <= index < len(elements) else []
+            continue
+
+        query, body = _get_engine(part)
+        found = {id(element) for scope_ in elements for element in query(scope_, body)}
+        root = (elements[0].ancestors() or elements)[-1] if elements else scope
+        elements = [element for element in root.iter() if id(element) in found]
+
+    return elements
+
+
+def _get_engine(selector: str) -> tuple:
+    """Query function and selector body of one part of a chained selector."""
+    if selector.startswith("text="):
+        return query_text, selector[5:].strip()
+    if selector.startswith("xpath="):
+        return query_xpath, selector[6:].strip()
+    if selector.startswith(("/", "(", "..")):
+        return query_xpath, selector
+    return query_css, selector
+
+
+def query_text(scope: FakeElement, text: str) -> list:
+    """Smallest visible elements whose text matches: no child element matches as well."""
+    if len(text) > 1 and text[0] == text[-1] and text[0] in "\"'":
+        expected = normalize_whitespace(text[1:-1])
+        matches = lambda element: normalize_whitespace(element.text_content) == expected
+    else:
+        expected = normalize_whitespace(text).lower()
+        matches = lambda element: expected in normalize_whitespace(element.text_content).lower()
+
+    return [element for element in scope.iter()
+            if element.tag not in HIDDEN_ELEMENTS and matches(element)
+            and not any(matches(child) for child in element.iter())]
+
+
+def query_css(scope: FakeElement, selector: str) -> list:
+    selectors = [_parse_complex_selector(part) for part in selector.split(",")]
+    return [element for element in scope.iter() if any(_matches_complex(element, steps) for steps in selectors)]
+
+
+def _parse_complex_selector(selector: str) -> list:
+    """Compound selectors with the combinator before each one: [(combinator, compound)]."""
+    steps, combinator = [], " "
+
+    for token in re.findall(r">|[^\s>]+", selector.strip()):
+        if token == ">":
+            combinator = ">"
+            continue
+        steps.append((combinator, _parse_compound(token)))
+        combinator = " "
+
+    return steps
+
+
+def _parse_compound(text: str) -> list:
+    match = _CSS_TAG.match(text)
+    conditions = [("tag", match.group(0).lower())] if match and match.group(0) != "*" else []
+    position = match.end() if match else 0
+
+    while position < len(text):
+        match = _CSS_SIMPLE.match(text, position)
+        if not match:
+            raise Error(f"Fake page does not support the CSS selector '{text}'")
+        position = match.end()
+
+        if match.group("id"):
+            conditions.append(("attr", "id", "=", match.group("id")))
+        elif match.group("cls"):
+            conditions.append(("class", match.group("cls")))
+        else:
+            value = next((group for group in match.group("dq", "sq", "bare") if group is not None), None)
+            conditions.append(("attr", match.group("attr"), match.group("op"), value))
+
+    return conditions
+
+
+def _matches_compound(element: FakeElement, conditions: list) -> bool:
+    for condition in conditions:
+        if condition[0] == "tag" and element.tag != condition[1]:
+            return False
+        if condition[0] == "class" and condition[1] not in element.attrs.get("class", "").split():
+            return False
+        if condition[0] == "attr":
+            _, name, op, value = condition
+            actual = element.attrs.get(name)
+            if actual is None or (op == "=" and actual != value) or (op == "^=" and not actual.startswith(value)):
+                return False
+    return True
+
+
+def _matches_complex(element: FakeElement, steps: list) -> bool:
+    """Matches the last compound on element and the earlier ones on its ancestors."""
+    combinator, conditions = steps[-1]
+
+    if not _matches_compound(element, conditions):
+        return False
+    if len(steps) == 1:
+        return True
+
+    parents = [parent for parent in element.ancestors() if parent.tag != "#document"]
+    candidates = parents[:1] if combinator == ">" else parents
+    return any(_matches_complex(parent, steps[:-1]) for parent in candidates)
+
+
+# --- XPath ---
+
+_XPATH_STEP = re.compile(r"(//|/)?(\.\.|\.|\*|[a-zA-Z][\w-]*)")
+_XPATH_LITERAL = r"""(?:'(?P<sq>[^']*)'|"(?P<dq>[^"]*)")"""
+# Left-hand sides of text and attribute predicates
+_XPATH_OPERAND = r"(?P<operand>@[\w:.-]+|text\(\)|\.|normalize-space\((?:\.|text\(\))?\))"
+_XPATH_EQUALS = re.compile(rf"{_XPATH_OPERAND}\s*=\s*{_XPATH_LITERAL}")
+_XPATH_CONTAINS = re.compile(rf"contains\(\s*{_XPATH_OPERAND}\s*,\s*{_XPATH_LITERAL}\s*\)")
+
+
+def query_xpath(scope: FakeElement, selector: str) -> list:
+    """
+    XPath subset of the selectors the recorder generates, relative to scope like chained
+    Playwright XPath: / and // steps with tag or *, .. and ., predicates [n], [last()],
+    [@attr], [operand='value'] and [contains(operand, 'value')] where operand is @attr,
+    text(), . or normalize-space() of . or text(), and (path)[n].
+    """
+    match = re.fullmatch(r"\((.*)\)\[(\d+)\]", selector.strip(), re.DOTALL)
+    path, index = (match.group(1), int(match.group(2))) if match else (selector.strip(), None)
+    nodes = [scope]
+    position = 0
+
+    while position < len(path):
+        step = _XPATH_STEP.match(path, position)
+        if not step:
+            raise Error(f"Fake page does not support the XPath selector '{selector}'")
+        predicates, position = _read_predicates(path, step.end(), selector)
+        nodes = _select_step(nodes, step.group(1), step.group(2), predicates)
+
+    if index is not None:
+        nodes = nodes[index - 1:index]
+    return nodes
+
+
+def _read_predicates(path: str, position: int, selector: str) -> tuple:
+    """Bracketed predicates from position, brackets inside quotes included: (predicates, end)."""
+    predicates = []
+
+    while position < len(path) and path[position] == "[":
+        quote, end = None, position + 1
+        while end < len(path) and (quote or path[end] != "]"):
+            if path[end] in "\"'":
+                quote = None if quote == path[end] else quote or path[end]
+            end += 1
+        if end == len(path):
+            raise Error(f"Fake page does not support the XPath selector '{selector}'")
+        predicates.append(path[position + 1:end].strip())
+        position = end + 1
+
+    return predicates, position
+
+
+def _select_step(nodes: list, separator: str, test: str, predicates: list) -> list:
+    result = []
+
+    for node in nodes:
+        if test == "..":
+            groups = [[node.parent]] if node.parent is not None and node.parent.tag != "#document" else []
+        elif test == ".":
+            groups = [[node]]
+        else:
+            # Positions of [n] count per parent, like child::tag[n]
+            parents = [node, *node.iter()] if separator == "//" else [node]
+            groups = [[child for child in parent.children if isinstance(child, FakeElement)
+                       and (test == "*" or child.tag == test.lower())] for parent in parents]
+
+        for group in groups:
+            for predicate in predicates:
+                group = _filter_predicate(group, predicate)
+            result.extend(element for element in group if element not in result)
+
+    order = {id(element): index for index, element in
+             enumerate(result[0].ancestors()[-1].iter() if result and result[0].ancestors() else [])}
+    return sorted(result, key=lambda element: order.get(id(element), -1))
+
+
+def _filter_predicate(elements: list, predicate: str) -> list:
+    if predicate.isdigit():
+        return elements[int(predicate) - 1:int(predicate)]
+    if predicate == "last()":
+        return elements[-1:]
+    if re.fullmatch(r"@[\w:.-]+", predicate):
+        return [element for element in elements if predicate[1:] in element.attrs]
+
+    for pattern, compare in ((_XPATH_EQUALS, lambda actual, value: actual == value),
+                             (_XPATH_CONTAINS, lambda actual, value: value in actual)):
+        match = pattern.fullmatch(predicate)
+        if match:
+            value = match.group("sq") if match.group("sq") is not None else match.group("dq")
+            return [element for element in elements
+                    if any(compare(actual, value) for actual in _get_operand(element, match.group("operand")))]
+
+    raise Error(f"Fake page does not support the XPath predicate '[{predicate}]'")
+
+
+def _get_operand(element: FakeElement, operand: str) -> list:
+    """String values of a predicate operand, text() has one per direct text node."""
+    texts = [child.text for child in element.children if isinstance(child, FakeText)]
+
+    if operand.startswith("@"):
+        return [element.attrs[operand[1:]]] if operand[1:] in element.attrs else []
+    if operand == "text()":
+        return texts
+    if operand == "normalize-space(text())":
+        return [normalize_whitespace(texts[0] if texts else "")]
+    if operand == ".":
+        return [element.text_content]
+    return [normalize_whitespace(element.text_content)]
+
+
+# ---------------------------------------------------------------------
+# Playwright API
+# ---------------------------------------------------------------------
+
+class _Unsupported:
+    """Implementation object of the fakes: Playwright methods without a fake fail clearly."""
+
+    def __init__(self, owner: str):
+        self._owner = owner
+        self._loop = None
+        self._dispatcher_fiber = None
+
+    def __getattr__(self, name):
+        raise NotImplementedError(f"{self._owner} does not implement '{name}'")
+
+
+class _ElementActions:
+    """Actions and queries shared by FakeLocator (strict, resolved per call) and FakeElementHandle."""
+
+    _page: "FakePage"
+    _api_name: str
+
+    def _resolve(self, action: str, timeout=None) -> FakeElement:
+        raise NotImplementedError
+
+    def _fail_timeout(self, action: str, timeout, reason: str):
+        raise PlaywrightTimeoutError(
+            f"{self._api_name}.{action}: Timeout {timeout or DEFAULT_TIMEOUT}ms exceeded.\n"
+            f"Call log:\n  - waiting for {self!r}\n  - {reason}")
+
+    def _actionable(self, action: str, timeout, editable: bool = False) -> FakeElement:
+        element = self._resolve(action, timeout)
+
+        if not element.is_visible():
+            self._fail_timeout(action, timeout, "element is not visible")
+        if not element.is_enabled():
+            self._fail_timeout(action, timeout, "element is not enabled")
+        if editable and not element.is_editable():
+            self._fail_timeout(action, timeout, "element is not editable")
+        return element
+
+    @property
+    def page(self) -> "FakePage":
+        return self._page
+
+    # --- Actions ---
+
+    def click(self, *, timeout: float = None, **options) -> None:
+        element = self._actionable("click", timeout)
+        self._page._record("click", element)
+
+        if element.input_type == "checkbox":
+            element.checked = not element.checked
+        elif element.input_type == "radio":
+            element.checked = True
+
+    def hover(self, *, timeout: float = None, **options) -> None:
+        self._page._record("hover", self._actionable("hover", timeout))
+
+    def focus(self, *, timeout: float = None) -> None:
+        self._page._record("focus", self._resolve("focus", timeout))
+
+    def fill(self, value: str, *, timeout: float = None, **options) -> None:
+        element = self._actionable("fill", timeout, editable=True)
+
+        if element.tag not in ("input", "textarea") or element.input_type in UNFILLABLE_INPUT_TYPES:
+            raise Error(f"{self._api_name}.fill: Error: Element is not an <input>, <textarea> "
+                        f"or [contenteditable] element")
+
+        element.value = str(value)
+        self._page._record("fill", element, value)
+
+    def clear(self, *, timeout: float = None, **options) -> None:
+        self.fill("", timeout=timeout)
+
+    def check(self, *, timeout: float = None, **options) -> None:
+        self.set_checked(True, timeout=timeout)
+
+    def uncheck(self, *, timeout: float = None, **options) -> None:
+        self.set_checked(False, timeout=timeout)
+
+    def set_checked(self, checked: bool, *, timeout: float = None, **options) -> None:
+        element = self._actionable("set_checked", timeout)
+
+        if not element.is_checkable():
+            raise Error(f"{self._api_name}.set_checked: Error: Not a checkbox or radio button")
+        if element.checked != checked:
+            self.click(timeout=timeout)
+
+    def select_option(self, value=None, *, label=None, timeout: float = None, **options) -> list:
+        element = self._actionable("select_option", timeout)
+
+        if element.tag != "select":
+            raise Error(f"{self._api_name}.select_option: Error: Element is not a <select> element")
+
+        # Plain values match option values or labels, like in Playwright
+        wanted = [item for item in (value, label) if item is not None]
+        wanted = [item for items in wanted for item in ([items] if isinstance(items, str) else items)]
+        chosen = [option for option in element.options
+                  if option.value in wanted or normalize_whitespace(option.text_content) in wanted]
+
+        if not chosen:
+            self._fail_timeout("select_option", timeout, "did not find some options")
+        if "multiple" not in element.attrs:
+            chosen = chosen[:1]
+
+        for option in element.options:
+            option.selected = option in chosen
+
+        self._page._record("select_option", element, [option.value for option in chosen])
+        return [option.value for option in chosen]
+
+    def set_input_files(self, files, *, timeout: float = None, **options) -> None:
+        element = self._resolve("set_input_files", timeout)
+
+        if element.input_type != "file":
+            raise Error(f"{self._api_name}.set_input_files: Error: Node is not an HTMLInputElement")
+        element.value = ", ".join(map(str, files)) if isinstance(files, (list, tuple)) else str(files)
+        self._page._record("set_input_files", element, files)
+
+    # --- Queries ---
+
+    def inner_text(self, *, timeout: float = None) -> str:
+        return self._resolve("inner_text", timeout).inner_text
+
+    def text_content(self, *, timeout: float = None) -> str:
+        return self._resolve("text_content", timeout).text_content
+
+    def input_value(self, *, timeout: float = None) -> str:
+        element = self._resolve("input_value", timeout)
+
+        if element.tag not in ("input", "textarea", "select"):
+            raise Error(f"{self._api_name}.input_value: Error: Node is not an <input>, <textarea> "
+                        f"or <select> element")
+        return element.value
+
+    def get_attribute(self, name: str, *, timeout: float = None) -> str | None:
+        return self._resolve("get_attribute", timeout).attrs.get(name.lower())
+
+    def is_visible(self, *, timeout: float = None) -> bool:
+        element = self._resolve_optional()
+        return element is not None and element.is_visible()
+
+    def is_hidden(self, *, timeout: float = None) -> bool:
+        return not self.is_visible()
+
+    def is_enabled(self, *, timeout: float = None) -> bool:
+        return self._resolve("is_enabled", timeout).is_enabled()
+
+    def is_disabled(self, *, timeout: float = None) -> bool:
+        return not self.is_enabled(timeout=timeout)
+
+    def is_checked(self, *, timeout: float = None) -> bool:
+        element = self._resolve("is_checked", timeout)
+
+        if not element.is_checkable():
+            raise Error(f"{self._api_name}.is_checked: Error: Not a checkbox or radio button")
+        return element.checked
+
+    def evaluate(self, expression: str, arg=None, *, timeout: float = None):
+        return self._page._run_evaluate_hook(expression, self._resolve("evaluate", timeout), arg)
+
+
+class FakeElementHandle(_ElementActions, ElementHandle):
+    """ElementHandle of one fake DOM element, it fails like Playwright once detached."""
+
+    _api_name = "ElementHandle"
+
+    def __init__(self, page: "FakePage", element: FakeElement):
+        self._impl_obj = _Unsupported("FakeElementHandle")
+        self._page = page
+        self.element = element
+        self.disposed = False
+
+    def __repr__(self):
+        return f"<FakeElementHandle {self.element!r}>"
+
+    __str__ = __repr__
+
+    def _resolve(self, action: str, timeout=None) -> FakeElement:
+        if self.disposed or not self.element.is_connected():
+            raise Error(f"ElementHandle.{action}: Element is not attached to the DOM")
+        return self.element
+
+    def _resolve_optional(self) -> FakeElement | None:
+        return self.element if not self.disposed and self.element.is_connected() else None
+
+    def dispose(self) -> None:
+        self.disposed = True
+
+
+class FakeLocator(_ElementActions, Locator):
+    """Locator resolving its selector against the fake DOM on every call, like Playwright."""
+
+    _api_name = "Locator"
+
+    def __init__(self, page: "FakePage", selector: str):
+        self._impl_obj = _Unsupported("FakeLocator")
+        self._page = page
+        self._selector = selector
+
+    def __repr__(self):
+        return f"locator('{self._selector}')"
+
+    __str__ = __repr__
+
+    def _resolve_all(self) -> list:
+        return query_selector_all(self._page.document, self._selector)
+
+    def _resolve(self, action: str, timeout=None) -> FakeElement:
+        elements = self._resolve_all()
+
+        if not elements:
+            self._fail_timeout(action, timeout, "element not found")
+        if len(elements) > 1:
+            raise Error(f"Locator.{action}: Error: strict mode violation: {self!r} "
+                        f"resolved to {len(elements)} elements")
+        return elements[0]
+
+    def _resolve_optional(self) -> FakeElement | None:
+        elements = self._resolve_all()
+        if len(elements) > 1:
+            raise Error(f"Locator.is_visible: Error: strict mode violation: {self!r} "
+                        f"resolved to {len(elements)} elements")
+        return elements[0] if elements else None
+
+    def locator(self, selector: str) -> "FakeLocator":
+        return FakeLocator(self._page, f"{self._selector} >> {selector}")
+
+    def nth(self, index: int) -> "FakeLocator":
+        return FakeLocator(self._page, f"{self._selector} >> nth={index}")
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self.nth(0)
+
+    @property
+    def last(self) -> "FakeLocator":
+        return self.nth(-1)
+
+    def count(self) -> int:
+        return len(self._resolve_all())
+
+    def element_handle(self, *, timeout: float = None) -> FakeElementHandle:
+        return FakeElementHandle(self._page, self._resolve("element_handle", timeout))
+
+    def element_handles(self) -> list:
+        return [FakeElementHandle(self._page, element) for element in self._resolve_all()]
+
+    def evaluate_all(self, expression: str, arg=None):
+        return self._page._run_evaluate_hook(expression, self._resolve_all(), arg)
+
+    def wait_for(self, *, state: str = None, timeout: float = None) -> None:
+        elements = self._resolve_all()
+        state = state or "visible"
+        satisfied = {
+            "attached": bool(elements),
+            "detached": not elements,
+            "visible": any(element.is_visible() for element in elements),
+            "hidden": not any(element.is_visible() for element in elements),
+        }[state]
+
+        if not satisfied:
+            self._fail_timeout("wait_for", timeout, f"waiting for element to be {state}")
+
+
+class FakePage(Page):
+    """
+    Page showing HTML from set_content() or from routes, a dict of URL -> HTML served by goto().
+    Every action is recorded in page.actions as (action, element, value).
+    """
+
+    def __init__(self, html: str = "", url: str = "about:blank", routes: dict = None):
+        self._impl_obj = _Unsupported("FakePage")
+        self.routes = dict(routes or {})
+        self.actions = []
+        self._evaluate_hooks = []
+        self._url = url
+        self.document = FakeElement("#document")
+        self.set_content(html or self.routes.get(url, ""))
+
+    def __repr__(self):
+        return f"<FakePage url={self._url!r}>"
+
+    __str__ = __repr__
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    def set_content(self, html: str, *, timeout: float = None, wait_until: str = None) -> None:
+        # Elements of the replaced document are detached, like after a navigation
+        for child in self.document.children:
+            child.parent = None
+        self.document = parse_html(html)
+
+    def title(self) -> str:
+        titles = [element for element in self.document.iter() if element.tag == "title"]
+        return normalize_whitespace(titles[0].text_content) if titles else ""
+
+    def goto(self, url: str, *, timeout: float = None, wait_until: str = None, referer: str = None):
+        target = urljoin(self._url, url) if self._url != "about:blank" else url
+
+        if target not in self.routes:
+            raise Error(f"Page.goto: net::ERR_NAME_NOT_RESOLVED at {target}")
+
+        self._url = target
+        self.set_content(self.routes[target])
+        self._record("goto", None, target)
+        return None
+
+    def reload(self, *, timeout: float = None, wait_until: str = None):
+        if self._url in self.routes:
+            self.set_content(self.routes[self._url])
+        return None
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        pass
+
+    def wait_for_load_state(self, state: str = None, *, timeout: float = None) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return False
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self, selector)
+
+    def evaluate(self, expression: str, arg=None):
+        return self._run_evaluate_hook(expression, None, arg)
+
+    def add_evaluate_hook(self, pattern, handler) -> None:
+        """
+        Runs handler(target, arg) for evaluate() scripts containing pattern (a substring or a
+        compiled regex). target is the FakeElement of locator.evaluate(), the list of elements
+        of evaluate_all() and None for page.evaluate(). Hooks added later take precedence.
+        """
+        self._evaluate_hooks.insert(0, (pattern, handler))
+
+    def _run_evaluate_hook(self, expression: str, target, arg):
+        for pattern, handler in self._evaluate_hooks:
+            if pattern.search(expression) if isinstance(pattern, re.Pattern) else pattern in expression:
+                return handler(target, arg)
+
+        raise NotImplementedError(f"No evaluate hook of the fake page matches: {expression.strip()[:80]}")
+
+    def _record(self, action: str, element: FakeElement | None, value=None):
+        self.actions.append((action, element, value))
+
+
+# ---------------------------------------------------------------------
+# Assertions
+# ---------------------------------------------------------------------
+
+def _matches_expected(actual: str | None, expected, substring: bool = False) -> bool:
+    if actual is None:
+        return False
+    if isinstance(expected, re.Pattern):
+        return bool(expected.search(actual))
+
+    actual, expected = normalize_whitespace(actual), normalize_whitespace(str(expected))
+    return expected in actual if substring else actual == expected
+
+
+def _negated(matcher):
+    """not_to_* variant of a matcher, with its signature for utils.code_utils.normalize_args()."""
+    @wraps(matcher)
+    def negated_matcher(self, *args, **kwargs):
+        return matcher(type(self)(self._actual, self._message, is_not=True), *args, **kwargs)
+
+    negated_matcher.__name__ = f"not_{matcher.__name__}"
+    return negated_matcher
+
+
+class _FakeAssertions:
+    """Matchers check the fake DOM once, a static page would not change while Playwright polls."""
+
+    _subject = "Value"
+
+    def __init__(self, actual, message: str = None, is_not: bool = False):
+        self._actual = actual
+        self._message = message
+        self._is_not = is_not
+
+    def _check(self, passed: bool, description: str, expected, actual):
+        if passed == self._is_not:
+            negation = "not " if self._is_not else ""
+            raise AssertionError(self._message or f"{self._subject} expected {negation}{description} "
+                                                  f"'{expected}'\nActual value: {actual}")
+
+
+class FakeLocatorAssertions(_FakeAssertions):
+
+    _subject = "Locator"
+
+    def _element(self):
+        """The single element of the locator, or the reason why there is none as a string."""
+        elements = self._actual._resolve_all()
+        if len(elements) > 1:
+            return f"strict mode violation: {len(elements)} elements"
+        return elements[0] if elements else "element not found"
+
+    def _check_value(self, description: str, expected, get_actual, substring: bool = False):
+        element = self._element()
+        actual = get_actual(element) if isinstance(element, FakeElement) else element
+        passed = isinstance(element, FakeElement) and _matches_expected(actual, expected, substring)
+        self._check(passed, description, expected, actual)
+
+    def to_have_text(self, expected, *, use_inner_text: bool = None, timeout: float = None) -> None:
+        self._check_value("to have text", expected, lambda element: element.text_content)
+
+    def to_contain_text(self, expected, *, use_inner_text: bool = None, timeout: float = None) -> None:
+        self._check_value("to contain text", expected, lambda element: element.text_content, substring=True)
+
+    def to_have_value(self, value, *, timeout: float = None) -> None:
+        self._check_value("to have value", value, lambda element: element.value)
+
+    def to_have_count(self, count: int, *, timeout: float = None) -> None:
+        actual = len(self._actual._resolve_all())
+        self._check(actual == count, "to have count", count, actual)
+
+    def _check_state(self, description: str, state, expected: bool = True):
+        element = self._element()
+        actual = state(element) if isinstance(element, FakeElement) else False
+        self._check(actual == expected, "to be", description, description if actual else f"not {description}")
+
+    def to_be_visible(self, *, visible: bool = None, timeout: float = None) -> None:
+        self._check_state("visible", FakeElement.is_visible, visible is not False)
+
+    def to_be_hidden(self, *, timeout: float = None) -> None:
+        self._check_state("visible", FakeElement.is_visible, False)
+
+    def to_be_checked(self, *, checked: bool = None, timeout: float = None) -> None:
+        self._check_state("checked", lambda element: element.checked, checked is not False)
+
+    def to_be_enabled(self, *, enabled: bool = None, timeout: float = None) -> None:
+        self._check_state("enabled", FakeElement.is_enabled, enabled is not False)
+
+    def to_be_disabled(self, *, timeout: float = None) -> None:
+        self._check_state("enabled", FakeElement.is_enabled, False)
+
+
+class FakePageAssertions(_FakeAssertions):
+
+    _subject = "Page"
+
+    def to_have_url(self, url_or_reg_exp, *, timeout: float = None) -> None:
+        actual = self._actual.url
+        self._check(_matches_expected(actual, url_or_reg_exp), "to have URL", url_or_reg_exp, actual)
+
+    def to_have_title(self, title_or_reg_exp, *, timeout: float = None) -> None:
+        actual = self._actual.title()
+        self._check(_matches_expected(actual, title_or_reg_exp), "to have title", title_or_reg_exp, actual)
+
+
+for _assertions in (FakeLocatorAssertions, FakePageAssertions):
+    for _name, _matcher in list(vars(_assertions).items()):
+        if _name.startswith("to_"):
+            setattr(_assertions, f"not_{_name}", _negated(_matcher))
+
+
+def expect(actual, message: str = None):
+    """playwright.sync_api.expect() for fake locators and pages."""
+    if isinstance(actual, FakeLocator):
+        return FakeLocatorAssertions(actual, message)
+    if isinstance(actual, FakePage):
+        return FakePageAssertions(actual, message)
+    raise NotImplementedError(f"Fake expect() does not support {type(actual).__name__}")
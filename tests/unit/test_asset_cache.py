@@ -0,0 +1,124 @@
+from unittest.mock import Mock, patch
+from helpers.asset_cache import AssetCache, get_freshness_lifetime, is_cacheable
+
+URL = "https://www.saucedemo.com/static/js/main.js"
+BODY = b"console.log('app');"
+
+
+def make_route(url=URL, resource_type="script", method="GET"):
+    route = Mock()
+    route.request.url = url
+    route.request.method = method
+    route.request.resource_type = resource_type
+    route.request.headers = {"accept": "*/*"}
+    return route
+
+
+def make_response(status=200, headers=None, body=BODY):
+    response = Mock(status=status, headers=headers or {}, body=Mock(return_value=body))
+    return response
+
+
+def test_non_asset_requests_fall_back():
+    cache, route = AssetCache("unused"), make_route(resource_type="document")
+
+    cache.handle(route)
+
+    route.fallback.assert_called_once()
+    route.fetch.assert_not_called()
+
+
+def test_fresh_asset_is_served_from_disk_across_instances(tmp_path):
+    cache = AssetCache(tmp_path)
+    route = make_route()
+    route.fetch.return_value = make_response(
+        headers={"cache-control": "max-age=600", "content-type": "text/javascript",
+                 "content-encoding": "gzip"})
+
+    cache.handle(route)
+    cache.save()
+
+    assert cache.stats["misses"] == 1 and cache.stats["stored"] == 1
+    route.fulfill.assert_called_once_with(response=route.fetch.return_value)
+
+    # A later session loads the saved index
+    next_session, route = AssetCache(tmp_path), make_route()
+    next_session.handle(route)
+
+    route.fetch.assert_not_called()
+    route.fulfill.assert_called_once_with(
+        status=200, headers={"cache-control": "max-age=600", "content-type": "text/javascript"},
+        body=BODY)
+    assert next_session.stats["bytes_saved"] == len(BODY)
+    assert next_session.get_hit_ratio() == 1.0
+
+
+def test_stale_asset_is_revalidated(tmp_path):
+    cache = AssetCache(tmp_path)
+    route = make_route()
+    route.fetch.return_value = make_response(headers={"cache-control": "no-cache", "etag": '"v1"'})
+    cache.handle(route)
+
+    route = make_route()
+    route.fetch.return_value = make_response(status=304, headers={"cache-control": "max-age=60"})
+    cache.handle(route)
+
+    assert route.fetch.call_args.kwargs["headers"]["if-none-match"] == '"v1"'
+    assert route.fulfill.call_args.kwargs["body"] == BODY
+    assert cache.stats["revalidated"] == 1
+    assert cache.index[URL]["expires_at"] > 0
+
+
+def test_no_store_response_is_not_cached(tmp_path):
+    cache, route = AssetCache(tmp_path), make_route()
+    route.fetch.return_value = make_response(headers={"cache-control": "no-store", "etag": '"v1"'})
+
+    cache.handle(route)
+
+    assert cache.index == {}
+
+
+def test_lru_entries_are_evicted_above_max_size(tmp_path):
+    cache = AssetCache(tmp_path, max_bytes=2 * (len(BODY) + 1))
+
+    for index in range(3):
+        route = make_route(url=f"https://www.saucedemo.com/{index}.js")
+        route.fetch.return_value = make_response(headers={"cache-control": "max-age=600"},
+                                                 body=BODY + bytes([index]))
+        with patch("helpers.asset_cache.time.time", return_value=1000.0 + index):
+            cache.handle(route)
+
+    assert sorted(cache.index) == ["https://www.saucedemo.com/1.js", "https://www.saucedemo.com/2.js"]
+    assert cache.stats["evicted"] == 1
+    assert len([p for p in (tmp_path / "objects").rglob("*") if p.is_file()]) == 2
+
+
+def test_same_content_is_stored_once(tmp_path):
+    cache = AssetCache(tmp_path)
+
+    for url in ("https://a.example/app.js", "https://b.example/app.js"):
+        route = make_route(url=url)
+        route.fetch.return_value = make_response(headers={"cache-control": "max-age=600"})
+        cache.handle(route)
+
+    assert len(cache.index) == 2
+    assert len([p for p in (tmp_path / "objects").rglob("*") if p.is_file()]) == 1
+
+
+def test_freshness_lifetime():
+    assert get_freshness_lifetime({"cache-control": "public, max-age=300"}) == 300
+    assert get_freshness_lifetime({"cache-control": "no-cache, max-age=300"}) == 0
+    assert get_freshness_lifetime({"date": "Mon, 01 Jan 2024 00:00:00 GMT",
+                                   "expires": "Mon, 01 Jan 2024 01:00:00 GMT"}) == 3600
+    assert get_freshness_lifetime({"date": "Thu, 11 Jan 2024 00:00:00 GMT",
+                                   "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}) == 86400
+    assert get_freshness_lifetime({}) == 0
+
+
+def test_is_cacheable():
+    assert is_cacheable(200, {"cache-control": "max-age=60"})
+    assert is_cacheable(200, {"etag": '"v1"'})
+    assert not is_cacheable(200, {})
+    assert not is_cacheable(206, {"cache-control": "max-age=60"})
+    assert not is_cacheable(200, {"cache-control": "private, max-age=60"})
+    assert not is_cacheable(200, {"cache-control": "max-age=60", "vary": "Cookie"})
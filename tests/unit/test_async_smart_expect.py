@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+from wrappers.async_smart_expect import AsyncSmartExpect
+from wrappers.smart_expect import SmartExpect, ExpectGroup, expect, expect_all
+from wrappers.smart_locator import SmartLocator, FIXED_SELECTORS
+
+
+@pytest.fixture
+def async_locator():
+    """Creates a SmartLocator bound to a mocked async Playwright page."""
+    FIXED_SELECTORS.clear()
+    owner = Mock()
+    owner.page = Mock(spec=AsyncPage)
+    owner.page.locator.return_value = Mock(spec=AsyncLocator)
+    owner.page.locator.return_value.page = owner.page
+    owner.config = {"timeout": 0}
+    owner.placeholder_manager = Mock()
+    owner.placeholder_manager.replace_placeholders_with_values.side_effect = \
+        lambda x: x.replace("#TITLE#", "Swag Labs")
+    owner.get_keyword.return_value = None
+    owner.keyword = None
+    return SmartLocator(owner, "div.app_logo")
+
+
+def test_expect_returns_async_variant(async_locator, monkeypatch):
+    inner = Mock()
+    monkeypatch.setattr("wrappers.async_smart_expect.pw_async_expect", lambda actual: inner)
+
+    async def to_have_text(expected):
+        inner.checked = expected
+
+    inner.to_have_text = to_have_text
+    assertion = expect(async_locator)
+
+    asyncio.run(assertion.to_have_text("#TITLE#"))
+
+    assert isinstance(assertion, AsyncSmartExpect)
+    assert inner.checked == "Swag Labs"
+
+
+def test_expect_with_sync_objects_returns_smart_expect(monkeypatch):
+    monkeypatch.setattr("wrappers.smart_expect.pw_expect", lambda actual: Mock())
+    sync_locator = Mock(spec=SmartLocator)
+    sync_locator.page = Mock()
+    sync_locator.cache_key = "Page.header"
+    sync_locator.placeholder_manager = Mock()
+
+    assert type(expect(sync_locator)) is SmartExpect
+
+
+def test_group_verify_is_awaited_for_async_pages(async_locator):
+    page = async_locator.page
+    page.evaluate.return_value = {"generation": "doc:1", "stale": False,
+                                  "results": [{"pass": True, "actual": "Swag Labs"}]}
+
+    async def verify():
+        async with SmartExpect.group() as group:
+            group.expect(async_locator).to_have_text("#TITLE#")
+
+    asyncio.run(verify())
+
+    page.evaluate.assert_awaited_once()
+    assert page.evaluate.await_args[0][1]["checks"][0]["expected"] == {"text": "Swag Labs"}
+
+
+def test_group_verify_disposes_handles_for_async_pages(async_locator):
+    handle = Mock(dispose=AsyncMock())
+    async_locator.page.locator.return_value.element_handles.return_value = [handle]
+    async_locator.page.evaluate.return_value = {"generation": "doc:1", "stale": False,
+                                                "results": [{"pass": False, "actual": "Cart"}]}
+    group = ExpectGroup()
+    group.expect(async_locator).to_have_text("Swag Labs")
+
+    with pytest.raises(AssertionError):
+        asyncio.run(group.verify())
+
+    handle.dispose.assert_awaited_once()
+
+
+def test_expect_all_reports_failures_for_async_pages(async_locator):
+    async_locator.page.evaluate.return_value = {"generation": "doc:1", "stale": False,
+                                                "results": [{"pass": False, "actual": "Cart"}]}
+
+    with pytest.raises(AssertionError, match="1 of 1 expectations failed"):
+        asyncio.run(expect_all([(async_locator, "to_have_text", "Swag Labs")]))
+
+
+def test_sync_with_block_rejects_async_pages(async_locator):
+    group = ExpectGroup()
+    group.expect(async_locator).to_be_visible()
+
+    with pytest.raises(TypeError):
+        with group:
+            pass
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+from wrappers.async_smart_component import AsyncSmartComponent
+from wrappers.async_smart_locator import AsyncSmartLocator
+from wrappers.async_smart_locator_list import AsyncSmartLocatorList
+from wrappers.smart_component import SmartComponent
+from wrappers.smart_locator import SmartLocator, FIXED_SELECTORS
+from wrappers.smart_locator_list import SmartLocatorList
+
+
+class ProductCard(SmartComponent):
+
+    def __init__(self, owner, root_selector):
+        super().__init__(owner, root_selector)
+        self.price = SmartLocator(self, ".price")
+
+
+@pytest.fixture
+def async_owner():
+    """Creates a page object owner bound to a mocked async Playwright page."""
+    FIXED_SELECTORS.clear()
+    owner = Mock()
+    owner.page = Mock(spec=AsyncPage)
+    owner.page.locator.return_value = Mock(spec=AsyncLocator)
+    owner.config = {"timeout": 0}
+    owner.placeholder_manager = Mock()
+    owner.placeholder_manager.replace_placeholders_with_values.side_effect = \
+        lambda x: x.replace("#USER#", "standard_user")
+    owner.keyword = None
+    owner.get_keyword.return_value = None
+    return owner
+
+
+def test_locator_action_is_awaited_with_placeholders(async_owner):
+    username_input = SmartLocator(async_owner, "#user-name")
+    locator = async_owner.page.locator.return_value
+
+    asyncio.run(username_input.fill("#USER#"))
+
+    assert isinstance(username_input, AsyncSmartLocator)
+    locator.fill.assert_awaited_once_with("standard_user")
+
+
+def test_locator_builders_are_returned_unwrapped(async_owner):
+    items = SmartLocator(async_owner, "div.item")
+    locator = async_owner.page.locator.return_value
+
+    assert items.nth(1) is locator.nth.return_value
+
+
+def test_element_cache_reuses_handle_until_dom_changes(async_owner):
+    async_owner.config["element_cache"] = True
+    login_button = SmartLocator(async_owner, "#login-button")
+    locator = async_owner.page.locator.return_value
+    handle = Mock()
+    handle.click.return_value = asyncio.sleep(0)
+    locator.element_handles.return_value = [handle]
+    async_owner.page.evaluate.return_value = "doc:1"
+
+    asyncio.run(login_button.click())
+
+    locator.element_handles.assert_awaited_once()
+    handle.click.assert_called_once()
+    locator.click.assert_not_called()
+
+
+def test_locator_list_expectations_are_awaited(async_owner):
+    items = SmartLocatorList(async_owner, "div.item")
+    locator = async_owner.page.locator.return_value
+    locator.evaluate_all.return_value = [{"text": "A", "value": None, "visible": True,
+                                          "attributes": {}, "fields": {}}]
+
+    assert isinstance(items, AsyncSmartLocatorList)
+    assert asyncio.run(items.texts()) == ["A"]
+    asyncio.run(items.expect_count(1))
+
+    with pytest.raises(AssertionError):
+        asyncio.run(items.expect_count(2, timeout=0))
+
+
+def test_component_lists_repeated_matches_asynchronously(async_owner):
+    card = ProductCard(async_owner, "div.card")
+    root = async_owner.page.locator.return_value
+    root.count.return_value = 2
+
+    async def collect():
+        return [c.index async for c in card]
+
+    assert isinstance(card, AsyncSmartComponent)
+    assert isinstance(card.price, AsyncSmartLocator)
+    assert asyncio.run(collect()) == [0, 1]
+
+    with pytest.raises(TypeError):
+        list(card)
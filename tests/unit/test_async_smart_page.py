@@ -0,0 +1,148 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from services.test_service import TestService
+from utils.async_utils import run_steps, then
+from wrappers.async_smart_component import AsyncSmartComponent
+from wrappers.async_smart_locator import AsyncSmartLocator
+from wrappers.async_smart_locator_list import AsyncSmartLocatorList
+from wrappers.async_smart_page import AsyncSmartPage
+from wrappers.smart_locator import FIXED_SELECTORS
+from wrappers.smart_page import SmartPage, FORM_FIELD_KINDS
+
+CONFIG = {"demo_base_url": "https://www.saucedemo.com/", "timeout": 0}
+
+
+@pytest.fixture
+def async_page():
+    """Mocks an async Playwright page creating one async locator per selector."""
+    FIXED_SELECTORS.clear()
+    FORM_FIELD_KINDS.clear()
+    page = Mock(spec=AsyncPage)
+    locators = {}
+
+    def make_locator(selector):
+        if selector not in locators:
+            locators[selector] = Mock(spec=AsyncLocator)
+            locators[selector].evaluate.return_value = "fill"
+            locators[selector].locator.return_value = Mock(spec=AsyncLocator)
+        return locators[selector]
+
+    page.locator.side_effect = make_locator
+    page.locators = locators
+    yield page
+    FORM_FIELD_KINDS.clear()
+
+
+def test_page_object_becomes_async_variant(async_page):
+    login_page = LoginPage(async_page, dict(CONFIG))
+
+    assert isinstance(login_page, LoginPage)
+    assert isinstance(login_page, AsyncSmartPage)
+    assert isinstance(login_page.login_button, AsyncSmartLocator)
+    assert type(login_page).__name__ == "LoginPage"
+    assert type(LoginPage(async_page, dict(CONFIG))) is type(login_page)
+
+
+def test_page_object_with_sync_page_stays_sync():
+    login_page = LoginPage(Mock(), dict(CONFIG))
+
+    assert not isinstance(login_page, AsyncSmartPage)
+    assert not isinstance(login_page.login_button, AsyncSmartLocator)
+
+
+def test_components_and_lists_become_async_variants(async_page):
+    inventory_page = InventoryPage(async_page, dict(CONFIG))
+
+    assert isinstance(inventory_page.product_item, AsyncSmartComponent)
+    assert isinstance(inventory_page.add_to_cart_button, AsyncSmartLocator)
+    assert isinstance(inventory_page.inventory_items, AsyncSmartLocatorList)
+
+
+def test_record_mode_is_rejected_for_async_pages(async_page):
+    with pytest.raises(RuntimeError):
+        LoginPage(async_page, {"record_mode": True})
+
+
+def test_goto_replaces_placeholders_and_awaits(async_page):
+    login_page = LoginPage(async_page, dict(CONFIG))
+    login_page.add_placeholder("user_path", "inventory.html")
+
+    asyncio.run(login_page.goto("https://www.saucedemo.com/#USER_PATH#"))
+
+    async_page.goto.assert_awaited_once()
+    assert async_page.goto.await_args[0][0] == "https://www.saucedemo.com/inventory.html"
+
+
+def test_page_object_helpers_return_awaitables(async_page):
+    login_page = LoginPage(async_page, dict(CONFIG))
+
+    async def scenario():
+        await login_page.fill_form("standard_user", "secret_sauce")
+        await login_page.submit_form()
+
+    asyncio.run(scenario())
+
+    async_page.locators["#user-name"].fill.assert_awaited_once_with("standard_user")
+    async_page.locators["#password"].fill.assert_awaited_once_with("secret_sauce")
+    async_page.locators["#login-button"].click.assert_awaited_once()
+
+
+def test_fast_fill_form_uses_one_evaluate(async_page):
+    login_page = LoginPage(async_page, dict(CONFIG))
+    async_page.evaluate.return_value = [{"kind": "fill", "skipped": False, "ms": 1.0}] * 2
+
+    timings = asyncio.run(login_page.fast_fill_form("standard_user", "secret_sauce"))
+
+    async_page.evaluate.assert_awaited_once()
+    assert timings == {"username_input": 1.0, "password_input": 1.0}
+    async_page.locators["#user-name"].fill.assert_not_called()
+
+
+def test_test_service_login_works_with_async_page(async_page):
+    asyncio.run(TestService().login(async_page, dict(CONFIG), "standard_user", "secret_sauce"))
+
+    async_page.goto.assert_awaited_once()
+    async_page.locators["#login-button"].click.assert_awaited_once()
+
+
+@pytest.mark.parametrize("method", ["login_with_auth_cache", "open_inventory_page"])
+def test_test_service_cached_logins_await_ui_login_with_async_page(async_page, method):
+    config = {**CONFIG, "auth_cache": True, "scenario_cache": True}
+    login = getattr(TestService(), method)(async_page, config, "standard_user", "secret_sauce")
+
+    assert asyncio.run(login) is False
+    async_page.goto.assert_awaited_once()
+    async_page.locators["#login-button"].click.assert_awaited_once()
+
+
+def test_keyword_is_applied_to_async_locators(async_page):
+    inventory_page = InventoryPage(async_page, dict(CONFIG))
+    inventory_page.set_keyword("Sauce Labs Backpack")
+
+    asyncio.run(inventory_page.add_product_to_cart())
+
+    root = async_page.locators["smart=div[class='inventory_item']|Sauce Labs Backpack|"]
+    root.locator.assert_called_with("button[class='btn btn_primary btn_small btn_inventory ']")
+    root.locator.return_value.click.assert_awaited_once()
+
+
+def test_then_and_run_steps_support_both_modes():
+    calls = []
+
+    async def step(value):
+        calls.append(value)
+        return value
+
+    assert then(2, lambda x: x * 2) == 4
+    assert run_steps(lambda: calls.append(1), lambda: "done") == "done"
+    assert asyncio.run(then(step(3), lambda x: x * 2)) == 6
+    assert asyncio.run(run_steps(lambda: step(4), lambda: step(5))) == 5
+    assert calls == [1, 3, 4, 5]
+
+
+def test_sync_smart_page_is_not_affected():
+    assert type(SmartPage(Mock(), {})) is SmartPage
@@ -0,0 +1,112 @@
+from unittest.mock import Mock, patch
+from helpers.auth_cache import AuthCache
+from helpers.snapshot_cache import restore_storage_state
+
+BASE_URL = "https://www.saucedemo.com/"
+LANDING_URL = "https://www.saucedemo.com/inventory.html"
+STATE = {"cookies": [{"name": "session-username", "value": "standard_user", "expires": -1}],
+         "origins": []}
+KEY = (BASE_URL, "standard_user")
+
+
+def make_page(url=LANDING_URL):
+    page = Mock()
+    page.url = url
+    page.context.storage_state.return_value = STATE
+    return page
+
+
+def test_first_login_runs_flow_and_saves_state():
+    cache, page, login_flow = AuthCache(), make_page(), Mock()
+
+    restored = cache.restore_or_login(page, BASE_URL, "standard_user", login_flow, lambda p: True, LANDING_URL)
+
+    assert restored is False
+    login_flow.assert_called_once()
+    assert cache.get(KEY) == {"state": STATE}
+
+
+def test_next_login_restores_saved_state():
+    cache, page, login_flow = AuthCache(), make_page(), Mock()
+    cache.put(KEY, {"state": STATE})
+
+    restored = cache.restore_or_login(page, BASE_URL, "standard_user", login_flow, lambda p: True, LANDING_URL)
+
+    assert restored is True
+    login_flow.assert_not_called()
+    page.context.add_cookies.assert_called_once_with(STATE["cookies"])
+    page.goto.assert_called_once_with(LANDING_URL)
+    assert cache.stats["restored"] == 1
+
+
+def test_failed_probe_invalidates_and_logs_in_again():
+    cache, page, login_flow = AuthCache(), make_page(), Mock()
+    cache.put(KEY, {"state": STATE})
+    probe = Mock(side_effect=[False, True])
+
+    restored = cache.restore_or_login(page, BASE_URL, "standard_user", login_flow, probe, LANDING_URL)
+
+    assert restored is False
+    page.context.clear_cookies.assert_called_once()
+    login_flow.assert_called_once()
+    assert cache.stats["invalid"] == 1
+
+
+def test_failed_login_is_not_cached():
+    cache = AuthCache()
+
+    cache.restore_or_login(make_page(), BASE_URL, "locked_out_user", Mock(), lambda p: False)
+
+    assert cache.get((BASE_URL, "locked_out_user")) is None
+
+
+def test_entries_are_keyed_by_base_url_and_username():
+    cache = AuthCache()
+    cache.put(KEY, {"state": STATE})
+
+    assert cache.get((BASE_URL, "visual_user")) is None
+    assert cache.get(("https://example.com/", "standard_user")) is None
+
+
+def test_entry_expires_after_ttl():
+    cache = AuthCache()
+
+    with patch("helpers.snapshot_cache.time.time", return_value=1000.0):
+        cache.put(KEY, {"state": STATE})
+
+    with patch("helpers.snapshot_cache.time.time", return_value=1100.0):
+        assert cache.get(KEY, ttl=200) == {"state": STATE}
+        assert cache.get(KEY, ttl=50) is None
+
+    assert cache.stats["expired"] == 1
+
+
+def test_entry_expires_with_its_cookies():
+    cache = AuthCache()
+    cache.put(KEY, {"state": {"cookies": [{"name": "s", "expires": 1.0}], "origins": []}})
+
+    assert cache.get(KEY) is None
+
+
+def test_restore_error_logs_in_again():
+    cache, page, login_flow = AuthCache(), make_page(), Mock()
+    cache.put(KEY, {"state": STATE})
+    page.goto.side_effect = [Exception("net::ERR_CONNECTION_RESET"), None]
+
+    assert cache.restore_or_login(page, BASE_URL, "standard_user", login_flow, lambda p: True) is False
+    login_flow.assert_called_once()
+    assert cache.stats == {"logins": 1, "restored": 0, "expired": 0, "invalid": 1}
+
+
+def test_restore_storage_state_sets_local_storage_of_landing_origin():
+    page = make_page()
+    items = [{"name": "cart-contents", "value": "[4]"}]
+    state = {"cookies": [], "origins": [{"origin": "https://www.saucedemo.com", "localStorage": items},
+                                        {"origin": "https://example.com", "localStorage": []}]}
+
+    restore_storage_state(page, state, LANDING_URL)
+
+    page.context.add_cookies.assert_not_called()
+    page.evaluate.assert_called_once()
+    assert page.evaluate.call_args.args[1] == [items, []]
+    page.reload.assert_called_once()
@@ -0,0 +1,98 @@
+import json
+import pytest
+from benchmarks import harness
+from benchmarks.__main__ import main
+from benchmarks.bench_selectors import measure_targets
+from benchmarks.harness import (benchmark, compare_results, get_scaling, run_benchmarks, save_results,
+                                time_callable)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(harness, "BENCHMARKS", {})
+    return harness.BENCHMARKS
+
+
+def make_results(**medians):
+    return {name: {"median_us": median} for name, median in medians.items()}
+
+
+def test_benchmark_registers_every_parameter(registry):
+    @benchmark("join", params=(1, 10))
+    def setup(count):
+        return lambda: ",".join(["x"] * count)
+
+    assert list(registry) == ["join[1]", "join[10]"]
+    assert registry["join[10]"] == (setup, 10, time_callable)
+
+
+def test_time_callable_reports_per_call_times():
+    result = time_callable(lambda: None, repeat=2)
+
+    assert result["rounds"] == 2 and result["loops"] > 1
+    assert 0 < result["min_us"] <= result["median_us"]
+
+
+def test_run_benchmarks_filters_by_pattern(registry):
+    benchmark("fast.noop")(lambda: lambda: None)
+    benchmark("slow.noop")(lambda: lambda: None)
+
+    assert list(run_benchmarks("fast.*", repeat=1)) == ["fast.noop"]
+
+
+def test_compare_flags_regressions_above_threshold():
+    rows = compare_results(make_results(a=10.0, b=10.0, c=10.0, removed=1.0),
+                           make_results(a=11.0, b=12.0, c=5.0, added=1.0), threshold=0.15)
+
+    assert [(name, regressed) for name, _, _, _, regressed in rows] == [
+        ("a", False), ("b", True), ("c", False)]
+
+
+def test_compare_command_exit_status(tmp_path):
+    baseline = save_results(make_results(a=10.0), tmp_path / "baseline.json")
+    current = save_results(make_results(a=13.0), tmp_path / "current.json")
+
+    assert json.loads(current.read_text())["benchmarks"]["a"]["median_us"] == 13.0
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.5"]) == 0
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.2"]) == 1
+
+
+def test_run_benchmarks_uses_custom_measure(registry):
+    def measure(func, repeat):
+        return {"median_us": 1.0, "metrics": {"success_rate": func()}}
+
+    benchmark("selector.noop", params=("small",), measure=measure)(lambda size: lambda: 0.5)
+
+    assert run_benchmarks(repeat=1)["selector.noop[small]"]["metrics"] == {"success_rate": 0.5}
+
+
+def test_run_benchmarks_skips_unavailable_benchmarks(registry):
+    def setup():
+        raise harness.SkipBenchmark("no browser")
+
+    benchmark("selector.noop")(setup)
+    benchmark("wrapper.noop")(lambda: lambda: None)
+
+    assert list(run_benchmarks(repeat=1)) == ["wrapper.noop"]
+
+
+def test_scaling_exponent_per_benchmark_family():
+    results = make_results(**{"linear[10]": 1.0, "linear[100]": 10.0, "linear[1000]": 100.0,
+                              "quadratic[10]": 1.0, "quadratic[100]": 100.0, "single[10]": 1.0, "plain": 1.0})
+
+    assert [(family, round(exponent, 2)) for family, _, _, exponent in get_scaling(results)] == [
+        ("linear", 1.0), ("quadratic", 2.0)]
+
+
+def test_scaling_command_exit_status(tmp_path):
+    results = save_results(make_results(**{"parse[100]": 1.0, "parse[1000]": 50.0}), tmp_path / "results.json")
+
+    assert main(["scaling", str(results), "--max-exponent", "2"]) == 0
+    assert main(["scaling", str(results)]) == 1
+
+
+def test_measure_targets_reports_success_rate_and_roundtrips():
+    result = measure_targets(lambda: [(0.001, 4, True), (0.003, 6, False)], repeat=5)
+
+    assert result["loops"] == 2 and result["median_us"] == 2000.0
+    assert result["metrics"] == {"targets": 2, "success_rate": 0.5, "roundtrips": 5.0}
@@ -0,0 +1,201 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from helpers import concurrent_runner
+from helpers.concurrent_runner import (is_concurrent_item, _run_item, _run_items,
+                                       _get_funcargs, CONCURRENT_MARKER, XPASS_KEY)
+from helpers.test_context import get_current_param_row
+
+
+def make_item(func, params=None, markers=()):
+    """Creates a fake pytest item for an async test function."""
+    item = Mock(spec=pytest.Function)
+    item.obj = func
+    item.nodeid = f"tests/e2e/test_fake.py::{func.__name__}"
+    item.location = ("tests/e2e/test_fake.py", 0, func.__name__)
+    item.stash = pytest.Stash()
+    item.config.option.runxfail = False
+    item.config.getini.return_value = False
+    item.iter_markers.side_effect = lambda name=None: iter(
+        [m for m in markers if name is None or m.name == name])
+    item.get_closest_marker.side_effect = lambda name: next(
+        (m for m in markers if m.name == name), None)
+
+    if params is None:
+        del item.callspec
+    else:
+        item.callspec = Mock(params=params, indices={name: 1 for name in params})
+
+    return item
+
+
+def make_browser():
+    browser = Mock()
+    browser.new_context = AsyncMock(side_effect=lambda: Mock(
+        new_page=AsyncMock(return_value=Mock()), close=AsyncMock()))
+    browser.close = AsyncMock()
+    return browser
+
+
+def run_item(item, browser=None, config=None):
+    return asyncio.run(_run_item(item, browser or make_browser(), config or {},
+                                 asyncio.Semaphore(1)))
+
+
+def test_is_concurrent_item_requires_marker_and_coroutine():
+    async def test_async(page):
+        pass
+
+    def test_sync(page):
+        pass
+
+    marker = pytest.mark.concurrent.mark
+
+    assert is_concurrent_item(make_item(test_async, markers=[marker]))
+    assert not is_concurrent_item(make_item(test_async))
+    assert not is_concurrent_item(make_item(test_sync, markers=[marker]))
+    assert marker.name == CONCURRENT_MARKER
+
+
+def test_run_item_passes_page_config_and_params():
+    received = {}
+
+    async def test_login(page, config, username):
+        received.update(page=page, config=config, username=username,
+                        row=get_current_param_row())
+
+    browser = make_browser()
+    item, calls = run_item(make_item(test_login, {"username": "standard_user"}), browser,
+                           {"timeout": 1000})
+
+    assert [c.when for c in calls] == ["setup", "call", "teardown"]
+    assert all(c.excinfo is None for c in calls)
+    assert received["username"] == "standard_user"
+    assert received["config"] == {"timeout": 1000}
+    assert received["row"] == 1
+    # The param row is set inside the task only
+    assert get_current_param_row() == -1
+    browser.new_context.assert_awaited_once()
+    received["page"].set_default_timeout.assert_called_once_with(1000)
+
+
+def test_run_item_records_failure_and_closes_context():
+    async def test_fail(page):
+        assert False, "boom"
+
+    browser = make_browser()
+    _, calls = run_item(make_item(test_fail), browser)
+
+    assert calls[1].when == "call"
+    assert calls[1].excinfo.errisinstance(AssertionError)
+    assert calls[2].excinfo is None
+    assert calls[1].duration >= 0
+
+
+@pytest.mark.parametrize("markers", [[], [pytest.mark.usefixtures("tmp_path").mark]])
+def test_run_item_skips_tests_requesting_unsupported_fixtures(markers):
+    async def test_fixture(page, request=None):
+        raise AssertionError("must not run")
+
+    _, calls = run_item(make_item(test_fixture, markers=markers))
+
+    assert [c.when for c in calls] == ["setup", "teardown"]
+    assert calls[0].excinfo.errisinstance(pytest.skip.Exception)
+    assert "not fixtures: request" in str(calls[0].excinfo.value)
+
+
+def test_run_item_honours_skip_marker():
+    async def test_skipped(page):
+        raise AssertionError("must not run")
+
+    item = make_item(test_skipped, markers=[pytest.mark.skip(reason="later").mark])
+    _, calls = run_item(item)
+
+    assert calls[0].excinfo.errisinstance(pytest.skip.Exception)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("condition, skipped", [("sys.platform != 'nowhere'", True), (False, False)])
+def test_run_item_evaluates_skipif_conditions(condition, skipped):
+    async def test_conditional(page):
+        pass
+
+    item = make_item(test_conditional, markers=[pytest.mark.skipif(condition, reason="r").mark])
+    _, calls = run_item(item)
+
+    assert (calls[0].excinfo is not None) == skipped
+
+
+@pytest.mark.parametrize("raises, xfailed", [(None, True), (AssertionError, True), (KeyError, False)])
+def test_run_item_reports_expected_failures(raises, xfailed):
+    async def test_broken(page):
+        assert False, "boom"
+
+    item = make_item(test_broken, markers=[pytest.mark.xfail(reason="bug", raises=raises).mark])
+    _, calls = run_item(item)
+
+    assert calls[1].excinfo.errisinstance(pytest.xfail.Exception) == xfailed
+    assert calls[1].excinfo.errisinstance(AssertionError) != xfailed
+
+
+def test_run_item_xpass_is_reported_or_fails_when_strict():
+    async def test_fixed(page):
+        pass
+
+    item = make_item(test_fixed, markers=[pytest.mark.xfail(reason="bug").mark])
+    _, calls = run_item(item)
+    assert calls[1].excinfo is None
+    assert item.stash[XPASS_KEY] == "bug"
+
+    item = make_item(test_fixed, markers=[pytest.mark.xfail(reason="bug", strict=True).mark])
+    _, calls = run_item(item)
+    assert calls[1].excinfo.errisinstance(pytest.fail.Exception)
+
+
+def test_run_item_does_not_run_xfail_with_run_false():
+    async def test_hangs(page):
+        raise AssertionError("must not run")
+
+    item = make_item(test_hangs, markers=[pytest.mark.xfail(run=False, reason="hangs").mark])
+    _, calls = run_item(item)
+
+    assert calls[0].excinfo.errisinstance(pytest.xfail.Exception)
+    assert len(calls) == 2
+
+
+def test_get_funcargs_prefers_parameters():
+    async def test_params(page, config):
+        pass
+
+    item = make_item(test_params, {"config": "param"})
+
+    assert _get_funcargs(item, {"page": "page", "config": "fixture"}) == \
+        {"page": "page", "config": "param"}
+
+
+def test_run_items_limits_concurrency(monkeypatch):
+    running, peak = [0], [0]
+
+    async def test_slow(page):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+
+    browser = make_browser()
+    playwright = Mock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+    manager = Mock(__aenter__=AsyncMock(return_value=playwright), __aexit__=AsyncMock())
+    monkeypatch.setattr(concurrent_runner, "async_playwright", lambda: manager)
+    monkeypatch.setattr(concurrent_runner, "register_smart_selector_engine_async", AsyncMock())
+    logged = []
+    monkeypatch.setattr(concurrent_runner, "_log_item", lambda item, calls: logged.append(item))
+    session = Mock(shouldfail=False, shouldstop=False)
+    items = [make_item(test_slow) for _ in range(5)]
+
+    asyncio.run(_run_items(session, items, {}, 2))
+
+    assert peak[0] == 2
+    assert sorted(map(id, logged)) == sorted(map(id, items))
+    assert browser.new_context.await_count == 5
+    browser.close.assert_awaited_once()
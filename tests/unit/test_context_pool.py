@@ -0,0 +1,118 @@
+from unittest.mock import Mock
+from helpers.context_pool import ContextPool, PooledContext, is_context_healthy
+
+
+def make_context():
+    context = Mock()
+    page = Mock()
+    page.url = "about:blank"
+    page.is_closed.return_value = False
+    page.evaluate.return_value = "complete"
+    context.new_page.return_value = page
+    context.pages = [page]
+    context.storage_state.return_value = {"cookies": [], "origins": []}
+    context.browser.is_connected.return_value = True
+    return context
+
+
+def make_browser():
+    browser = Mock()
+    browser.new_context.side_effect = lambda: make_context()
+    return browser
+
+
+def test_acquire_pre_creates_pool_and_reuses_reset_context():
+    browser = make_browser()
+    pool = ContextPool(browser, {"context_pool_size": 3, "timeout": 5000})
+
+    entry = pool.acquire()
+    assert browser.new_context.call_count == 3
+    assert pool.get_page(entry.context) is entry.page
+
+    pool.release(entry)
+    context = entry.context
+    context.clear_cookies.assert_called_once()
+    context.clear_permissions.assert_called_once()
+    entry.page.goto.assert_called_once_with("about:blank")
+    entry.page.set_default_timeout.assert_called_with(5000)
+    assert pool.get_page(context) is None
+
+    assert pool.acquire() is entry
+    assert browser.new_context.call_count == 3
+    assert pool.stats["reused"] == 1
+
+
+def test_release_replaces_context_after_max_reuse():
+    pool = ContextPool(make_browser(), {"context_pool_size": 1, "context_max_reuse": 2})
+
+    entry = pool.acquire()
+    pool.release(entry)
+    assert pool.acquire() is entry
+
+    pool.release(entry)
+    entry.context.close.assert_called_once()
+    assert pool.acquire() is not entry
+    assert pool.stats["recycled"] == 1
+
+
+def test_failed_reset_falls_back_to_fresh_context():
+    pool = ContextPool(make_browser(), {"context_pool_size": 1})
+
+    entry = pool.acquire()
+    entry.context.clear_cookies.side_effect = Exception("Target closed")
+    pool.release(entry)
+
+    entry.context.close.assert_called_once()
+    assert pool.acquire() is not entry
+    assert pool.stats["reset_failures"] == 1
+
+
+def test_context_with_storage_of_other_origins_is_not_reused():
+    pool = ContextPool(make_browser(), {"context_pool_size": 1})
+
+    entry = pool.acquire()
+    entry.context.storage_state.return_value = {
+        "cookies": [], "origins": [{"origin": "https://example.com", "localStorage": []}]}
+    pool.release(entry)
+
+    assert pool.acquire() is not entry
+
+
+def test_custom_health_check_decides_reuse():
+    health_check = Mock(return_value=False)
+    pool = ContextPool(make_browser(), {"context_pool_size": 1}, health_check=health_check)
+
+    entry = pool.acquire()
+    pool.release(entry)
+
+    health_check.assert_called_once_with(entry)
+    assert pool.acquire() is not entry
+
+
+def test_health_check_can_be_disabled_in_config():
+    pool = ContextPool(make_browser(), {"context_health_check": False})
+    assert pool.health_check is None
+
+
+def test_is_context_healthy():
+    context = make_context()
+    entry = PooledContext(context, context.new_page())
+    assert is_context_healthy(entry)
+
+    entry.page.url = "https://www.saucedemo.com/"
+    assert not is_context_healthy(entry)
+
+    entry.page.url = "about:blank"
+    context.browser.is_connected.return_value = False
+    assert not is_context_healthy(entry)
+
+
+def test_close_closes_idle_and_used_contexts():
+    pool = ContextPool(make_browser(), {"context_pool_size": 2})
+
+    used = pool.acquire()
+    idle = pool._idle[0]
+    pool.close()
+
+    used.context.close.assert_called_once()
+    idle.context.close.assert_called_once()
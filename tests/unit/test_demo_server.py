@@ -0,0 +1,91 @@
+import re
+import urllib.error
+import urllib.request
+from html.parser import HTMLParser
+import pytest
+from helpers.demo_server import DemoServer
+from utils.synthetic_dom import generate_synthetic_page, get_synthetic_page_query
+
+
+class ElementCounter(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.in_body = False
+        self.count = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.in_body:
+            self.count += 1
+        self.in_body = self.in_body or tag == "body"
+
+
+def count_body_elements(html: str) -> int:
+    counter = ElementCounter()
+    counter.feed(html)
+    return counter.count
+
+
+def fetch(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read().decode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def server():
+    with DemoServer() as demo_server:
+        yield demo_server
+
+
+def test_server_uses_ephemeral_port_and_config_urls(server):
+    assert server.port > 0
+    assert server.get_config_urls() == {
+        "demo_base_url": f"http://127.0.0.1:{server.port}/",
+        "web_form_url": f"http://127.0.0.1:{server.port}/selenium/web/web-form.html",
+    }
+
+
+@pytest.mark.parametrize("path,text", [
+    ("/", 'data-page="login"'),
+    ("/inventory.html", 'data-page="inventory"'),
+    ("/cart.html", 'data-page="cart"'),
+    ("/static/app.js", 'id="user-name"'),
+    ("/selenium/web/web-form.html", 'id="my-text-id"'),
+    ("/selenium/web/submitted-form.html", "Received!"),
+])
+def test_server_serves_demo_pages(server, path, text):
+    assert text in fetch(server.url(path))
+
+
+def test_server_serves_synthetic_page(server):
+    html = fetch(server.url("/synthetic.html?" + get_synthetic_page_query(nodes=2000, seed=3)))
+
+    assert count_body_elements(html) == 2000
+
+
+def test_server_rejects_invalid_synthetic_page(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(server.url("/synthetic.html?nodes=0"))
+
+    assert error.value.code == 400
+
+
+@pytest.mark.parametrize("nodes", [1, 7, 1000, 12345])
+def test_synthetic_page_has_exact_node_count(nodes):
+    assert count_body_elements(generate_synthetic_page(nodes)) == nodes
+
+
+def test_synthetic_page_is_deterministic_per_seed():
+    assert generate_synthetic_page(500, seed=1) == generate_synthetic_page(500, seed=1)
+    assert generate_synthetic_page(500, seed=1) != generate_synthetic_page(500, seed=2)
+
+
+def test_synthetic_page_duplicates_and_collisions():
+    unique = generate_synthetic_page(3500, duplicates=0.0, collisions=0.0)
+    dense = generate_synthetic_page(3500, duplicates=1.0, collisions=1.0)
+
+    unique_keys = re.findall(r'class="card"[^>]*data-test="([^"]+)"', unique)
+    dense_keys = re.findall(r'class="card"[^>]*data-test="([^"]+)"', dense)
+    assert len(set(unique_keys)) == len(unique_keys) > 400
+    assert len(set(dense_keys)) <= 5
+
+    assert "Product 0" in unique and "Product 0" not in dense
@@ -0,0 +1,150 @@
+import re
+import pytest
+from playwright.sync_api import Error, TimeoutError as PlaywrightTimeoutError
+from tests.fakes.fake_playwright import FakePage, expect
+
+SHOP_HTML = """
+<title>Swag Labs</title>
+<div id="inventory" class="container">
+    <h1>Products</h1>
+    <ul>
+        <li class="item"><span class="name">Backpack</span> <button data-test="add-backpack">Add to cart</button></li>
+        <li class="item sale"><span class="name">Bike Light</span> <button data-test="add-bike">Add to cart</button></li>
+    </ul>
+    <form>
+        <input id="user-name" placeholder="Username">
+        <input type="password" id="password" readonly>
+        <input type="checkbox" id="agree">
+        <select id="sort"><option value="az">Name (A to Z)</option><option value="za">Name (Z to A)</option></select>
+        <button type="submit" disabled>Login</button>
+    </form>
+    <p class="error" hidden>Epic sadface</p>
+</div>
+"""
+
+
+@pytest.fixture
+def page():
+    return FakePage(SHOP_HTML, url="https://shop.test/",
+                    routes={"https://shop.test/cart.html": "<h1>Your Cart</h1>"})
+
+
+@pytest.mark.parametrize("selector, count", [
+    ("li", 2),
+    ("ul > li.sale", 1),
+    ("#inventory .name", 2),
+    ("[data-test^='add-']", 2),
+    ("[data-test=add-bike]", 1),
+    ("button[disabled], p.error", 2),
+    ("li >> button", 2),
+    ("li >> nth=1 >> button", 1),
+    ("text=add to cart", 2),
+    ('text="Backpack"', 1),
+    ("//li", 2),
+    ("//ul/li[2]//button", 1),
+    ("(//li)[1]", 1),
+    ("//li[@class='item sale']", 1),
+    ("//button[@data-test]", 2),
+    ("xpath=//span[normalize-space(text())='Bike Light']", 1),
+    ("//button[normalize-space(.)='Add to cart']", 2),
+    ("(//button[normalize-space(.)='Add to cart'])[2]", 1),
+    ("//li[contains(., 'Bike')]", 1),
+    ("//span[text()='Backpack']/..", 1),
+    ("li.sale >> //button", 1),
+])
+def test_locator_count(page, selector, count):
+    assert page.locator(selector).count() == count
+
+
+@pytest.mark.parametrize("selector", ["li:nth-child(2)", "//li[position() > 1]", "//li/following-sibling::li"])
+def test_unsupported_selector_fails(page, selector):
+    with pytest.raises(Error, match="does not support"):
+        page.locator(selector).count()
+
+
+def test_xpath_parent_of_chained_locator(page):
+    name = page.locator("//span[normalize-space(.)='Bike Light']")
+
+    assert name.locator("..").get_attribute("class") == "item sale"
+    assert name.locator("..").locator("xpath=//button").get_attribute("data-test") == "add-bike"
+
+
+def test_fill_and_input_value(page):
+    page.locator("#user-name").fill("standard_user")
+
+    assert page.locator("#user-name").input_value() == "standard_user"
+    assert page.actions[-1][0] == "fill"
+
+
+def test_check_and_select_option(page):
+    page.locator("#agree").click()
+    assert page.locator("#agree").is_checked()
+
+    page.locator("#agree").uncheck()
+    assert not page.locator("#agree").is_checked()
+
+    assert page.locator("#sort").select_option("Name (Z to A)") == ["za"]
+    assert page.locator("#sort").input_value() == "za"
+
+
+def test_goto_route(page):
+    page.goto("/cart.html")
+
+    assert page.url == "https://shop.test/cart.html"
+    assert page.locator("h1").inner_text() == "Your Cart"
+
+    with pytest.raises(Error, match="ERR_NAME_NOT_RESOLVED"):
+        page.goto("https://unknown.test/")
+
+
+@pytest.mark.parametrize("selector, action, error", [
+    ("#missing", lambda locator: locator.click(timeout=100), PlaywrightTimeoutError),
+    ("button[type=submit]", lambda locator: locator.click(), PlaywrightTimeoutError),
+    ("#password", lambda locator: locator.fill("secret"), PlaywrightTimeoutError),
+    ("p.error", lambda locator: locator.click(), PlaywrightTimeoutError),
+    ("button", lambda locator: locator.click(), Error),
+    ("#agree", lambda locator: locator.fill("x"), Error),
+    ("h1", lambda locator: locator.input_value(), Error),
+])
+def test_actions_fail_like_playwright(page, selector, action, error):
+    with pytest.raises(error):
+        action(page.locator(selector))
+
+
+def test_element_handle_fails_once_detached(page):
+    handle = page.locator("h1").element_handle()
+    assert handle.inner_text() == "Products"
+
+    page.set_content("<h1>Products</h1>")
+
+    with pytest.raises(Error, match="not attached"):
+        handle.inner_text()
+
+
+def test_evaluate_runs_only_hooks(page):
+    page.add_evaluate_hook("document.title", lambda target, arg: page.title())
+    page.add_evaluate_hook(re.compile(r"el => el\.dataset\.(\w+)"), lambda element, arg: element.attrs["data-test"])
+
+    assert page.evaluate("() => document.title") == "Swag Labs"
+    assert page.locator("li.sale button").evaluate("el => el.dataset.test") == "add-bike"
+
+    with pytest.raises(NotImplementedError):
+        page.locator("h1").evaluate("el => el.removeAttribute('style')")
+
+
+def test_expect_matchers(page):
+    expect(page.locator("h1")).to_have_text("Products")
+    expect(page.locator("h1")).to_have_text(re.compile("prod", re.IGNORECASE))
+    expect(page.locator("li")).to_have_count(2)
+    expect(page.locator("p.error")).to_be_hidden()
+    expect(page.locator("button[type=submit]")).to_be_disabled()
+    expect(page.locator("#agree")).not_to_be_checked()
+    expect(page).to_have_title("Swag Labs")
+
+
+def test_expect_failure_message(page):
+    with pytest.raises(AssertionError, match="expected to have text 'Cart'\nActual value: Products"):
+        expect(page.locator("h1")).to_have_text("Cart")
+
+    with pytest.raises(AssertionError, match="expected not to have URL"):
+        expect(page).not_to_have_url("https://shop.test/")
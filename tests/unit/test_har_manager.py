@@ -0,0 +1,128 @@
+import json
+import pytest
+from unittest.mock import Mock
+from helpers.har_manager import HarManager, merge_har_files
+
+NODE_ID = "tests/e2e/test_login.py::test_login_with_multiple_users[standard_user]"
+
+
+def make_manager(tmp_path, **config):
+    return HarManager({"har_dir": str(tmp_path), **config})
+
+
+def write_har(path, urls):
+    path.write_text(json.dumps({"log": {"version": "1.2", "entries": [
+        {"request": {"url": url}} for url in urls]}}), encoding="utf-8")
+
+
+def test_live_mode_does_not_touch_context(tmp_path):
+    manager, context = make_manager(tmp_path), Mock()
+
+    assert manager.start(context, NODE_ID) is None
+    assert manager.get_context_options() == {}
+    context.route_from_har.assert_not_called()
+
+
+def test_har_path_per_module_and_per_test(tmp_path):
+    assert make_manager(tmp_path).get_har_path(NODE_ID) == tmp_path / "tests_e2e_test_login.har"
+    assert (make_manager(tmp_path, har_scope="test").get_har_path(NODE_ID).name
+            == "tests_e2e_test_login_test_login_with_multiple_users_standard_user.har")
+
+
+def test_invalid_settings_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        make_manager(tmp_path, network_mode="offline")
+    with pytest.raises(ValueError):
+        make_manager(tmp_path, har_unmatched="ignore")
+
+
+def test_record_stores_archive_once_per_session(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path, network_mode="record")
+    write_har(manager.get_har_path(NODE_ID), ["https://www.saucedemo.com/old.html"])
+    sessions = []
+
+    # Tests of one module finishing on two pytest-xdist workers
+    for worker, user in (("gw0", "standard_user"), ("gw1", "visual_user")):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+        session = manager.start(Mock(), NODE_ID.replace("standard_user", user))
+        write_har(session.record_path, [f"https://www.saucedemo.com/{user}"])
+        manager.finish(session)
+        sessions.append(session)
+
+    assert sessions[0].record_path.name.startswith("gw0-")
+    assert sessions[0].record_path != sessions[1].record_path
+
+    manager.store_recordings()
+
+    har = json.loads(sessions[0].har_path.read_text(encoding="utf-8"))
+    assert sorted(e["request"]["url"] for e in har["log"]["entries"]) == [
+        "https://www.saucedemo.com/standard_user", "https://www.saucedemo.com/visual_user"]
+    assert not manager.recording_dir.exists()
+
+
+def test_clear_recordings_drops_stale_recordings(tmp_path):
+    manager = make_manager(tmp_path, network_mode="record")
+    session = manager.start(Mock(), NODE_ID)
+    write_har(session.record_path, ["https://www.saucedemo.com/"])
+
+    manager.clear_recordings()
+    manager.store_recordings()
+
+    assert not session.har_path.exists()
+
+
+def test_record_starts_playwright_har_update(tmp_path):
+    manager, context = make_manager(tmp_path, network_mode="record"), Mock()
+
+    session = manager.start(context, NODE_ID)
+
+    context.route_from_har.assert_called_once_with(
+        session.record_path, update=True, update_content="embed", update_mode="minimal")
+    assert manager.get_context_options() == {"service_workers": "block"}
+
+
+def test_replay_requires_archive(tmp_path):
+    with pytest.raises(FileNotFoundError, match="--network_mode=record"):
+        make_manager(tmp_path, network_mode="replay").start(Mock(), NODE_ID)
+
+
+def test_replay_routes_archive_after_unmatched_handler(tmp_path):
+    manager, context = make_manager(tmp_path, network_mode="replay"), Mock()
+    write_har(manager.get_har_path(NODE_ID), [])
+
+    manager.start(context, NODE_ID)
+
+    assert [c[0] for c in context.method_calls] == ["route", "route_from_har"]
+    context.route_from_har.assert_called_once_with(manager.get_har_path(NODE_ID), not_found="fallback")
+
+
+@pytest.mark.parametrize("policy,action", [("passthrough", "continue_"), ("404", "fulfill"),
+                                           ("fail", "abort")])
+def test_unmatched_policy(tmp_path, policy, action):
+    manager, context = make_manager(tmp_path, network_mode="replay", har_unmatched=policy), Mock()
+    write_har(manager.get_har_path(NODE_ID), [])
+    session = manager.start(context, NODE_ID)
+    route = Mock()
+    route.request.method, route.request.url = "GET", "https://www.saucedemo.com/missing.js"
+
+    handler = context.route.call_args.args[1]
+    handler(route)
+
+    getattr(route, action).assert_called_once()
+
+    if policy == "fail":
+        with pytest.raises(pytest.fail.Exception, match="missing.js"):
+            manager.finish(session)
+    else:
+        manager.finish(session)
+
+
+def test_merge_har_files(tmp_path):
+    first, second = tmp_path / "a.har", tmp_path / "b.har"
+    write_har(first, ["https://a/"])
+    write_har(second, ["https://b/"])
+
+    har = merge_har_files([first, second])
+
+    assert [e["request"]["url"] for e in har["log"]["entries"]] == ["https://a/", "https://b/"]
+    assert har["log"]["version"] == "1.2"
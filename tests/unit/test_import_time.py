@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# Modules imported by tests and page objects in every run
+WRAPPER_MODULES = ("wrappers.smart_page", "wrappers.smart_locator", "wrappers.smart_expect")
+# Record-mode only dependencies, they need a display and are loaded on first use
+RECORD_MODE_MODULES = ("tkinter", "_tkinter", "pyautogui", "pynput", "utils.keyboard_utils")
+# Packages of this repository
+OWN_PACKAGES = ("wrappers", "helpers", "utils", "common", "enums")
+# Self import time of the repository modules, Playwright and the standard library excluded
+IMPORT_TIME_BUDGET_MS = 100
+
+
+def get_import_times(*modules: str) -> dict:
+    """Imports modules in a fresh interpreter with -X importtime: module -> self time in microseconds."""
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+
+    return times
+
+
+@pytest.fixture(scope="module")
+def wrapper_import_times():
+    return get_import_times(*WRAPPER_MODULES)
+
+
+def test_wrappers_do_not_import_record_mode_dependencies(wrapper_import_times):
+    loaded = [name for name in wrapper_import_times if name.split(".")[0] in RECORD_MODE_MODULES
+              or name in RECORD_MODE_MODULES]
+
+    assert loaded == []
+
+
+def test_wrapper_import_time_within_budget(wrapper_import_times):
+    own_ms = sum(us for name, us in wrapper_import_times.items()
+                 if name.split(".")[0] in OWN_PACKAGES) / 1000
+
+    assert own_ms < IMPORT_TIME_BUDGET_MS, f"Repository modules took {own_ms:.1f}ms to import"
+
+
+def test_record_mode_dialogs_are_imported_on_first_use():
+    code = ("import sys, helpers.record_mode_helper as helper; "
+            "assert 'tkinter' not in sys.modules; "
+            "print(helper.simpledialog.__name__, 'tkinter' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.stdout.split() == ["tkinter.simpledialog", "True"], result.stderr
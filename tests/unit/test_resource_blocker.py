@@ -0,0 +1,167 @@
+import json
+import pytest
+from unittest.mock import Mock
+from conftest import start_context_routing
+from helpers.har_manager import HarManager
+from helpers.resource_blocker import ResourceBlocker, parse_profile_names
+
+CONFIG = {"demo_base_url": "https://www.saucedemo.com/"}
+
+
+def make_route(url, resource_type="script"):
+    route = Mock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    return route
+
+
+def make_node(*marker_args):
+    node = Mock()
+    node.get_closest_marker.return_value = Mock(args=marker_args) if marker_args != (None,) else None
+    return node
+
+
+def route_through(blocker, profile_names, route):
+    context = Mock()
+    test_stats = blocker.attach(context, profile_names)
+    handler = context.route.call_args.args[1]
+    handler(route)
+    return test_stats
+
+
+@pytest.mark.parametrize("profile,url,resource_type", [
+    ("images", "https://www.saucedemo.com/static/media/backpack.jpg", "image"),
+    ("fonts", "https://www.saucedemo.com/static/media/DMSans.woff2", "font"),
+    ("analytics", "https://events.backtrace.io/api/unique-events/submit", "fetch"),
+    ("third_party", "https://cdn.example.com/lib.js", "script"),
+])
+def test_profiles_block_matching_requests(profile, url, resource_type):
+    blocker = ResourceBlocker(CONFIG)
+    route = make_route(url, resource_type)
+
+    test_stats = route_through(blocker, [profile], route)
+
+    route.abort.assert_called_once_with("blockedbyclient")
+    assert test_stats["blocked"] == 1
+    assert blocker.stats["profiles"] == {profile: 1}
+
+
+def test_other_requests_fall_back_to_next_route():
+    blocker = ResourceBlocker(CONFIG)
+    route = make_route("https://www.saucedemo.com/static/js/main.js")
+
+    route_through(blocker, ["images", "fonts", "analytics", "third_party"], route)
+
+    route.fallback.assert_called_once()
+    route.abort.assert_not_called()
+
+
+def test_first_party_subdomains_are_not_third_party():
+    blocker = ResourceBlocker({"demo_base_url": "https://saucedemo.com/"})
+    route = make_route("https://static.saucedemo.com/app.js")
+
+    route_through(blocker, ["third_party"], route)
+
+    route.fallback.assert_called_once()
+
+
+def test_no_profiles_do_not_route():
+    context = Mock()
+
+    assert ResourceBlocker(CONFIG).attach(context, []) is None
+    context.route.assert_not_called()
+
+
+def test_config_profiles_and_validation():
+    blocker = ResourceBlocker({**CONFIG, "block": "images, ads",
+                               "block_profiles": {"ads": {"url_patterns": [r"ads\."]}}})
+
+    assert blocker.default_profiles == ["images", "ads"]
+
+    with pytest.raises(ValueError, match="Unknown blocking profiles"):
+        ResourceBlocker({**CONFIG, "block": "videos"})
+
+
+def test_config_profiles_extend_built_in_profiles():
+    blocker = ResourceBlocker({**CONFIG, "block_profiles": {
+        "analytics": {"url_patterns": [r"\.hotjar\.com", r"stats\.example\.com"]}}})
+    urls = ["https://api.segment.io/v1/t", "https://stats.example.com/hit"]
+    routes = [make_route(url, "fetch") for url in urls]
+
+    for route in routes:
+        route_through(blocker, ["analytics"], route)
+
+    assert [route.abort.call_count for route in routes] == [1, 1]
+
+
+class RoutingContext:
+    """Browser context stub running routes newest first, like Playwright."""
+
+    def __init__(self, archived_urls):
+        self.archived_urls = archived_urls
+        self.handlers = []
+
+    def route(self, url, handler):
+        self.handlers.append(handler)
+
+    def route_from_har(self, har, not_found):
+        self.handlers.append(lambda route: route.fulfill() if route.request.url in self.archived_urls
+                             else route.fallback())
+
+    def dispatch(self, route):
+        for handler in reversed(self.handlers):
+            fallbacks = route.fallback.call_count
+            handler(route)
+
+            if route.fallback.call_count == fallbacks:
+                return
+
+
+def test_blocking_runs_before_har_replay(tmp_path):
+    config = {**CONFIG, "block": "analytics", "network_mode": "replay", "har_dir": str(tmp_path)}
+    har_manager, blocker = HarManager(config), ResourceBlocker(config)
+    request = Mock()
+    request.node.nodeid = "tests/e2e/test_login.py::test_login"
+    request.node.get_closest_marker.return_value = None
+    request.node.user_properties = []
+    archived = "https://www.saucedemo.com/"
+    har_manager.get_har_path(request.node.nodeid).write_text(
+        json.dumps({"log": {"entries": [{"request": {"url": archived}}]}}), encoding="utf-8")
+    context = RoutingContext([archived])
+
+    session = start_context_routing(context, request, har_manager, None, blocker)
+    blocked, page = make_route("https://www.google-analytics.com/collect"), make_route(archived, "document")
+    context.dispatch(blocked)
+    context.dispatch(page)
+
+    blocked.abort.assert_called_once_with("blockedbyclient")
+    page.fulfill.assert_called_once()
+    assert session.unmatched == []
+    assert request.node.user_properties == [("blocked_requests", {"blocked": 1, "bytes_saved": 0})]
+    har_manager.finish(session)
+
+
+def test_marker_replaces_configured_profiles():
+    blocker = ResourceBlocker({**CONFIG, "block": ["images"]})
+
+    assert blocker.get_test_profiles(make_node(None)) == ["images"]
+    assert blocker.get_test_profiles(make_node("fonts", "analytics")) == ["fonts", "analytics"]
+    assert blocker.get_test_profiles(make_node()) == []
+
+
+def test_bytes_saved_use_size_hint():
+    blocker = ResourceBlocker(CONFIG, size_hint={"https://www.saucedemo.com/a.png": 2048}.get)
+
+    route_through(blocker, ["images"], make_route("https://www.saucedemo.com/a.png", "image"))
+    route_through(blocker, ["images"], make_route("https://www.saucedemo.com/b.png", "image"))
+
+    assert blocker.stats["blocked"] == 2
+    assert blocker.stats["bytes_saved"] == 2048
+    assert "sizes known for 1 requests" in blocker.get_summary()
+
+
+def test_parse_profile_names():
+    assert parse_profile_names("images,fonts") == ["images", "fonts"]
+    assert parse_profile_names(["images"]) == ["images"]
+    assert parse_profile_names("none") == []
+    assert parse_profile_names(None) == []
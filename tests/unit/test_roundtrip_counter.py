@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+from playwright.sync_api import Locator
+from helpers import roundtrip_counter
+from helpers.roundtrip_counter import (RoundtripCounts, check_roundtrip_budget, count_roundtrips,
+                                       install_roundtrip_counter, uninstall_roundtrip_counter)
+
+
+def make_item(budget=None):
+    item = Mock()
+    item.get_closest_marker.return_value = Mock(args=(budget,)) if budget is not None else None
+    return item
+
+
+count_elements = roundtrip_counter._count_calls(lambda: 3, "Locator.count")
+
+
+def get_dom_size():
+    return count_elements()
+
+
+def test_install_wraps_roundtrip_methods_only():
+    original_count, original_nth = Locator.count, Locator.nth
+    install_roundtrip_counter()
+
+    try:
+        assert Locator.count is not original_count
+        assert Locator.count.__wrapped__ is original_count
+        # Locator builders run locally
+        assert Locator.nth is original_nth
+    finally:
+        uninstall_roundtrip_counter()
+
+    assert Locator.count is original_count
+
+
+def test_calls_are_grouped_by_caller():
+    with count_roundtrips() as counts:
+        assert get_dom_size() == 3
+        get_dom_size()
+
+    # Not counted outside count_roundtrips()
+    get_dom_size()
+
+    assert counts.total == 2
+    assert counts.calls == {("test_roundtrip_counter.get_dom_size", "Locator.count"): 2}
+
+
+def test_async_calls_are_counted():
+    async def evaluate():
+        return "ok"
+
+    counted = roundtrip_counter._count_calls(evaluate, "Page.evaluate")
+
+    async def run():
+        with count_roundtrips() as counts:
+            await counted()
+            await counted()
+        return counts
+
+    counts = asyncio.run(run())
+    assert counts.calls == {("test_roundtrip_counter.test_async_calls_are_counted.run", "Page.evaluate"): 2}
+
+
+def test_merge_and_summary():
+    session = RoundtripCounts()
+    test_counts = RoundtripCounts()
+    test_counts.add("utils.web_utils.get_dom_generation", "Page.evaluate")
+    test_counts.add("utils.web_utils.get_dom_generation", "Page.evaluate")
+    test_counts.add("pages.login_page.LoginPage.login", "Locator.click")
+
+    session.merge(test_counts)
+
+    assert session.tests == 1
+    assert session.get_summary() == ("3 round trips (utils.web_utils.get_dom_generation: 2, "
+                                     "pages.login_page.LoginPage.login: 1)")
+
+
+def test_budget_exceeded_fails_test():
+    counts = RoundtripCounts()
+    for _ in range(3):
+        counts.add("caller", "Locator.count")
+
+    check_roundtrip_budget(make_item(3), counts)
+    check_roundtrip_budget(make_item(), counts)
+
+    with pytest.raises(pytest.fail.Exception, match=r"budget of 2 exceeded: 3 round trips \(caller: 3\)"):
+        check_roundtrip_budget(make_item(2), counts)
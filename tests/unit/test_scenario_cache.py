@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from helpers.scenario_cache import (ScenarioCache, SCENARIO_CACHE, get_scenario_key,
+                                    scenario_prefix, take_snapshot)
+
+URL = "https://www.saucedemo.com/inventory.html"
+STATE = {"cookies": [{"name": "session-username", "value": "standard_user", "expires": -1}],
+         "origins": []}
+CONFIG = {"demo_base_url": "https://www.saucedemo.com/", "scenario_cache": True}
+
+
+def make_page(url=URL):
+    page = Mock()
+    page.url = url
+    page.page = page
+    page.context.storage_state.return_value = STATE
+    page.evaluate.return_value = [{"name": "step", "value": "2"}]
+    return page
+
+
+@scenario_prefix()
+def open_inventory(page, config, username, steps):
+    return steps(username)
+
+
+def setup_function():
+    SCENARIO_CACHE.clear()
+
+
+def test_prefix_replays_once_then_restores_snapshot():
+    steps = Mock()
+
+    assert open_inventory(make_page(), CONFIG, "standard_user", steps) is False
+    page = make_page()
+    assert open_inventory(page, CONFIG, "standard_user", steps) is True
+
+    steps.assert_called_once_with("standard_user")
+    page.context.add_cookies.assert_called_once_with(STATE["cookies"])
+    page.goto.assert_called_once_with(URL)
+
+
+def test_different_arguments_use_different_snapshots():
+    steps = Mock()
+
+    open_inventory(make_page(), CONFIG, "standard_user", steps)
+    open_inventory(make_page(), CONFIG, "visual_user", steps)
+
+    assert steps.call_count == 2
+
+
+def test_scenario_key_depends_on_steps_and_arguments():
+    def prefix_a(page, config, username):
+        return username
+
+    def prefix_b(page, config, username):
+        return username.upper()
+
+    key = get_scenario_key(prefix_a, {"page": Mock(), "config": CONFIG, "username": "a"})
+
+    assert key == get_scenario_key(prefix_a, {"page": Mock(), "config": CONFIG, "username": "a"})
+    assert key != get_scenario_key(prefix_a, {"page": Mock(), "config": CONFIG, "username": "b"})
+    assert key != get_scenario_key(prefix_b, {"page": Mock(), "config": CONFIG, "username": "a"})
+
+
+def test_failed_restore_falls_back_to_replay():
+    cache, replay = ScenarioCache(), Mock()
+    cache.put("key", {"state": STATE, "url": URL})
+    page = make_page(url="https://www.saucedemo.com/")
+
+    assert cache.restore_or_replay("key", page, replay) is False
+
+    replay.assert_called_once()
+    page.context.clear_cookies.assert_called_once()
+    assert cache.stats["failed_restores"] == 1
+
+
+def test_restore_error_falls_back_to_replay():
+    cache, replay, page = ScenarioCache(), Mock(), make_page()
+    cache.put("key", {"state": STATE, "url": URL})
+    page.goto.side_effect = Exception("net::ERR_CONNECTION_RESET")
+
+    assert cache.restore_or_replay("key", page, replay, probe=lambda p: True) is False
+    replay.assert_called_once()
+
+
+def test_snapshot_expires_after_ttl():
+    cache = ScenarioCache()
+
+    with patch("helpers.snapshot_cache.time.time", return_value=1000.0):
+        cache.put("key", {"state": STATE, "url": URL})
+
+    with patch("helpers.snapshot_cache.time.time", return_value=2000.0):
+        assert cache.get("key", ttl=600) is None
+
+
+def test_take_snapshot_with_session_storage():
+    page = make_page()
+
+    assert take_snapshot(page) == {"state": STATE, "url": URL}
+    assert take_snapshot(page, session_storage=True)["session_storage"] == [{"name": "step", "value": "2"}]
+
+
+def test_prefix_replays_in_record_mode_and_when_disabled():
+    steps = Mock()
+
+    for config in ({**CONFIG, "record_mode": True}, {**CONFIG, "scenario_cache": False},
+                   {"demo_base_url": CONFIG["demo_base_url"]}):
+        open_inventory(make_page(), config, "standard_user", steps)
+        assert open_inventory(make_page(), config, "standard_user", steps) is False
+
+    assert steps.call_count == 6
+
+
+def test_prefix_returns_awaitable_steps_for_async_page():
+    page, steps = make_page(), AsyncMock()
+
+    with patch("helpers.scenario_cache.is_async_object", return_value=True):
+        replay = open_inventory(page, CONFIG, "standard_user", steps)
+
+    assert asyncio.run(replay) is False
+    steps.assert_awaited_once_with("standard_user")
+    page.context.storage_state.assert_not_called()
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import Mock
+from helpers.screenshot_pipeline import ScreenshotPipeline
+
+
+def make_page(*screenshots):
+    page = Mock()
+    page.screenshot.side_effect = list(screenshots)
+    return page
+
+
+def test_capture_writes_file_in_background(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {})
+    page = make_page(b"jpeg-data")
+
+    file_name = pipeline.capture(page, "test_login")
+    pipeline.close()
+
+    assert file_name.startswith("test_login-") and file_name.endswith(".jpg")
+    assert (tmp_path / file_name).read_bytes() == b"jpeg-data"
+    assert pipeline.stats["bytes_written"] == len(b"jpeg-data")
+
+
+def test_capture_uses_jpeg_viewport_options(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {"screenshot_quality": 50})
+    page = make_page(b"data")
+
+    pipeline.capture(page, "test")
+    pipeline.close()
+
+    page.screenshot.assert_called_once_with(full_page=False, type="jpeg", quality=50,
+                                            animations="disabled", caret="hide")
+    page.wait_for_timeout.assert_not_called()
+
+
+def test_capture_full_page_png(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {"screenshot_mode": "full_page", "screenshot_format": "png",
+                                             "screenshot_delay": 200})
+    page = make_page(b"png-data")
+
+    file_name = pipeline.capture(page, "test")
+    pipeline.close()
+
+    assert file_name.endswith(".png")
+    page.wait_for_timeout.assert_called_once_with(200)
+    assert page.screenshot.call_args.kwargs["full_page"] is True
+    assert "quality" not in page.screenshot.call_args.kwargs
+
+
+def test_identical_screenshots_are_written_once(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {})
+    page = make_page(b"same", b"same", b"other")
+
+    first = pipeline.capture(page, "test_one")
+    second = pipeline.capture(page, "test_two")
+    third = pipeline.capture(page, "test_three")
+    pipeline.close()
+
+    assert first == second != third
+    assert pipeline.stats["captured"] == 3
+    assert pipeline.stats["deduplicated"] == 1
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_element_mode_captures_element(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {"screenshot_mode": "element", "screenshot_selector": "#main"})
+    page = Mock()
+    page.locator.return_value.first.screenshot.return_value = b"element"
+
+    file_name = pipeline.capture(page, "test")
+    pipeline.close()
+
+    page.locator.assert_called_once_with("#main")
+    page.screenshot.assert_not_called()
+    assert (tmp_path / file_name).read_bytes() == b"element"
+
+
+def test_element_mode_falls_back_to_viewport(tmp_path):
+    pipeline = ScreenshotPipeline(tmp_path, {"screenshot_mode": "element"})
+    page = make_page(b"viewport")
+    page.locator.return_value.first.screenshot.side_effect = TimeoutError("hidden")
+
+    file_name = pipeline.capture(page, "test")
+    pipeline.close()
+
+    assert page.screenshot.call_args.kwargs["full_page"] is False
+    assert (tmp_path / file_name).read_bytes() == b"viewport"
+
+
+@pytest.mark.parametrize("config", [{"screenshot_mode": "window"}, {"screenshot_format": "gif"}])
+def test_invalid_config(tmp_path, config):
+    with pytest.raises(ValueError):
+        ScreenshotPipeline(tmp_path, config)
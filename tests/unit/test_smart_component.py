@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import Mock
+from wrappers.smart_component import SmartComponent
+from wrappers.smart_locator import SmartLocator, FIXED_SELECTORS
+
+
+class ProductCard(SmartComponent):
+
+    def __init__(self, owner, root_selector):
+        super().__init__(owner, root_selector)
+        self.price = SmartLocator(self, ".price")
+
+
+@pytest.fixture
+def mock_owner():
+    """Creates a mocked page object owner with all required fields."""
+    FIXED_SELECTORS.clear()
+    owner = Mock()
+    owner.page = Mock()
+    owner.config = {}
+    owner.placeholder_manager = Mock()
+    owner.placeholder_manager.replace_placeholders_with_values.side_effect = lambda x: x
+    owner.keyword = "Backpack"
+    owner.get_keyword.return_value = "Backpack"
+    return owner
+
+
+def test_init_copies_owner_fields(mock_owner):
+    card = ProductCard(mock_owner, "div.card")
+    assert card.page is mock_owner.page
+    assert card.config is mock_owner.config
+    assert card.placeholder_manager is mock_owner.placeholder_manager
+    assert card.keyword == "Backpack"
+    assert card.index is None
+
+
+def test_root_locator_replaces_keyword(mock_owner):
+    card = ProductCard(mock_owner, "smart=div.card|#KEYWORD#|")
+    root = card.root_locator()
+    mock_owner.page.locator.assert_called_once_with("smart=div.card|Backpack|")
+    assert root is mock_owner.page.locator.return_value
+
+
+def test_child_locator_resolves_inside_root(mock_owner):
+    card = ProductCard(mock_owner, "div.card")
+    root = mock_owner.page.locator.return_value
+
+    locator = card.price.locator
+
+    root.locator.assert_called_once_with(".price")
+    assert locator is root.locator.return_value
+    assert card.price.cache_key == "ProductCard.price"
+
+
+def test_nested_component_resolves_inside_parent_root(mock_owner):
+    outer = ProductCard(mock_owner, "div.list")
+    inner = ProductCard(outer, "div.card")
+    outer_root = mock_owner.page.locator.return_value
+
+    inner.root_locator()
+
+    outer_root.locator.assert_called_once_with("div.card")
+
+
+def test_nth_rebinds_children(mock_owner):
+    card = ProductCard(mock_owner, "div.card")
+    second = card.nth(1)
+    root = mock_owner.page.locator.return_value
+
+    assert second.index == 1
+    assert card.index is None
+    assert second.price.owner is second
+    assert card.price.owner is card
+
+    second.price.locator
+    root.nth.assert_called_once_with(1)
+    root.nth.return_value.locator.assert_called_once_with(".price")
+
+
+def test_all_returns_component_per_match(mock_owner):
+    mock_owner.page.locator.return_value.count.return_value = 3
+    card = ProductCard(mock_owner, "div.card")
+
+    cards = card.all()
+
+    assert [c.index for c in cards] == [0, 1, 2]
+    assert [c.index for c in card] == [0, 1, 2]
+
+
+def test_fixed_selector_is_made_relative_to_root(monkeypatch, mock_owner):
+    """Selectors of the element picker are document-level, the component root scopes them."""
+    mock_owner.config = {"record_mode": True}
+    monkeypatch.setattr("wrappers.smart_locator.handle_missing_locator",
+                        lambda *args: "(//span[@class='price'])[2]")
+    monkeypatch.setattr("wrappers.smart_locator.update_source_file", lambda *args: None)
+    relative_to = Mock(return_value="xpath=./div/span[2]")
+    monkeypatch.setattr("wrappers.smart_locator.get_selector_relative_to", relative_to)
+    card = ProductCard(mock_owner, "div.card")
+    root = mock_owner.page.locator.return_value
+
+    card.price._fix_locator()
+
+    relative_to.assert_called_once_with(root, mock_owner.page.locator.return_value,
+                                        "(//span[@class='price'])[2]")
+    root.locator.assert_called_with("xpath=./div/span[2]")
+    assert FIXED_SELECTORS["ProductCard.price"] == "xpath=./div/span[2]"
+
@@ -1,7 +1,12 @@
 import pytest
 from unittest.mock import Mock, patch
-from wrappers.smart_expect import SmartExpect, expect, FIXED_EXPECTS
+import re
+from playwright.sync_api import Locator as PlaywrightLocator, Page as PlaywrightPage
+from tests.fakes.fake_playwright import FakePage, expect as fake_pw_expect
+from wrappers.smart_expect import (SmartExpect, ExpectGroup, expect, expect_all,
+                                   FIXED_EXPECTS, GROUP_CHECK_SCRIPT)
 from wrappers.smart_locator import SmartLocator
+from wrappers.smart_page import SmartPage
 
 
 # ---------------------------------------------------------------------
@@ -229,3 +234,222 @@ def test_dir_returns_inner_dir(mock_smart_locator):
 def test_expect_function_returns_smartexpect(mock_smart_locator):
     obj = expect(mock_smart_locator)
     assert isinstance(obj, SmartExpect)
+
+
+# ---------------------------------------------------------------------
+# Grouped expectations
+# ---------------------------------------------------------------------
+
+def make_group_locator(page, name):
+    sl = Mock(spec=SmartLocator)
+    sl.page = page
+    sl.config = {"timeout": 0}
+    sl.placeholder_manager = Mock()
+    sl.placeholder_manager.replace_placeholders_with_values.side_effect = lambda x: x.replace("#P#", "value")
+    sl.locator = Mock(name=f"{name}_locator")
+    sl.locator.element_handles.return_value = [Mock(name=f"{name}_handle")]
+    return sl
+
+
+def group_state(*passes, generation="doc:1", stale=False):
+    return {"generation": generation, "stale": stale,
+            "results": [{"pass": p, "actual": "actual"} for p in passes]}
+
+
+def test_group_verifies_all_conditions_in_one_evaluate(patch_playwright_classes):
+    page = Mock()
+    header, price = make_group_locator(page, "header"), make_group_locator(page, "price")
+    page.evaluate.return_value = group_state(True, True, True)
+
+    with SmartExpect.group() as group:
+        group.expect(header).to_have_text("#P#")
+        group.expect(price).to_have_text(re.compile(r"^\$", re.MULTILINE))
+        group.expect(price).not_to_be_checked()
+
+    page.evaluate.assert_called_once()
+    script, arg = page.evaluate.call_args[0]
+    assert script == GROUP_CHECK_SCRIPT
+    assert arg["checks"][0] == {"kind": "text", "negated": False, "expected": {"text": "value"}}
+    assert arg["checks"][1]["expected"] == {"regex": {"source": r"^\$", "flags": "m"}}
+    assert arg["checks"][2]["negated"] is True
+    assert arg["elements"][0] == header.locator.element_handles.return_value
+
+
+def test_group_reports_every_failed_condition(patch_playwright_classes):
+    page = Mock()
+    header, price = make_group_locator(page, "header"), make_group_locator(page, "price")
+    page.evaluate.return_value = group_state(False, True, False)
+
+    group = ExpectGroup()
+    group.expect(header).to_have_text("Swag Labs")
+    group.expect(price).to_be_visible()
+    group.expect(price).to_have_value("5")
+
+    with pytest.raises(AssertionError) as error:
+        group.verify()
+
+    message = str(error.value)
+    assert "2 of 3 expectations failed" in message
+    assert "to_have_text('Swag Labs')" in message
+    assert "to_have_value('5')" in message
+
+
+def test_group_resolves_elements_again_after_dom_change(monkeypatch, patch_playwright_classes):
+    monkeypatch.setattr("wrappers.smart_expect.time.sleep", lambda s: None)
+    page = Mock()
+    header = make_group_locator(page, "header")
+    page.evaluate.side_effect = [group_state(False, generation="doc:1"),
+                                 group_state(False, generation="doc:2"),
+                                 group_state(True, generation="doc:2")]
+
+    group = ExpectGroup(timeout=60000)
+    group.expect(header).to_be_visible()
+    group.verify()
+
+    assert page.evaluate.call_count == 3
+    assert header.locator.element_handles.call_count == 2
+
+
+def test_group_disposes_resolved_handles(monkeypatch, patch_playwright_classes):
+    monkeypatch.setattr("wrappers.smart_expect.time.sleep", lambda s: None)
+    page = Mock()
+    header = make_group_locator(page, "header")
+    resolved = []
+    header.locator.element_handles.side_effect = lambda: resolved.append([Mock(), Mock()]) or resolved[-1]
+    page.evaluate.side_effect = [group_state(False, generation="doc:1"),
+                                 group_state(False, generation="doc:2"),
+                                 group_state(True, generation="doc:2")]
+
+    group = ExpectGroup(timeout=60000)
+    group.expect(header).to_be_visible()
+    group.verify()
+
+    # Handles of the changed DOM before resolving again, the last ones on exit
+    assert len(resolved) == 2
+    for handles in resolved:
+        for handle in handles:
+            handle.dispose.assert_called_once()
+
+
+def test_group_waits_between_polls_while_dom_keeps_changing(monkeypatch, patch_playwright_classes):
+    """A DOM changing on every poll does not busy-loop past the timeout."""
+    sleeps = []
+    clock = iter(range(100))
+    monkeypatch.setattr("wrappers.smart_expect.time.sleep", sleeps.append)
+    monkeypatch.setattr("wrappers.smart_expect.time.monotonic", lambda: next(clock))
+    page = Mock()
+    header = make_group_locator(page, "header")
+    page.evaluate.return_value = group_state(True, stale=True)
+
+    group = ExpectGroup(timeout=5000)
+    group.expect(header).to_be_visible()
+
+    with pytest.raises(AssertionError, match="page DOM kept changing"):
+        group.verify()
+
+    assert page.evaluate.call_count == len(sleeps) + 1 == 3
+
+
+def test_group_resolves_shared_locator_once(patch_playwright_classes):
+    _, Page, _ = patch_playwright_classes
+    page = Page()
+    page.evaluate = Mock(return_value=group_state(True, True, True))
+    price = make_group_locator(page, "price")
+
+    with SmartExpect.group() as group:
+        group.expect(price).to_be_visible()
+        group.expect(price).to_have_text("$29.99")
+        group.expect(page).to_have_url("https://www.saucedemo.com/inventory.html")
+
+    price.locator.element_handles.assert_called_once()
+    handles = price.locator.element_handles.return_value
+    assert page.evaluate.call_args[0][1]["elements"] == [handles, handles, []]
+
+
+def test_group_in_record_mode_uses_smart_expect(monkeypatch, patch_playwright_classes):
+    calls = []
+    monkeypatch.setattr("wrappers.smart_expect.expect",
+                        lambda actual: Mock(to_have_text=lambda *a: calls.append((actual, a))))
+    page = Mock()
+    header = make_group_locator(page, "header")
+    header.config = {"record_mode": True}
+
+    group = ExpectGroup()
+    group.expect(header).to_have_text("Swag Labs")
+    group.verify()
+
+    assert calls == [(header, ("Swag Labs",))]
+    page.evaluate.assert_not_called()
+
+
+def test_group_rejects_unsupported_matcher(mock_smart_locator):
+    with pytest.raises(AttributeError):
+        ExpectGroup().expect(mock_smart_locator).to_have_css("color", "red")
+
+
+def test_expect_all_accepts_condition_tuples(patch_playwright_classes):
+    _, Page, _ = patch_playwright_classes
+    page = Page()
+    page.evaluate = Mock(return_value=group_state(True, True))
+    header = make_group_locator(page, "header")
+
+    expect_all([
+        (page, "to_have_url", "https://www.saucedemo.com/inventory.html"),
+        (header, "to_be_visible"),
+    ])
+
+    checks = page.evaluate.call_args[0][1]["checks"]
+    assert [c["kind"] for c in checks] == ["url", "visible"]
+
+
+# ---------------------------------------------------------------------
+# SmartExpect on the in-memory fake page
+# ---------------------------------------------------------------------
+
+INVENTORY_HTML = """
+<span class="title">Products</span>
+<input id="search" value="backpack">
+<input type="checkbox" id="remember" checked>
+<p class="error" hidden>Epic sadface</p>
+"""
+
+
+class FakeInventoryPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.title = SmartLocator(self, ".title")
+        self.search = SmartLocator(self, "#search")
+        self.remember = SmartLocator(self, "#remember")
+        self.error = SmartLocator(self, ".error")
+
+
+@pytest.fixture
+def fake_inventory_page(monkeypatch):
+    """Runs SmartExpect against the fake page instead of the patched Playwright classes."""
+    monkeypatch.setattr("wrappers.smart_expect.pw_expect", fake_pw_expect)
+    monkeypatch.setattr("wrappers.smart_expect.Locator", PlaywrightLocator)
+    monkeypatch.setattr("wrappers.smart_expect.Page", PlaywrightPage)
+    return FakeInventoryPage(FakePage(INVENTORY_HTML, url="https://www.saucedemo.com/inventory.html"),
+                         {"timeout": 0})
+
+
+def test_fake_page_expect_passes_and_fails(fake_inventory_page):
+    expect(fake_inventory_page.title).to_have_text("Products")
+    expect(fake_inventory_page.search).to_have_value(re.compile("back"))
+    expect(fake_inventory_page.page).to_have_url(re.compile("inventory"))
+
+    with pytest.raises(AssertionError, match="Actual value: Products"):
+        expect(fake_inventory_page.title).to_have_text("Your Cart")
+
+
+def test_fake_page_expect_record_mode_fixes_expected_value(monkeypatch, fake_inventory_page):
+    fake_inventory_page.config["record_mode"] = True
+    updates = []
+    monkeypatch.setattr("wrappers.smart_expect.fix_noname_parameter_value",
+                        lambda *args: updates.append(args[:4]) or ("expected", "Products"))
+
+    expect(fake_inventory_page.title).to_have_text("Your Cart")
+
+    assert updates == [("expected", fake_inventory_page.page, 0, "Your Cart")]
+    assert FIXED_EXPECTS["FakeInventoryPage.title"] == ("expected", "Products")
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import Mock, patch
+from tests.fakes.fake_playwright import FakePage
 from wrappers.smart_locator import SmartLocator, FIXED_SELECTORS, FIXED_VALUES
+from wrappers.smart_page import SmartPage
 
 
 @pytest.fixture
@@ -137,3 +139,238 @@ def test_str_representation(monkeypatch, mock_owner):
     result = str(sl)
     assert "SmartLocator" in result
     assert "selector" in result
+
+
+def test_element_cache_disabled_uses_locator_count(monkeypatch, mock_owner):
+    """Without element_cache the count comes from a fresh selector query."""
+    generation = Mock(return_value="doc:1")
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", generation)
+    mock_owner.page.locator.return_value.count.return_value = 2
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl._element_count() == 2
+    assert sl._get_cached_element() is None
+    generation.assert_not_called()
+
+
+def test_element_cache_reuses_handle_while_dom_unchanged(monkeypatch, mock_owner):
+    """The resolved element is reused until the DOM generation changes."""
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: "doc:1")
+    mock_owner.config = {"element_cache": True}
+    handle = Mock(name="handle")
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.return_value = [handle]
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl._get_cached_element() is handle
+    assert sl._get_cached_element() is handle
+    locator.element_handles.assert_called_once()
+
+
+def test_element_cache_skips_locators_matching_several_elements(monkeypatch, mock_owner):
+    """Several matches are not cached, the locator keeps Playwright's strict mode check."""
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: "doc:1")
+    mock_owner.config = {"element_cache": True}
+    handles = [Mock(name="first"), Mock(name="second")]
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.return_value = handles
+    locator.click = Mock(side_effect=Exception("strict mode violation"))
+
+    sl = SmartLocator(mock_owner, "button")
+    assert sl._get_cached_element() is None
+    assert sl._get_cached_element() is None
+    locator.element_handles.assert_called_once()
+    assert all(handle.dispose.called for handle in handles)
+
+    with pytest.raises(Exception):
+        sl.click()
+    handles[0].click.assert_not_called()
+
+
+def test_element_cache_uses_locator_for_unsupported_handle_options(monkeypatch, mock_owner):
+    """Locator options missing on ElementHandle methods (timeout of inner_text) skip the handle."""
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: "doc:1")
+    mock_owner.config = {"element_cache": True}
+    handle = Mock(name="handle")
+    handle.inner_text = lambda: "cached text"
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.return_value = [handle]
+    locator.inner_text = lambda timeout=None: "locator text"
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl.inner_text(timeout=1000) == "locator text"
+    assert sl.inner_text() == "cached text"
+
+
+def test_element_cache_falls_back_only_for_stale_handles(monkeypatch, mock_owner):
+    from playwright.sync_api import Error
+
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: "doc:1")
+    mock_owner.config = {"element_cache": True}
+    handle = Mock(name="handle")
+    handle.inner_text.side_effect = Error("Element is not attached to the DOM")
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.return_value = [handle]
+    locator.inner_text = lambda timeout=None: "locator text"
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl.inner_text() == "locator text"
+    handle.dispose.assert_called_once()
+
+
+def test_element_cache_invalidated_by_dom_generation(monkeypatch, mock_owner):
+    """A new DOM generation disposes the stale handle and resolves again."""
+    generations = iter(["doc:1", "doc:2"])
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: next(generations))
+    mock_owner.config = {"element_cache": True}
+    old_handle, new_handle = Mock(name="old"), Mock(name="new")
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.side_effect = [[old_handle], [new_handle]]
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl._get_cached_element() is old_handle
+    assert sl._get_cached_element() is new_handle
+    old_handle.dispose.assert_called_once()
+
+
+def test_getattr_runs_action_on_cached_element(monkeypatch, mock_owner):
+    """Supported actions are dispatched to the cached element handle."""
+    monkeypatch.setattr("wrappers.smart_locator.get_dom_generation", lambda page: "doc:1")
+    mock_owner.config = {"element_cache": True}
+    handle = Mock(name="handle")
+    handle.inner_text.return_value = "cached text"
+    locator = mock_owner.page.locator.return_value
+    locator.element_handles.return_value = [handle]
+    locator.inner_text = lambda timeout=None: "locator text"
+
+    sl = SmartLocator(mock_owner, "#input")
+    assert sl.inner_text() == "cached text"
+
+
+# ---------------------------------------------------------------------
+# SmartLocator on the in-memory fake page
+# ---------------------------------------------------------------------
+
+LOGIN_HTML = """
+<form>
+    <label>Username <input id="user-name" placeholder="Username"></label>
+    <input id="password" type="password" style="color: black">
+    <input type="submit" data-test="login-button" value="Login">
+</form>
+<div class="error"><h3>Epic sadface: Username is required</h3></div>
+"""
+
+
+class FakeLoginPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.user_name = SmartLocator(self, "#user-name")
+        self.password = SmartLocator(self, "#password")
+        self.login_button = SmartLocator(self, "#login-button")
+        self.username_label = SmartLocator(self, "//label[normalize-space(text())='Username']")
+        self.error_message = SmartLocator(self, "(//div[@class='error']/h3)[1]")
+
+
+@pytest.fixture
+def fake_login_page():
+    FIXED_SELECTORS.clear()
+    FIXED_VALUES.clear()
+    yield FakeLoginPage(FakePage(LOGIN_HTML), {})
+    FIXED_SELECTORS.clear()
+    FIXED_VALUES.clear()
+
+
+def test_fake_page_actions_reach_the_dom(fake_login_page):
+    fake_login_page.user_name.fill("standard_user")
+
+    assert fake_login_page.user_name.input_value() == "standard_user"
+    assert fake_login_page.page.actions[-1][::2] == ("fill", "standard_user")
+
+
+def test_fake_page_record_mode_heals_missing_selector(monkeypatch, fake_login_page):
+    """A selector matching nothing is replaced and the action is retried on the new element."""
+    fake_login_page.config["record_mode"] = True
+    healing = []
+    monkeypatch.setattr("wrappers.smart_locator.handle_missing_locator",
+                        lambda page, *args: healing.append(args) or "xpath=//input[@data-test='login-button']")
+    monkeypatch.setattr("wrappers.smart_locator.update_source_file", lambda *args: None)
+
+    fake_login_page.login_button.click()
+
+    assert healing == [("FakeLoginPage.login_button", "#login-button", None)]
+    assert FIXED_SELECTORS["FakeLoginPage.login_button"] == "xpath=//input[@data-test='login-button']"
+    assert fake_login_page.page.actions[-1][1].attrs["value"] == "Login"
+
+
+def test_fake_page_xpath_locators(fake_login_page):
+    fake_login_page.username_label.locator.locator("//input").fill("standard_user")
+
+    assert fake_login_page.user_name.input_value() == "standard_user"
+    assert fake_login_page.error_message.inner_text() == "Epic sadface: Username is required"
+    assert fake_login_page.error_message.locator.locator("..").get_attribute("class") == "error"
+
+
+def test_fake_page_record_mode_fixes_none_value(monkeypatch, fake_login_page):
+    fake_login_page.config["record_mode"] = True
+    monkeypatch.setattr("wrappers.smart_locator.fix_noname_parameter_value",
+                        lambda *args: ("value", "secret_sauce"))
+
+    fake_login_page.password.fill(None)
+
+    assert fake_login_page.password.input_value() == "secret_sauce"
+    assert FIXED_VALUES["FakeLoginPage.password"] == ("value", "secret_sauce")
+
+
+@pytest.mark.fake_contract
+def test_fake_page_element_cache_follows_dom_changes(fake_login_page):
+    fake_login_page.config["element_cache"] = True
+    page = fake_login_page.page
+    # A new document is a new DOM generation
+    page.add_evaluate_hook("smartDomGeneration", lambda target, arg: str(id(page.document)))
+    fake_login_page.user_name.fill("standard_user")
+    handle = fake_login_page.user_name._get_cached_element()
+
+    assert fake_login_page.user_name._get_cached_element() is handle
+
+    page.set_content(LOGIN_HTML)
+    fake_login_page.user_name.fill("locked_out_user")
+
+    assert handle.disposed
+    assert fake_login_page.user_name._get_cached_element() is not handle
+    assert fake_login_page.user_name.input_value() == "locked_out_user"
+
+
+@pytest.mark.fake_contract
+def test_fake_page_highlight_is_removed_after_action(fake_login_page):
+    fake_login_page.config["highlight"] = True
+    page = fake_login_page.page
+    styles = []
+
+    def highlight(element, arg):
+        styles.append(element.attrs.get("style"))
+        element.attrs["style"] = "border: 2px solid red"
+
+    page.add_evaluate_hook("el => el.getAttribute('style')", lambda element, arg: element.attrs.get("style"))
+    page.add_evaluate_hook("el.setAttribute('style', (", highlight)
+    page.add_evaluate_hook("el.removeAttribute('style')", lambda element, arg: element.attrs.pop("style"))
+
+    fake_login_page.user_name.fill("standard_user")
+
+    assert styles == [None]
+    assert page.locator("#user-name").get_attribute("style") is None
+
+
+@pytest.mark.fake_contract
+def test_fake_page_highlight_is_removed_after_failed_action(fake_login_page):
+    fake_login_page.config["highlight"] = True
+    page = fake_login_page.page
+    page.add_evaluate_hook("el => el.getAttribute('style')", lambda element, arg: element.attrs.get("style"))
+    page.add_evaluate_hook("el.setAttribute('style', (",
+                           lambda element, arg: element.attrs.update(style="border: 2px solid red"))
+    page.add_evaluate_hook("el.removeAttribute('style')", lambda element, arg: element.attrs.pop("style"))
+
+    with pytest.raises(AttributeError):
+        fake_login_page.error_message.fill("standard_user")
+
+    assert page.locator("h3").get_attribute("style") is None
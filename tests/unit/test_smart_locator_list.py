@@ -0,0 +1,118 @@
+import re
+import pytest
+from unittest.mock import Mock
+from wrappers.smart_expect import EXPECT_TIMEOUT
+from wrappers.smart_locator import FIXED_SELECTORS
+from wrappers.smart_locator_list import SmartLocatorList, SNAPSHOT_SCRIPT
+
+
+def make_entry(text, visible=True, **fields):
+    return {
+        "text": text,
+        "value": None,
+        "visible": visible,
+        "attributes": {},
+        "fields": {name: {"text": value, "value": None, "visible": True, "attributes": {}}
+                   for name, value in fields.items()},
+    }
+
+
+SNAPSHOT = [
+    make_entry("Backpack $29.99", name="Backpack", price="$29.99"),
+    make_entry("Bike Light $9.99", name="Bike Light", price="$9.99"),
+]
+
+
+@pytest.fixture
+def mock_owner():
+    """Creates a mocked owner whose locator returns a fixed snapshot."""
+    FIXED_SELECTORS.clear()
+    owner = Mock()
+    owner.page = Mock()
+    owner.page.locator.return_value.evaluate_all.return_value = SNAPSHOT
+    owner.config = {"timeout": 0}
+    owner.placeholder_manager = Mock()
+    owner.placeholder_manager.replace_placeholders_with_values.side_effect = lambda x: x
+    owner.keyword = None
+    owner.get_keyword.return_value = None
+    return owner
+
+
+def make_list(owner):
+    return SmartLocatorList(owner, "div.item", fields={"name": ".name", "price": ".price"})
+
+
+def test_snapshot_uses_single_evaluate(mock_owner):
+    items = make_list(mock_owner)
+    assert items.snapshot() == SNAPSHOT
+    mock_owner.page.locator.return_value.evaluate_all.assert_called_once_with(
+        SNAPSHOT_SCRIPT, {"fields": {"name": ".name", "price": ".price"}, "attributes": []})
+
+
+def test_texts_and_field_texts(mock_owner):
+    items = make_list(mock_owner)
+    assert items.texts() == ["Backpack $29.99", "Bike Light $9.99"]
+    assert items.texts("price") == ["$29.99", "$9.99"]
+    assert items.visibility() == [True, True]
+
+
+def test_rows_by_key(mock_owner):
+    items = make_list(mock_owner)
+    assert items.rows_by("name")["Bike Light"]["price"] == "$9.99"
+    assert items.row_by("name", "Backpack")["price"] == "$29.99"
+    assert items.row_by("name", "Onesie") is None
+
+
+def test_attribute_values_requests_attribute(mock_owner):
+    items = make_list(mock_owner)
+    locator = mock_owner.page.locator.return_value
+    locator.evaluate_all.return_value = [
+        {**make_entry("a"), "attributes": {"id": "first"}},
+        {**make_entry("b"), "attributes": {"id": None}},
+    ]
+    assert items.attribute_values("id") == ["first", None]
+    assert locator.evaluate_all.call_args[0][1]["attributes"] == ["id"]
+
+
+def test_expect_texts_and_regex_pass(mock_owner):
+    items = make_list(mock_owner)
+    items.expect_count(2)
+    items.expect_texts(["Backpack", "Bike Light"], field="name")
+    items.expect_all_texts_match(r"^\$\d+\.\d{2}$", field="price")
+    items.expect_all_texts_match(re.compile("Light|Backpack"))
+    items.expect_fields_by_key("name", "price", {"Bike Light": "$9.99"})
+
+
+def test_expect_texts_fails_with_actual_values(mock_owner):
+    items = make_list(mock_owner)
+    with pytest.raises(AssertionError, match="got \\['Backpack', 'Bike Light'\\]"):
+        items.expect_texts(["Backpack"], field="name", timeout=0)
+
+
+def test_expect_fields_by_key_reports_missing_keys(mock_owner):
+    items = make_list(mock_owner)
+    with pytest.raises(AssertionError, match="Onesie"):
+        items.expect_fields_by_key("name", "price", {"Onesie": "$7.99", "Backpack": "$29.99"}, timeout=0)
+
+
+def test_expect_retries_until_snapshot_matches(monkeypatch, mock_owner):
+    monkeypatch.setattr("wrappers.smart_locator_list.time.sleep", lambda s: None)
+    locator = mock_owner.page.locator.return_value
+    locator.evaluate_all.side_effect = [[], [], SNAPSHOT]
+
+    make_list(mock_owner).expect_count(2)
+
+    assert locator.evaluate_all.call_count == 3
+
+
+def test_expect_waits_for_expect_timeout_not_action_timeout(monkeypatch, mock_owner):
+    monkeypatch.setattr("wrappers.smart_locator_list.time.monotonic", lambda: 100.0)
+    mock_owner.config = {"timeout": 10000}
+
+    assert make_list(mock_owner)._get_deadline() == 100.0 + EXPECT_TIMEOUT / 1000.0
+
+
+def test_expect_all_visible_fails_on_hidden(mock_owner):
+    mock_owner.page.locator.return_value.evaluate_all.return_value = [make_entry("a"), make_entry("b", visible=False)]
+    with pytest.raises(AssertionError, match="\\[1\\]"):
+        make_list(mock_owner).expect_all_visible(timeout=0)
@@ -10,7 +10,13 @@ from wrappers.smart_page import (
     PAGE_URL,
     FRAME_NAME,
     FRAME_URL,
+    FORM_FIELD_KINDS,
+    FAST_FORM_FILL_SCRIPT,
 )
+from enums.update_type import UpdateType
+from pages.login_page import LoginPage
+from tests.fakes.fake_playwright import FakePage
+from wrappers.smart_locator import SmartLocator, FIXED_VALUES
 
 
 @pytest.fixture(autouse=True)
@@ -271,3 +277,202 @@ def test_str_and_repr(mock_page, mock_placeholder):
     s = str(sp)
     assert "SmartPage" in s
     assert s == repr(sp)
+
+
+# ---------------------------------------------------------------------
+# fill_fields
+# ---------------------------------------------------------------------
+
+class FormPage(SmartPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.name_input = SmartLocator(self, "#name")
+        self.agree_checkbox = SmartLocator(self, "#agree")
+        self.avatar_input = SmartLocator(self, "#avatar")
+
+
+@pytest.fixture
+def form_page(mock_page, mock_placeholder):
+    FORM_FIELD_KINDS.clear()
+    locators = {}
+
+    def make_locator(selector):
+        return locators.setdefault(selector, Mock(name=selector))
+
+    mock_page.locator.side_effect = make_locator
+    page = FormPage(mock_page, {})
+    yield page, locators
+    FORM_FIELD_KINDS.clear()
+
+
+def test_fill_fields_runs_actions_by_field_kind(form_page):
+    page, locators = form_page
+    for selector, kind in {"#name": "fill", "#agree": "check", "#avatar": "file"}.items():
+        locators[selector] = Mock(name=selector)
+        locators[selector].evaluate.return_value = kind
+
+    timings = page.fill_fields({"name_input": "John", "agree_checkbox": True,
+                              "avatar_input": "README.md"})
+
+    locators["#name"].fill.assert_called_once_with("replaced:John")
+    locators["#agree"].set_checked.assert_called_once_with(True)
+    locators["#avatar"].set_input_files.assert_called_once_with("replaced:README.md")
+    assert list(timings) == ["name_input", "agree_checkbox", "avatar_input"]
+    assert FORM_FIELD_KINDS == {"FormPage.name_input": "fill",
+                                "FormPage.agree_checkbox": "check",
+                                "FormPage.avatar_input": "file"}
+
+
+def test_fill_fields_reuses_detected_field_kinds(form_page):
+    page, locators = form_page
+    FORM_FIELD_KINDS["FormPage.name_input"] = "fill"
+
+    page.fill_fields({"name_input": "John"})
+    page.fill_fields({"name_input": "Jane"})
+
+    locators["#name"].evaluate.assert_not_called()
+    assert locators["#name"].fill.call_count == 2
+
+
+def test_fill_fields_fast_sets_values_with_one_evaluate(form_page, mock_page):
+    page, locators = form_page
+    mock_page.evaluate.return_value = [
+        {"kind": "fill", "skipped": False, "ms": 0.5},
+        {"kind": "file", "skipped": True, "ms": 0},
+    ]
+
+    timings = page.fill_fields({"name_input": "John", "avatar_input": "README.md"}, fast=True)
+
+    script, items = mock_page.evaluate.call_args[0]
+    assert script == FAST_FORM_FILL_SCRIPT
+    assert items == [{"element": locators["#name"].element_handle.return_value, "value": "replaced:John"},
+                     {"element": locators["#avatar"].element_handle.return_value,
+                      "value": "replaced:README.md"}]
+    locators["#name"].fill.assert_not_called()
+    locators["#name"].element_handle.return_value.dispose.assert_called_once()
+    # File inputs are set with a trusted action after the batch
+    locators["#avatar"].set_input_files.assert_called_once_with("replaced:README.md")
+    assert timings["name_input"] == 0.5
+
+
+def test_fill_fields_prints_timings_only_when_verbose(form_page, capsys):
+    page, _ = form_page
+    FORM_FIELD_KINDS["FormPage.name_input"] = "fill"
+
+    timings = page.fill_fields({"name_input": "John"})
+    assert list(timings) == ["name_input"]
+    assert capsys.readouterr().out == ""
+
+    page.fill_fields({"name_input": "John"}, verbose=True)
+    assert capsys.readouterr().out.startswith("Form filled: name_input=")
+
+
+def test_fill_fields_in_record_mode_uses_smart_locator_wrapper(form_page, monkeypatch):
+    page, locators = form_page
+    page.config["record_mode"] = True
+    FORM_FIELD_KINDS["FormPage.name_input"] = "fill"
+    calls = []
+    monkeypatch.setattr(SmartLocator, "fill", lambda self, value: calls.append((self, value)),
+                        raising=False)
+
+    page.fill_fields({"name_input": None}, fast=True)
+
+    assert calls == [(page.name_input, None)]
+    page.page.evaluate.assert_not_called()
+
+
+def test_fill_fields_takes_positional_values_for_field_tuple(form_page):
+    page, locators = form_page
+    FORM_FIELD_KINDS.update({"FormPage.name_input": "fill", "FormPage.agree_checkbox": "check"})
+
+    page.fill_fields((page.name_input, "agree_checkbox"), "John", False)
+
+    locators["#name"].fill.assert_called_once_with("replaced:John")
+    locators["#agree"].set_checked.assert_called_once_with(False)
+
+
+def test_fill_fields_rejects_missing_values(form_page):
+    page, _ = form_page
+
+    with pytest.raises(TypeError, match="Got 1 values for 2 form fields"):
+        page.fill_fields(("name_input", "agree_checkbox"), "John")
+
+    with pytest.raises(TypeError, match="given in the fields dict"):
+        page.fill_fields({"name_input": "John"}, "Jane")
+
+
+def test_fill_fields_record_mode_traces_none_to_page_object_parameter(mock_page, mock_placeholder,
+                                                                      monkeypatch):
+    login_page = LoginPage(mock_page, {"record_mode": True})
+    FORM_FIELD_KINDS.update({"LoginPage.username_input": "fill", "LoginPage.password_input": "fill"})
+    fixes, calls = [], []
+    monkeypatch.setattr("helpers.record_mode_helper.fix_value_in_file",
+                        lambda *args: fixes.append(args) or (UpdateType.DATA_PROVIDER, "standard_user"))
+    monkeypatch.setattr(SmartLocator, "fill", lambda self, value: calls.append((self.field_name, value)),
+                        raising=False)
+
+    try:
+        login_page.fill_form(None, "secret_sauce")
+    finally:
+        FIXED_VALUES.clear()
+        FORM_FIELD_KINDS.clear()
+
+    _, _, filename, _, code, param_index, old_value, _, _ = fixes[0]
+    assert filename == __file__
+    assert "login_page.fill_form(None" in code
+    assert (param_index, old_value) == (0, "None")
+    assert calls == [("username_input", "standard_user"), ("password_input", "secret_sauce")]
+
+
+def test_fill_fields_rejects_non_locator_fields(form_page):
+    page, _ = form_page
+
+    with pytest.raises(TypeError):
+        page.fill_fields({"config": "value"})
+
+
+# ---------------------------------------------------------------------
+# SmartPage on the in-memory fake page
+# ---------------------------------------------------------------------
+
+CHECKOUT_URL = "https://www.saucedemo.com/checkout-step-one.html"
+CHECKOUT_HTML = """
+<form>
+    <input id="name">
+    <input type="checkbox" id="agree">
+    <input type="file" id="avatar">
+    <select id="country"><option value="us">United States</option><option value="de">Germany</option></select>
+</form>
+"""
+
+
+class FakeCheckoutPage(FormPage):
+
+    def __init__(self, page, config):
+        super().__init__(page, config)
+        self.country_select = SmartLocator(self, "#country")
+
+
+@pytest.fixture
+def fake_checkout_page():
+    fake_page = FakePage(routes={CHECKOUT_URL: CHECKOUT_HTML})
+    return FakeCheckoutPage(fake_page, {})
+
+
+def test_fake_page_goto_loads_route(fake_checkout_page):
+    fake_checkout_page.goto(CHECKOUT_URL)
+
+    assert fake_checkout_page.page.url == CHECKOUT_URL
+    assert fake_checkout_page.page.locator("#agree").count() == 1
+
+
+def test_fake_page_record_mode_fixes_goto_url(monkeypatch, fake_checkout_page):
+    fake_checkout_page.config["record_mode"] = True
+    monkeypatch.setattr("wrappers.smart_page.fix_noname_parameter_value",
+                        lambda *args: (PAGE_URL, CHECKOUT_URL))
+
+    fake_checkout_page.goto("https://www.saucedemo.com/checkout.html")
+
+    assert fake_checkout_page.page.url == CHECKOUT_URL
+    assert FIXED_PAGE_PARAMETERS[fake_checkout_page.cache_key] == (PAGE_URL, CHECKOUT_URL)
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import Mock
+from utils.smart_selector import (build_smart_selector,
+                                  convert_selectors_in_file,
+                                  register_smart_selector_engine,
+                                  xpath_to_smart_selector,
+                                  SMART_ENGINE_NAME,
+                                  SMART_SELECTOR_ENGINE)
+
+
+def test_build_smart_selector():
+    assert build_smart_selector("div.item", "Backpack", "button") == "smart=div.item|Backpack|button"
+    assert build_smart_selector("", "Backpack") == "smart=|Backpack|"
+
+
+def test_text_only_xpath():
+    assert xpath_to_smart_selector("//*[normalize-space(text())='#KEYWORD#']") == "smart=|#KEYWORD#|"
+
+
+def test_anchored_xpath_with_prefix():
+    xpath = ("xpath=//div[@class='inventory_item_description']"
+             "[.//*[normalize-space(text())='#KEYWORD#']]//div[@class='inventory_item_price']")
+    assert xpath_to_smart_selector(xpath) == \
+        "smart=div[class='inventory_item_description']|#KEYWORD#|div[class='inventory_item_price']"
+
+
+def test_anchored_xpath_keeps_attribute_spaces():
+    xpath = ("xpath=//div[@class='inventory_item_description'][.//*[normalize-space(text())='#KEYWORD#']]"
+             "//button[@class='btn btn_primary btn_small btn_inventory ']")
+    assert xpath_to_smart_selector(xpath).endswith("|button[class='btn btn_primary btn_small btn_inventory ']")
+
+
+def test_anchored_xpath_without_container_attributes():
+    xpath = "xpath=//div[.//*[normalize-space(text())='Bike Light']]//a[@class='shopping_cart_link']"
+    assert xpath_to_smart_selector(xpath) == "smart=div|Bike Light|a[class='shopping_cart_link']"
+
+
+def test_anchored_xpath_with_and_predicates():
+    xpath = ("xpath=//div[@class='pricebar' and @data-test='bar']"
+             "[.//*[normalize-space(text())='$9.99']]//button[@class='btn' and @name='add']")
+    assert xpath_to_smart_selector(xpath) == \
+        "smart=div[class='pricebar'][data-test='bar']|$9.99|button[class='btn'][name='add']"
+
+
+@pytest.mark.parametrize("selector", [
+    "#login-button",
+    "div[class='app_logo']",
+    "xpath=(//div)[2]",
+    "//*[contains(normalize-space(text()), 'Back')]",
+])
+def test_unsupported_selectors_return_none(selector):
+    assert xpath_to_smart_selector(selector) is None
+
+
+def test_convert_selectors_in_file(tmp_path):
+    file_path = tmp_path / "page.py"
+    file_path.write_text(
+        'self.header = SmartLocator(self, "div[class=\'app_logo\']")\n'
+        'self.name = SmartLocator(self, "//*[normalize-space(text())=\'#KEYWORD#\']")\n',
+        encoding="utf-8")
+
+    assert convert_selectors_in_file(str(file_path)) == 1
+
+    content = file_path.read_text(encoding="utf-8")
+    assert 'SmartLocator(self, "div[class=\'app_logo\']")' in content
+    assert 'SmartLocator(self, "smart=|#KEYWORD#|")' in content
+
+
+def test_register_smart_selector_engine():
+    playwright = Mock()
+    register_smart_selector_engine(playwright)
+    playwright.selectors.register.assert_called_once_with(SMART_ENGINE_NAME, script=SMART_SELECTOR_ENGINE)
+
+
+def test_register_smart_selector_engine_ignores_duplicates():
+    playwright = Mock()
+    playwright.selectors.register.side_effect = Exception('"smart" selector engine has been already registered')
+    register_smart_selector_engine(playwright)
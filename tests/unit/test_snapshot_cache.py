@@ -0,0 +1,30 @@
+from unittest.mock import Mock
+from helpers.snapshot_cache import SnapshotCache
+
+STATE = {"cookies": [], "origins": []}
+
+
+def test_snapshot_is_created_once_then_restored():
+    cache, page, create = SnapshotCache(), Mock(), Mock()
+    take, restore = Mock(return_value={"state": STATE}), Mock(return_value=True)
+
+    assert cache.restore_or_create("key", page, create, take, restore) is False
+    assert cache.restore_or_create("key", page, create, take, restore) is True
+
+    create.assert_called_once()
+    restore.assert_called_once_with({"state": STATE})
+    assert cache.stats == {"created": 1, "restored": 1, "expired": 0, "failed_restores": 0}
+
+
+def test_unconfirmed_restore_invalidates_snapshot():
+    cache, page, create = SnapshotCache(), Mock(), Mock()
+    cache.put("key", {"state": STATE})
+
+    restored = cache.restore_or_create("key", page, create, take=lambda: None, restore=lambda snapshot: False)
+
+    assert restored is False
+    create.assert_called_once()
+    page.context.clear_cookies.assert_called_once()
+    # take() returned None, nothing is saved
+    assert cache.get("key") is None
+    assert cache.stats["failed_restores"] == 1
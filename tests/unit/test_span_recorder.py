@@ -0,0 +1,112 @@
+import json
+from unittest.mock import Mock
+from conftest import get_spans_file_name
+from helpers.span_recorder import NULL_SPAN, Span, SpanRecorder, start_span
+from wrappers.smart_locator import SmartLocator, FIXED_SELECTORS
+
+
+def make_owner():
+    owner = Mock()
+    owner.__class__.__name__ = "LoginPage"
+    owner.config = {}
+    owner.keyword = None
+    owner.placeholder_manager.replace_placeholders_with_values.side_effect = lambda value: value
+    return owner
+
+
+def test_start_span_is_noop_without_recording():
+    assert start_span("locator.click", "locator", cache_key="LoginPage.button") is NULL_SPAN
+
+    with start_span("locator.click", "locator") as span:
+        span.set(retries=1)
+
+
+def test_record_collects_nested_spans():
+    recorder = SpanRecorder("unused")
+
+    with recorder.record() as spans:
+        with start_span("locator.fill", "locator", cache_key="LoginPage.user") as span:
+            with start_span("fill", "wait", cache_key="LoginPage.user"):
+                pass
+            span.set(retries=1)
+
+    assert [span.name for span in spans] == ["fill", "locator.fill"]
+    assert spans[1].args == {"cache_key": "LoginPage.user", "retries": 1}
+    assert start_span("locator.fill", "locator") is NULL_SPAN
+
+
+def test_span_records_error():
+    recorder = SpanRecorder("unused")
+
+    with recorder.record() as spans:
+        try:
+            with start_span("goto", "wait"):
+                raise TimeoutError("navigation")
+        except TimeoutError:
+            pass
+
+    assert spans[0].args["error"] == "TimeoutError"
+
+
+def test_export_writes_chrome_trace_events(tmp_path):
+    recorder = SpanRecorder(tmp_path)
+
+    with recorder.record() as spans:
+        with start_span("page.goto", "page", cache_key="LoginPage@login_page.py"):
+            with start_span("goto", "wait", cache_key="LoginPage@login_page.py"):
+                pass
+
+    path = recorder.export("test_login", spans, "tests/e2e/test_login.py::test_login")
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    events = trace["traceEvents"]
+
+    assert path == tmp_path / "test_login.json"
+    assert [event["name"] for event in events] == ["page.goto", "goto"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["ts"] == 0 and events[0]["dur"] >= events[1]["dur"]
+    assert trace["otherData"]["test"] == "tests/e2e/test_login.py::test_login"
+
+
+def make_span(name, category, start_ms, end_ms, **args):
+    span = Span([], name, category, args)
+    span.start_ns, span.end_ns = start_ms * 1_000_000, end_ms * 1_000_000
+    return span
+
+
+def test_locator_table_splits_wait_and_overhead():
+    recorder = SpanRecorder("unused")
+
+    recorder.aggregate([
+        make_span("click", "wait", 1, 8, cache_key="LoginPage.button"),
+        make_span("healing", "healing", 8, 9, cache_key="LoginPage.button"),
+        make_span("locator.click", "locator", 0, 10, cache_key="LoginPage.button", retries=1),
+        make_span("locator.fill", "locator", 20, 22, cache_key="LoginPage.username"),
+    ])
+
+    assert recorder.get_locator_table() == [
+        ("LoginPage.button", 1, 10.0, 7.0, 3.0, 10.0, 1),
+        ("LoginPage.username", 1, 2.0, 0.0, 2.0, 2.0, 0),
+    ]
+
+
+def test_smart_locator_calls_are_recorded():
+    FIXED_SELECTORS.clear()
+    owner = make_owner()
+    button = SmartLocator(owner, "#login-button")
+    recorder = SpanRecorder("unused")
+
+    with recorder.record() as spans:
+        button.click()
+
+    owner.page.locator.return_value.click.assert_called_once()
+    assert [span.category for span in spans] == ["wait", "locator"]
+    assert spans[1].name == "locator.click"
+    assert spans[1].args["selector"] == "#login-button"
+    assert spans[0].args["cache_key"] == spans[1].args["cache_key"] == button.cache_key
+
+
+def test_spans_file_name_keeps_same_named_tests_apart():
+    names = {get_spans_file_name(Mock(nodeid=f"tests/e2e/{module}.py::test_login[chromium]"))
+             for module in ("test_login", "test_checkout")}
+
+    assert len(names) == 2
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+from helpers.test_context import (bind_test_context, get_current_keyword, get_current_node_id,
+                                  get_current_param_row, get_healing_scope, get_param_row,
+                                  get_test_context, listen_to_steps, set_current_keyword,
+                                  start_page_step, start_step, step)
+from wrappers.smart_page import SmartPage
+
+
+def test_bind_test_context_sets_and_restores_values():
+    outer = get_test_context()
+
+    with bind_test_context("tests/e2e/test_login.py::test_login[standard_user]", 2):
+        set_current_keyword("Backpack")
+
+        assert get_test_context() == {
+            "param_row": 2,
+            "node_id": "tests/e2e/test_login.py::test_login[standard_user]",
+            "keyword": "Backpack",
+            "healing_scope": "tests/e2e/test_login.py::test_login",
+        }
+
+    assert get_test_context() == outer
+
+
+def test_asyncio_tasks_have_isolated_context():
+    seen = {}
+
+    async def run_test(node_id, row):
+        with bind_test_context(node_id, row):
+            set_current_keyword(node_id)
+            await asyncio.sleep(0.01)
+            seen[node_id] = (get_current_node_id(), get_current_param_row(), get_current_keyword())
+
+    async def main():
+        await asyncio.gather(run_test("test_a", 0), run_test("test_b", 1))
+
+    asyncio.run(main())
+
+    assert seen == {"test_a": ("test_a", 0, "test_a"), "test_b": ("test_b", 1, "test_b")}
+
+
+def test_threads_have_isolated_context():
+    seen = []
+
+    with bind_test_context("test_main", 5):
+        thread = threading.Thread(target=lambda: seen.append(get_current_param_row()))
+        thread.start()
+        thread.join()
+
+        assert get_current_param_row() == 5
+
+    assert seen == [-1]
+
+
+def test_get_param_row_reads_callspec_indices():
+    item = Mock()
+    item.callspec.indices = {"username": 3}
+    assert get_param_row(item) == 3
+
+    del item.callspec
+    assert get_param_row(item) == -1
+
+
+def test_smart_page_keyword_is_recorded_in_context(monkeypatch):
+    monkeypatch.setattr("wrappers.smart_page.PlaceholderManager", lambda c: Mock())
+
+    with bind_test_context("test_keyword"):
+        page = SmartPage(Mock(), {})
+        page.set_keyword("Sauce Labs Backpack")
+        assert get_current_keyword() == "Sauce Labs Backpack"
+
+        page.reset_keyword()
+        assert get_current_keyword() is None
+        assert get_healing_scope() == "test_keyword"
+
+
+def test_steps_are_reported_to_listener():
+    titles = []
+
+    @step
+    def open_cart():
+        return "cart"
+
+    with listen_to_steps(titles.append):
+        start_step("login")
+        assert open_cart() == "cart"
+
+    start_step("ignored")
+    assert titles == ["login", "open_cart"]
+
+
+def test_navigations_outside_service_steps_are_steps():
+    titles = []
+    page = SmartPage(Mock(), {})
+
+    @step
+    def login():
+        page.goto("https://www.saucedemo.com/")
+
+    @step
+    async def login_async():
+        start_page_step("goto")
+
+    with listen_to_steps(titles.append):
+        page.goto("https://www.saucedemo.com/")
+        page.title()
+        login()
+        asyncio.run(login_async())
+        page.reload()
+
+    assert titles == ["goto", "login", "login_async", "reload"]
@@ -0,0 +1,129 @@
+import pytest
+from unittest.mock import Mock
+from conftest import pytest_runtest_makereport, pytest_runtest_setup, record_trace
+from helpers.trace_recorder import TraceRecorder
+
+
+def make_context():
+    context = Mock()
+    # Chunks saved with a path are written as files
+    write = lambda path=None: path and path.write_bytes(b"trace")
+    context.tracing.stop_chunk.side_effect = write
+    context.tracing.stop.side_effect = write
+    return context
+
+
+def test_passing_test_discards_trace(tmp_path):
+    recorder = TraceRecorder(tmp_path, {})
+    context = make_context()
+
+    session = recorder.start(context, "test_login")
+    files = recorder.finish(session, keep=False)
+
+    context.tracing.start.assert_called_once_with(title="test_login", screenshots=True,
+                                                  snapshots=True, sources=False)
+    context.tracing.stop.assert_called_once_with()
+    assert files == []
+    assert not any(tmp_path.iterdir())
+    assert recorder.stats["discarded"] == 1
+
+
+def test_failed_test_keeps_trace(tmp_path):
+    recorder = TraceRecorder(tmp_path, {})
+    context = make_context()
+
+    session = recorder.start(context, "test_login")
+    recorder.step(session, "login")
+    files = recorder.finish(session, keep=True)
+
+    # Without trace_steps the whole test is one chunk
+    context.tracing.stop_chunk.assert_not_called()
+    assert files == [tmp_path / "test_login" / "000-start.zip"]
+    assert files[0].exists()
+    assert recorder.stats["kept"] == 1
+
+
+def test_only_last_steps_are_kept(tmp_path):
+    recorder = TraceRecorder(tmp_path, {"trace_steps": 2})
+    context = make_context()
+
+    session = recorder.start(context, "test_cart")
+    for title in ("login", "add to cart", "checkout"):
+        recorder.step(session, title)
+    files = recorder.finish(session, keep=True)
+
+    assert [path.name for path in files] == ["002-add_to_cart.zip", "003-checkout.zip"]
+    assert sorted(path.name for path in (tmp_path / "test_cart").iterdir()) == [
+        "002-add_to_cart.zip", "003-checkout.zip"]
+    assert recorder.stats["steps_dropped"] == 2
+    context.tracing.start_chunk.assert_called_with(title="checkout")
+
+
+def test_discarded_steps_are_deleted(tmp_path):
+    recorder = TraceRecorder(tmp_path, {"trace_steps": 3})
+    context = make_context()
+
+    session = recorder.start(context, "test_cart")
+    recorder.step(session, "login")
+    recorder.step(session, "checkout")
+    recorder.finish(session, keep=False)
+
+    assert not (tmp_path / "test_cart").exists()
+
+
+def make_item(execution_count=1):
+    item = Mock()
+    item.name = "test_login"
+    item.nodeid = "tests/e2e/test_login.py::test_login"
+    item.execution_count = execution_count
+    item.stash, item.config.stash = pytest.Stash(), pytest.Stash()
+    return item
+
+
+def run_test(item, failed_phases=()):
+    """Runs the setup hook and the report hook of every phase of one test execution."""
+    pytest_runtest_setup(item)
+
+    for when in ("setup", "call", "teardown"):
+        failed = when in failed_phases
+        rep = Mock(when=when, failed=failed, passed=not failed)
+        hook = pytest_runtest_makereport(item, Mock(when=when))
+        next(hook)
+
+        with pytest.raises(StopIteration):
+            hook.send(Mock(get_result=lambda: rep))
+
+
+def test_trace_of_every_rerun_is_linked(monkeypatch):
+    links = []
+    monkeypatch.setattr("conftest.attach_trace_links",
+                        lambda item, rep: links.append((item.execution_count, rep.when)))
+    item = make_item()
+
+    run_test(item, failed_phases=("call", "teardown"))
+    item.execution_count = 2
+    run_test(item)
+
+    # Failed first run linked once, the passing rerun keeps its trace too
+    assert links == [(1, "call"), (2, "call")]
+
+
+def test_rerun_keeps_own_trace():
+    recorder, request = Mock(), Mock(node=make_item(execution_count=2))
+    pytest_runtest_setup(request.node)
+
+    with record_trace("context", request, recorder):
+        pass
+
+    recorder.start.assert_called_once_with("context", "tests_e2e_test_login.py_test_login-run2")
+    recorder.finish.assert_called_once_with(recorder.start.return_value, True)
+
+
+def test_passing_first_run_discards_trace():
+    recorder, request = Mock(), Mock(node=make_item())
+    pytest_runtest_setup(request.node)
+
+    with record_trace("context", request, recorder):
+        pass
+
+    recorder.finish.assert_called_once_with(recorder.start.return_value, False)
@@ -18,10 +18,10 @@ from utils.web_utils import (check_locators_geometry_match,
                              reset_element_style,
                              css_to_xpath,
                              xpath_to_css,
-                             replace_br_tags_with_paragraph_tags)
+                             replace_br_tags_with_paragraph_tags,
+                             get_selector_relative_to)
 
 
-LOGIN_URL = "https://www.saucedemo.com/"
 USERNAME = "standard_user"
 PASSWORD = "secret_sauce"
 INVENTORY_PATH = "inventory.html"
@@ -30,7 +30,7 @@ INVENTORY_PATH = "inventory.html"
 @pytest.fixture(scope="function")
 def login(page, config):
     # navigate to login
-    page.goto(LOGIN_URL)
+    page.goto(config["demo_base_url"])
     # login
     page.fill("#user-name", USERNAME)
     page.fill("#password", PASSWORD)
@@ -41,8 +41,8 @@ def login(page, config):
     return page
 
 
-def test_get_hovered_element_locator(page):
-    page.goto("https://www.saucedemo.com/")
+def test_get_hovered_element_locator(page, config):
+    page.goto(config["demo_base_url"])
     # Hover over username input
     page.locator("#user-name").hover()
     locator = get_hovered_element_locator(page)
@@ -50,8 +50,8 @@ def test_get_hovered_element_locator(page):
     assert locator.evaluate("el => el.id") == "user-name"
 
 
-def test_highlight_and_reset(page):
-    page.goto("https://www.saucedemo.com/")
+def test_highlight_and_reset(page, config):
+    page.goto(config["demo_base_url"])
     locator = page.locator("#login-button")
 
     orig_style = highlight_element(locator)
@@ -63,15 +63,15 @@ def test_highlight_and_reset(page):
     assert restored == orig_style
 
 
-def test_get_simple_css_selector(page):
-    page.goto("https://www.saucedemo.com/")
+def test_get_simple_css_selector(page, config):
+    page.goto(config["demo_base_url"])
     locator = page.locator("#password")
     selector = get_simple_css_selector(locator)
     assert selector == "#password"
 
 
-def test_compare_locators_geometry(page):
-    page.goto("https://www.saucedemo.com/")
+def test_compare_locators_geometry(page, config):
+    page.goto(config["demo_base_url"])
     locator1 = page.locator("#user-name")
     locator2 = page.locator("#user-name")
     locator3 = page.locator("#login-button")
@@ -190,14 +190,14 @@ def test_invalid_xpaths_return_none():
 
 
 @pytest.fixture(scope="function")
-def logged_in_page(page: Page):
+def logged_in_page(page: Page, config):
     """Login to saucedemo and return page on inventory.html"""
-    page.goto(LOGIN_URL)
+    page.goto(config["demo_base_url"])
     page.fill("#user-name", USERNAME)
     page.fill("#password", PASSWORD)
     page.click("#login-button")
     # ensure we are on inventory page
-    expected_url = urljoin(LOGIN_URL, INVENTORY_PATH)
+    expected_url = urljoin(config["demo_base_url"], INVENTORY_PATH)
     page.wait_for_url(expected_url)
     return page
 
@@ -577,3 +577,36 @@ def test_replace_br_tags_within_div_tags_with_paragraph_tags(page: Page):
     expected = "<div><p>one</p><p>two</p><p>three</p></div>"
     assert html == expected, f"Expected {expected!r}, got {html!r}"
 
+
+CARDS_HTML = """
+<div class="card"><span class="name">Backpack</span><span class="price">29.99</span></div>
+<div class="card" id="light"><span class="name">Bike Light</span><div><span>on sale</span><span class="price" data-test="light-price">9.99</span></div></div>
+"""
+
+
+def test_get_selector_relative_to_keeps_selector_found_under_root(page: Page):
+    page.set_content(CARDS_HTML)
+    root = page.locator("#light")
+
+    selector = "[data-test=light-price]"
+
+    assert get_selector_relative_to(root, page.locator(selector), selector) == selector
+
+
+def test_get_selector_relative_to_builds_root_relative_xpath(page: Page):
+    page.set_content(CARDS_HTML)
+    root = page.locator("#light")
+    selector = "(//span[@class='price'])[2]"
+
+    relative = get_selector_relative_to(root, page.locator(selector), selector)
+
+    assert relative == "xpath=./div/span[2]"
+    assert root.locator(relative).inner_text() == "9.99"
+
+
+def test_get_selector_relative_to_rejects_element_outside_root(page: Page):
+    page.set_content(CARDS_HTML)
+
+    with pytest.raises(RuntimeError):
+        get_selector_relative_to(page.locator("#light"), page.locator(".card >> nth=0"), ".card >> nth=0")
+
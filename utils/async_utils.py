@@ -0,0 +1,96 @@
+import inspect
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+
+# Cache of generated (sync class, async base class) -> async class
+ASYNC_CLASSES = {}
+
+
+def is_async_page(page) -> bool:
+    """Returns True for a playwright.async_api Page."""
+    return isinstance(page, AsyncPage)
+
+
+def is_async_object(value) -> bool:
+    """
+    Returns True for async Playwright pages and locators and for
+    wrappers (SmartPage, SmartLocator, SmartComponent) bound to an async page.
+    """
+    if isinstance(value, (AsyncPage, AsyncLocator)):
+        return True
+    return is_async_page(getattr(value, "page", None))
+
+
+def get_async_class(cls, async_base):
+    """
+    Returns a class combining a page object class with an async wrapper base,
+    e.g. LoginPage + AsyncSmartPage. Methods of the page object class come first
+    in the MRO, so its super() calls reach the async wrapper methods.
+    """
+    if issubclass(cls, async_base):
+        return cls
+
+    # The wrapper class itself, e.g. SmartLocator -> AsyncSmartLocator
+    if issubclass(async_base, cls):
+        return async_base
+
+    key = (cls, async_base)
+
+    if key not in ASYNC_CLASSES:
+        ASYNC_CLASSES[key] = type(cls.__name__, (cls, async_base), {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+        })
+
+    return ASYNC_CLASSES[key]
+
+
+def then(value, callback):
+    """
+    Applies callback to a value, or to the awaited value if it is awaitable.
+    Lets page object helpers return results in both sync and async mode.
+    """
+    if inspect.isawaitable(value):
+        return _then_async(value, callback)
+    return callback(value)
+
+
+def run_steps(*steps):
+    """
+    Runs step callables in order and returns the last result.
+    In async mode returns a coroutine that awaits every step before the next one.
+
+    Example:
+        def login(self, username, password):
+            return run_steps(lambda: self.fill_form(username, password),
+                             lambda: self.submit_form())
+    """
+    result = None
+
+    for index, step in enumerate(steps):
+        result = step()
+
+        if inspect.isawaitable(result):
+            return _run_steps_async(result, steps[index + 1:])
+
+    return result
+
+
+async def _then_async(value, callback):
+    result = callback(await value)
+
+    if inspect.isawaitable(result):
+        result = await result
+
+    return result
+
+
+async def _run_steps_async(pending, steps):
+    result = await pending
+
+    for step in steps:
+        result = step()
+
+        if inspect.isawaitable(result):
+            result = await result
+
+    return result
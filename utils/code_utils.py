@@ -154,7 +154,11 @@ def get_parameter_index_from_function_def(filename: str, lineno: int, index: int
     call_code = ""
     expr = None
     for i in range(lineno - 1, len(lines)):
-        call_code += lines[i].strip() + "\n"
+        line = lines[i].strip()
+        if i == lineno - 1:
+            # Page object methods may return or await the call
+            line = re.sub(r"^(return\s+)?(await\s+)?", "", line)
+        call_code += line + "\n"
         try:
             expr = ast.parse(call_code, mode="eval").body
             if isinstance(expr, ast.Call):
@@ -0,0 +1,218 @@
+import pathlib
+import re
+import sys
+from typing import Optional
+from utils.web_utils import DOM_GENERATION_FUNCTION
+
+SMART_ENGINE_NAME = "smart"
+SMART_SELECTOR_PREFIX = f"{SMART_ENGINE_NAME}="
+SMART_SELECTOR_SEPARATOR = "|"
+
+# Playwright selector engine: "smart=<container css>|<text>|<target css>".
+# Text lookups are served from a text -> elements index that is rebuilt only
+# when the DOM generation of the document changes.
+SMART_SELECTOR_ENGINE = r"""
+(() => {
+    %s
+
+    const normalize = s => (s ?? '').replace(/[ \t\n\r]+/g, ' ').trim();
+
+    function parse(selector) {
+        const first = selector.indexOf('|');
+        const last = selector.lastIndexOf('|');
+        if (first < 0 || first === last) {
+            throw new Error(`Malformed smart selector: "${selector}"`);
+        }
+        return {
+            container: selector.slice(0, first).trim(),
+            text: normalize(selector.slice(first + 1, last)),
+            target: selector.slice(last + 1).trim()
+        };
+    }
+
+    function textIndex() {
+        const generation = smartDomGeneration();
+        let index = window.__smartTextIndex;
+
+        if (!index || index.generation !== generation) {
+            const nodes = new Map();
+            const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_TEXT);
+
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                const text = normalize(node.nodeValue);
+                const owner = node.parentElement;
+                if (!text || !owner) continue;
+
+                let owners = nodes.get(text);
+                if (!owners) nodes.set(text, owners = []);
+                if (owners[owners.length - 1] !== owner) owners.push(owner);
+            }
+            index = window.__smartTextIndex = { generation, nodes };
+        }
+        return index.nodes;
+    }
+
+    function inScope(root, el) {
+        return root.nodeType === Node.DOCUMENT_NODE || root === el || root.contains(el);
+    }
+
+    function queryAll(root, selector) {
+        const { container, text, target } = parse(selector);
+        const owners = (textIndex().get(text) || []).filter(el => inScope(root, el));
+        const anchors = new Set();
+
+        for (const owner of owners) {
+            if (!container) {
+                anchors.add(owner);
+                continue;
+            }
+            // Like XPath //container[.//*[text()=K]]: every matching ancestor counts
+            for (let el = owner.parentElement; el && inScope(root, el); el = el.parentElement) {
+                if (el.matches(container)) anchors.add(el);
+            }
+        }
+
+        const result = new Set();
+        for (const anchor of anchors) {
+            if (!target) {
+                result.add(anchor);
+                continue;
+            }
+            for (const el of anchor.querySelectorAll(target)) result.add(el);
+        }
+
+        return [...result].sort((a, b) =>
+            a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1);
+    }
+
+    return {
+        query(root, selector) {
+            return queryAll(root, selector)[0] || null;
+        },
+        queryAll
+    };
+})()
+""" % DOM_GENERATION_FUNCTION
+
+# //tag[@a='v' and @b='w'] step of an XPath expression
+_XPATH_STEP = r"//(\*|[\w-]+)((?:\[@[\w-]+='[^']*'(?: and @[\w-]+='[^']*')*\])*)"
+_XPATH_TEXT_PREDICATE = r"normalize-space\(text\(\)\)='([^']*)'"
+
+_TEXT_ONLY_PATTERN = re.compile(rf"^(?:xpath=)?//\*\[{_XPATH_TEXT_PREDICATE}\]$")
+_ANCHORED_PATTERN = re.compile(
+    rf"^(?:xpath=)?{_XPATH_STEP}\[\.//\*\[{_XPATH_TEXT_PREDICATE}\]\](?:{_XPATH_STEP})?$")
+
+
+def register_smart_selector_engine(playwright) -> None:
+    """
+    Registers the "smart" selector engine with a Playwright instance.
+    Must be called before browser contexts are created.
+    """
+    try:
+        playwright.selectors.register(SMART_ENGINE_NAME, script=SMART_SELECTOR_ENGINE)
+    except Exception as e:
+        # Engine names are global per Playwright driver
+        if "already registered" not in str(e):
+            raise
+
+
+async def register_smart_selector_engine_async(playwright) -> None:
+    """Async API variant of register_smart_selector_engine()."""
+    try:
+        await playwright.selectors.register(SMART_ENGINE_NAME, script=SMART_SELECTOR_ENGINE)
+    except Exception as e:
+        if "already registered" not in str(e):
+            raise
+
+
+def build_smart_selector(container: str, text: str, target: str = "") -> str:
+    """
+    Builds a smart selector: elements matching `target` inside every `container`
+    element that has a descendant with normalized text `text`.
+    Empty `container` anchors on the text element itself, empty `target`
+    returns the anchors.
+
+    Example:
+        build_smart_selector("div.inventory_item", "#KEYWORD#", "button")
+        → "smart=div.inventory_item|#KEYWORD#|button"
+    """
+    return (f"{SMART_SELECTOR_PREFIX}{container}{SMART_SELECTOR_SEPARATOR}"
+            f"{text}{SMART_SELECTOR_SEPARATOR}{target}")
+
+
+def _xpath_step_to_css(tag: str, predicates: str) -> str:
+    """Converts a //tag[@a='v' and @b='w'][@c='x'] step into tag[a='v'][b='w'][c='x']."""
+    css = tag
+    for name, value in re.findall(r"@([\w-]+)='([^']*)'", predicates or ""):
+        css += f"[{name}='{value}']"
+    return css
+
+
+def xpath_to_smart_selector(selector: str) -> Optional[str]:
+    """
+    Rewrites keyword/text anchored XPath selectors into smart selectors.
+
+    Supports:
+      - //*[normalize-space(text())='K'] → smart=|K|
+      - //div[@class='c'][.//*[normalize-space(text())='K']]//button[@class='b']
+        → smart=div[class='c']|K|button[class='b']
+
+    Args:
+        selector (str): XPath selector, optionally prefixed with "xpath=".
+
+    Returns:
+        str | None: Equivalent smart selector or None if the pattern is not supported.
+    """
+    selector = selector.strip()
+
+    match = _TEXT_ONLY_PATTERN.match(selector)
+    if match:
+        return build_smart_selector("", match.group(1))
+
+    match = _ANCHORED_PATTERN.match(selector)
+    if match:
+        container_tag, container_predicates, text, target_tag, target_predicates = match.groups()
+        container = _xpath_step_to_css(container_tag, container_predicates)
+        target = _xpath_step_to_css(target_tag, target_predicates) if target_tag else ""
+        return build_smart_selector(container, text, target)
+
+    return None
+
+
+def convert_selectors_in_file(file_path: str) -> int:
+    """
+    Rewrites supported XPath selectors of SmartLocator fields in a page object file
+    into smart selectors.
+
+    Returns:
+        int: Number of converted selectors.
+    """
+    path = pathlib.Path(file_path)
+    text = path.read_text(encoding="utf-8")
+    converted = 0
+
+    def replace(match):
+        nonlocal converted
+        smart_selector = xpath_to_smart_selector(match.group(3))
+
+        if smart_selector is None or match.group(2) in smart_selector:
+            return match.group(0)
+
+        converted += 1
+        return f"{match.group(1)}{match.group(2)}{smart_selector}{match.group(2)}"
+
+    new_text = re.sub(r'(SmartLocator\(\s*self,\s*)(["\'])(.*?)\2', replace, text)
+
+    if converted:
+        path.write_text(new_text, encoding="utf-8")
+
+    return converted
+
+
+if __name__ == "__main__":
+    # Usage: python -m utils.smart_selector pages/
+    for root in sys.argv[1:] or ["pages"]:
+        for source in sorted(pathlib.Path(root).rglob("*.py")):
+            count = convert_selectors_in_file(str(source))
+            if count:
+                print(f"{source}: {count} selector(s) converted")
@@ -0,0 +1,90 @@
+import random
+from functools import lru_cache
+from html import escape
+from urllib.parse import urlencode
+
+MIN_SYNTHETIC_NODES = 1
+MAX_SYNTHETIC_NODES = 100_000
+CARDS_PER_SECTION = 50
+# card, title, description, footer, price, button, link
+ELEMENTS_PER_CARD = 7
+# Texts shared by colliding cards, like repeated product names on real pages
+COLLIDING_TEXTS = ("Sauce Labs Backpack", "Add to cart", "Details", "Sauce Labs Bike Light", "$9.99")
+DUPLICATE_VALUES = 5
+
+
+def get_synthetic_page_query(nodes: int = 1000, duplicates: float = 0.2,
+                             collisions: float = 0.1, seed: int = 0) -> str:
+    """Returns the query string of a synthetic page served by the demo server."""
+    return urlencode({"nodes": nodes, "duplicates": duplicates,
+                      "collisions": collisions, "seed": seed})
+
+
+@lru_cache(maxsize=32)
+def generate_synthetic_page(nodes: int = 1000, duplicates: float = 0.2,
+                            collisions: float = 0.1, seed: int = 0) -> str:
+    """
+    Generates an HTML page of product-like cards with exactly 'nodes' elements in its body.
+    - duplicates: share of cards whose data-test and name attributes repeat values of other cards.
+    - collisions: share of cards whose texts repeat texts of other cards.
+    - seed: the same arguments always generate the same page.
+    """
+    if not MIN_SYNTHETIC_NODES <= nodes <= MAX_SYNTHETIC_NODES:
+        raise ValueError(f"nodes must be in [{MIN_SYNTHETIC_NODES}, {MAX_SYNTHETIC_NODES}], got {nodes}")
+    if not 0.0 <= duplicates <= 1.0 or not 0.0 <= collisions <= 1.0:
+        raise ValueError("duplicates and collisions must be in [0, 1]")
+
+    rnd = random.Random(seed)
+    parts = ['<div id="synthetic-root" data-test="synthetic-root">']
+    remaining = nodes - 1
+    card_index = 0
+
+    while remaining > 0:
+        parts.append(f'<div class="section" data-section="{len(parts)}">')
+        remaining -= 1
+        cards = 0
+
+        while cards < CARDS_PER_SECTION and remaining >= ELEMENTS_PER_CARD:
+            parts.append(_generate_card(card_index, rnd, duplicates, collisions))
+            remaining -= ELEMENTS_PER_CARD
+            card_index += 1
+            cards += 1
+
+        if remaining < ELEMENTS_PER_CARD:
+            parts.extend('<span class="filler"></span>' for _ in range(remaining))
+            remaining = 0
+
+        parts.append("</div>")
+
+    parts.append("</div>")
+
+    return ("<!DOCTYPE html>\n<html lang=\"en\">\n<head><meta charset=\"utf-8\">"
+            f"<title>Synthetic page ({nodes} nodes)</title></head>\n<body>"
+            + "".join(parts) + "</body>\n</html>\n")
+
+
+def _generate_card(index: int, rnd: random.Random, duplicates: float, collisions: float) -> str:
+    if rnd.random() < duplicates:
+        key = f"dup-{rnd.randrange(DUPLICATE_VALUES)}"
+        card_id = ""
+    else:
+        key = f"card-{index}"
+        card_id = f' id="card_{index}"'
+
+    if rnd.random() < collisions:
+        title = rnd.choice(COLLIDING_TEXTS)
+        price = "$9.99"
+    else:
+        title = f"Product {index}"
+        price = f"${index % 100}.{index % 97:02d}"
+
+    title = escape(title)
+
+    return (f'<div class="card"{card_id} data-test="{key}">'
+            f'<h3 class="card_title">{title}</h3>'
+            f'<p class="card_desc">Description of {title}</p>'
+            f'<div class="card_footer">'
+            f'<span class="card_price">{price}</span>'
+            f'<button class="btn card_button" name="{key}-button">Add to cart</button>'
+            f'<a class="card_link" href="#{key}">Details</a>'
+            f'</div></div>')
@@ -1,10 +1,7 @@
 import time
-import pyautogui
 from itertools import combinations
-from pynput import keyboard
 from typing import Optional
 import re
-import utils.keyboard_utils as ku
 from playwright.sync_api import Locator
 
 
@@ -101,15 +98,75 @@ def get_hovered_element_locator(page: Page):
     return page.locator(selector)
 
 
+# Installs (once per document) a MutationObserver that bumps a generation
+# counter on every DOM change, style changes included (visibility filters of
+# selectors depend on them). Open shadow roots are observed as they are added.
+# Highlighting changes styles through UNTRACKED_STYLE_SCRIPT, which is not counted.
+DOM_GENERATION_FUNCTION = r"""
+    function smartDomGeneration() {
+        let tracker = window.__smartDomGeneration;
+        if (!tracker) {
+            const options = { childList: true, subtree: true, attributes: true, characterData: true };
+            const watchShadowRoots = root => {
+                const elements = root.nodeType === Node.ELEMENT_NODE
+                    ? [root, ...root.querySelectorAll('*')] : root.querySelectorAll?.('*') ?? [];
+                for (const el of elements) {
+                    if (el.shadowRoot) {
+                        observer.observe(el.shadowRoot, options);
+                        watchShadowRoots(el.shadowRoot);
+                    }
+                }
+            };
+            const bump = records => {
+                if (records.length) tracker.value++;
+                for (const r of records) r.addedNodes.forEach(watchShadowRoots);
+            };
+            const observer = new MutationObserver(bump);
+            tracker = window.__smartDomGeneration = {
+                id: Math.random().toString(36).slice(2),
+                value: 0,
+                flush: () => bump(observer.takeRecords()),
+                discard: () => observer.takeRecords()
+            };
+            observer.observe(document, options);
+            watchShadowRoots(document);
+        }
+        tracker.flush();
+        return `${tracker.id}:${tracker.value}`;
+    }
+"""
+# Changes the style of el without bumping the DOM generation: pending changes
+# are counted first, the records of this change are discarded.
+UNTRACKED_STYLE_SCRIPT = r"""
+(el, style) => {
+    const tracker = window.__smartDomGeneration;
+    tracker?.flush();
+    %s;
+    tracker?.discard();
+}
+"""
+HIGHLIGHT_SCRIPT = UNTRACKED_STYLE_SCRIPT % (
+    "el.setAttribute('style', (el.getAttribute('style') || '') + '; border: 2px solid red !important;')")
+REMOVE_STYLE_SCRIPT = UNTRACKED_STYLE_SCRIPT % "el.removeAttribute('style')"
+SET_STYLE_SCRIPT = UNTRACKED_STYLE_SCRIPT % "el.setAttribute('style', style)"
+
+
+def get_dom_generation(page: Page) -> str:
+    """
+    Returns the current DOM generation token of the page document.
+    The token changes whenever the DOM is mutated or a new document is loaded,
+    so it can be used to invalidate resolved element caches.
+    """
+    return page.evaluate(f"() => {{ {DOM_GENERATION_FUNCTION} return smartDomGeneration(); }}")
+
+
 def highlight_element(locator: Locator):
     """
     Highlights an element by adding a 2px solid red border.
     Returns the element's original 'style' attribute so it can be restored later.
     """
     original_style = locator.evaluate("el => el.getAttribute('style')")
-    locator.evaluate(
-        "el => el.setAttribute('style', (el.getAttribute('style') || '') + '; border: 2px solid red !important;')"
-    )
+    locator.evaluate(HIGHLIGHT_SCRIPT)
     return original_style
 
 
@@ -121,9 +178,29 @@ def reset_element_style(locator: Locator, original_style: str):
         original_style: The style string returned from highlight_element().
     """
     if original_style is None:
-        locator.evaluate("el => el.removeAttribute('style')")
+        locator.evaluate(REMOVE_STYLE_SCRIPT)
+    else:
+        locator.evaluate(SET_STYLE_SCRIPT, original_style)
+
+
+async def get_dom_generation_async(page) -> str:
+    """Async API variant of get_dom_generation()."""
+    return await page.evaluate(f"() => {{ {DOM_GENERATION_FUNCTION} return smartDomGeneration(); }}")
+
+
+async def highlight_element_async(locator):
+    """Async API variant of highlight_element()."""
+    original_style = await locator.evaluate("el => el.getAttribute('style')")
+    await locator.evaluate(HIGHLIGHT_SCRIPT)
+    return original_style
+
+
+async def reset_element_style_async(locator, original_style: str):
+    """Async API variant of reset_element_style()."""
+    if original_style is None:
+        await locator.evaluate(REMOVE_STYLE_SCRIPT)
     else:
-        locator.evaluate(f"el => el.setAttribute('style', `{original_style}`)")
+        await locator.evaluate(SET_STYLE_SCRIPT, original_style)
 
 
 def xpath_to_css(xpath: str) -> Optional[str]:
@@ -820,6 +897,53 @@ def get_unique_element_selector(locator: Locator, text: str = None) -> str | Non
     return selector
 
 
+# XPath of an element relative to an ancestor root, by tag and index among same-tag siblings
+RELATIVE_XPATH_SCRIPT = r"""
+(el, root) => {
+    if (el === root || !root.contains(el)) return null;
+
+    const steps = [];
+    for (let node = el; node !== root; node = node.parentElement) {
+        const tag = node.tagName.toLowerCase();
+        const sameTag = Array.from(node.parentElement.children).filter(child => child.tagName === node.tagName);
+        steps.unshift(sameTag.length > 1 ? `${tag}[${sameTag.indexOf(node) + 1}]` : tag);
+    }
+    return 'xpath=./' + steps.join('/');
+}
+"""
+
+
+def get_selector_relative_to(root: Locator, target: Locator, selector: str) -> str:
+    """
+    Returns a selector finding the target element under the root element.
+
+    Selectors built for the whole document run from the root element when chained
+    to it (Playwright turns // XPath into .//), so they may find nothing or another
+    element there. The selector is kept if it finds exactly the target under the
+    root, otherwise an XPath relative to the root is returned.
+
+    Args:
+        root (Locator): Locator of the root element, e.g. a component root.
+        target (Locator): Document-level locator of the target element.
+        selector (str): Document-level selector of the target element.
+
+    Raises:
+        RuntimeError: If the target element is not inside the root element.
+    """
+    element = target.element_handle()
+    scoped = root.locator(selector)
+
+    if scoped.count() == 1 and scoped.evaluate("(el, target) => el === target", element):
+        return selector
+
+    relative = target.evaluate(RELATIVE_XPATH_SCRIPT, root.element_handle())
+
+    if relative is None:
+        raise RuntimeError(f"Selected element '{selector}' is outside of the root element")
+
+    return relative
+
+
 def check_locators_geometry_match(locator1: Locator, locator2: Locator, tolerance: float = 0.5) -> bool:
     """
     Compare two locators' position (x, y) and size (width, height).
@@ -899,6 +1023,10 @@ def select_element_on_page(page):
         - The highlighted element's original style is restored when the cursor moves.
         - Runs an infinite loop until the user explicitly cancels or confirms selection.
     """
+    # Keyboard hooks need a display, they are loaded in record mode only
+    from pynput import keyboard
+    import utils.keyboard_utils as ku
+
     last_locator = None
     last_original_style = None
 
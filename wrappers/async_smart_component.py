@@ -0,0 +1,28 @@
+from wrappers.smart_component import SmartComponent
+
+
+class AsyncSmartComponent(SmartComponent):
+    """
+    AsyncSmartComponent is the playwright.async_api counterpart of SmartComponent.
+    Counting and listing repeated components is awaited:
+        for card in await inventory_page.product_item.all(): ...
+        async for card in inventory_page.product_item: ...
+    """
+
+    async def count(self) -> int:
+        return await self.with_owner(self.owner, None).root_locator().count()
+
+    async def all(self) -> list:
+        return [self.nth(i) for i in range(await self.count())]
+
+    def __iter__(self):
+        raise TypeError(f"{self} requires 'async for' or 'await all()'")
+
+    async def __aiter__(self):
+        for component in await self.all():
+            yield component
+
+    def __str__(self):
+        return super().__str__().replace("<SmartComponent", "<AsyncSmartComponent", 1)
+
+    __repr__ = __str__
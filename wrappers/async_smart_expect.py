@@ -0,0 +1,61 @@
+from playwright.async_api import (expect as pw_async_expect, Page as AsyncPage,
+                                  Locator as AsyncLocator, APIResponse as AsyncAPIResponse)
+from helpers.span_recorder import start_span
+from utils.code_utils import normalize_args
+from wrappers.smart_expect import SmartExpect
+from wrappers.smart_locator import SmartLocator
+
+
+class AsyncSmartExpect(SmartExpect):
+    """
+    AsyncSmartExpect is the playwright.async_api counterpart of SmartExpect:
+    - Matchers return coroutines, e.g. await expect(inventory_page.header).to_have_text(...).
+    - Expected values get placeholder replacement and elements are highlighted like in SmartExpect.
+    expect(actual) returns this variant for async pages, locators and SmartLocators.
+    """
+
+    def __init__(self, actual):
+        self._smart_locator = None
+        if isinstance(actual, SmartLocator):
+            self.page = actual.page
+            self._smart_locator = actual
+            self.cache_key = self._smart_locator.cache_key
+            self.placeholder_manager = self._smart_locator.placeholder_manager
+            unwrapped = actual.locator
+        elif isinstance(actual, AsyncLocator):
+            self.page = actual.page
+            unwrapped = actual
+        elif isinstance(actual, AsyncPage):
+            self.page = actual
+            unwrapped = actual
+        elif isinstance(actual, AsyncAPIResponse):
+            self.page = None
+            unwrapped = actual
+        else:
+            raise ValueError(f"Unsupported type: {type(actual)}")
+
+        self._inner = pw_async_expect(unwrapped)
+
+    def __getattr__(self, item):
+        target = getattr(self._inner, item)
+
+        if callable(target) and item.startswith("to_"):
+            async def wrapper(*args, **kwargs):
+                element_style = None
+                cache_key = getattr(self, "cache_key", None)
+
+                with start_span(f"expect.{item}", "expect", cache_key=cache_key):
+                    if self._smart_locator:
+                        args, kwargs = normalize_args(target, *args, **kwargs)
+                        args, kwargs = self._validate_arguments(args, kwargs)
+                        element_style = await self._smart_locator._highlight_element_with_delay()
+
+                    try:
+                        with start_span(item, "wait", cache_key=cache_key):
+                            return await target(*args, **kwargs)
+                    finally:
+                        if self._smart_locator:
+                            await self._smart_locator._restore_element_style(element_style)
+
+            return wrapper
+        return target
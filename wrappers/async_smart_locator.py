@@ -0,0 +1,117 @@
+import asyncio
+import inspect
+from playwright.async_api import Error
+from helpers.span_recorder import start_span
+from utils.code_utils import normalize_args
+from utils.web_utils import (get_dom_generation_async, highlight_element_async,
+                             reset_element_style_async)
+from wrappers.smart_locator import (SmartLocator, ELEMENT_HANDLE_METHODS, accepts_arguments,
+                                    is_stale_handle_error)
+
+
+class AsyncSmartLocator(SmartLocator):
+    """
+    AsyncSmartLocator is the playwright.async_api counterpart of SmartLocator:
+    - Locator actions return coroutines, e.g. await login_page.login_button.click().
+    - Keyword, placeholder, component scope and element cache handling match SmartLocator.
+    - Selector fixes cached during the session are reused, record mode needs the sync API.
+    SmartLocator(owner, selector) returns this variant when the owner page is async.
+    """
+
+    def __getattr__(self, item):
+        target = getattr(self._locator(), item)
+
+        # Locator builders (nth, filter, locator, ...) are synchronous in the async API too
+        if not inspect.iscoroutinefunction(target):
+            return target
+
+        async def wrapper(*args, **kwargs):
+            with start_span(f"locator.{item}", "locator", field=self.field_name,
+                            cache_key=self.cache_key, selector=self.selector):
+                # Normalize so all kwargs become positional
+                args, kwargs = normalize_args(target, *args, **kwargs)
+                # Replace placeholders in string arguments
+                args, kwargs = self._validate_arguments(args, kwargs)
+                locator = self._locator()
+                # Resolved once per call, highlighting and the action share it
+                handle = await self._get_cached_element() if item in ELEMENT_HANDLE_METHODS else None
+                element_style = await self._highlight_element_with_delay(handle)
+
+                try:
+                    if handle and accepts_arguments(getattr(handle, item), args, kwargs):
+                        try:
+                            with start_span(item, "wait", cache_key=self.cache_key, cached=True):
+                                return await getattr(handle, item)(*args, **kwargs)
+                        except Error as e:
+                            if not is_stale_handle_error(e):
+                                raise
+                            # Element went stale, fall back to the locator
+                            await self._clear_element_cache()
+                            handle = None
+
+                    with start_span(item, "wait", cache_key=self.cache_key):
+                        return await getattr(locator, item)(*args, **kwargs)
+                finally:
+                    await self._restore_element_style(element_style, handle)
+
+        return wrapper
+
+    async def _highlight_element_with_delay(self, handle=None):
+        step_delay_seconds = self._get_step_delay_seconds()
+
+        if self.config.get("highlight"):
+            try:
+                element_style = await highlight_element_async(handle or self._locator())
+                await asyncio.sleep(step_delay_seconds)
+                return element_style
+            except Exception:
+                pass # Ignore all exceptions
+
+        elif step_delay_seconds > 0.0:
+            await asyncio.sleep(step_delay_seconds)
+
+    async def _restore_element_style(self, element_style, handle=None):
+
+        if self.config.get("highlight") and (handle or await self._element_count() > 0):
+            if not element_style:
+                await reset_element_style_async(handle or self._locator(), element_style)
+
+    async def _get_cached_element(self):
+        if not self.config.get("element_cache"):
+            return None
+
+        locator = self._locator()
+        key = repr(locator)
+        generation = await get_dom_generation_async(self.page)
+        cached = self._element_cache
+
+        if cached and cached[0] == key and cached[1] == generation:
+            return cached[2]
+
+        await self._clear_element_cache()
+        handles = await locator.element_handles()
+
+        if len(handles) != 1:
+            for handle in handles:
+                await handle.dispose()
+            self._element_cache = (key, generation, None)
+            return None
+
+        self._element_cache = (key, generation, handles[0])
+        return handles[0]
+
+    async def _element_count(self) -> int:
+        return await self._locator().count()
+
+    async def _clear_element_cache(self):
+        if self._element_cache and self._element_cache[2]:
+            try:
+                await self._element_cache[2].dispose()
+            except Exception:
+                pass # Handle is already gone with its document
+        self._element_cache = None
+
+    def __str__(self):
+        return super().__str__().replace("<SmartLocator", "<AsyncSmartLocator", 1)
+
+    __repr__ = __str__
@@ -0,0 +1,33 @@
+import asyncio
+import time
+from wrappers.async_smart_locator import AsyncSmartLocator
+from wrappers.smart_locator_list import SmartLocatorList, POLL_INTERVALS
+
+
+class AsyncSmartLocatorList(SmartLocatorList, AsyncSmartLocator):
+    """
+    AsyncSmartLocatorList is the playwright.async_api counterpart of SmartLocatorList.
+    Read methods and bulk expectations are awaited, e.g.
+    await inventory_page.inventory_items.expect_count(6).
+    """
+
+    async def _retry(self, check, timeout: float = None):
+        """Polls snapshots until check() returns None or the timeout (ms) expires."""
+        deadline = self._get_deadline(timeout)
+        attempt = 0
+
+        while True:
+            try:
+                error = check(await self.snapshot())
+            except Exception as e:
+                error = str(e)
+
+            if error is None:
+                return
+
+            if time.monotonic() >= deadline:
+                raise AssertionError(f"{self}: {error}")
+
+            interval = POLL_INTERVALS[min(attempt, len(POLL_INTERVALS) - 1)]
+            await asyncio.sleep(min(interval / 1000.0, max(deadline - time.monotonic(), 0.0)))
+            attempt += 1
@@ -0,0 +1,118 @@
+import asyncio
+import inspect
+import time
+from helpers.span_recorder import start_span
+from helpers.test_context import start_page_step
+from utils.code_utils import normalize_args
+from wrappers.smart_locator import SmartLocator
+from wrappers.smart_page import (SmartPage, FORM_FIELD_KINDS, FORM_FIELD_KIND_SCRIPT, NAVIGATION_METHODS,
+                                 FAST_FORM_FILL_SCRIPT, _apply_fast_form_results,
+                                 _apply_form_value, _report_form_timings)
+
+
+class AsyncSmartPage(SmartPage):
+    """
+    AsyncSmartPage is the playwright.async_api counterpart of SmartPage:
+    - Page methods return coroutines, e.g. await login_page.goto(url).
+    - Placeholder, keyword and cached runtime fix handling match SmartPage.
+    - Page objects from pages/ are reused as is: LoginPage(async_page, config) returns
+      an object combining LoginPage and AsyncSmartPage.
+    Record mode needs interactive dialogs and the sync call stack, so it is not supported.
+    """
+
+    def __init__(self, page, config: dict):
+        if config.get("record_mode"):
+            raise RuntimeError("Record mode is supported with the sync Playwright API only")
+
+        super().__init__(page, config)
+
+    def __getattr__(self, item):
+        target = getattr(self.page, item)
+
+        # Locator builders (locator, get_by_text, ...) are synchronous in the async API too
+        if not inspect.iscoroutinefunction(target):
+            return target
+
+        async def wrapper(*args, **kwargs):
+            if item in NAVIGATION_METHODS:
+                start_page_step(item)
+
+            with start_span(f"page.{item}", "page", cache_key=self.cache_key):
+                args, kwargs = normalize_args(target, *args, **kwargs)
+                args, kwargs = self._validate_arguments(item, args, kwargs)
+
+                with start_span("placeholders", "placeholders", cache_key=self.cache_key):
+                    args, kwargs = self._replace_placeholders(args, kwargs)
+
+                await self._make_step_delay()
+
+                with start_span(item, "wait", cache_key=self.cache_key):
+                    return await target(*args, **kwargs)
+
+        return wrapper
+
+    async def fill_fields(self, fields, *values, fast: bool = None, verbose: bool = None) -> dict:
+        """Async variant of SmartPage.fill_fields()."""
+        if fast is None:
+            fast = self.config.get("fast_form_fill", False)
+
+        fields = self._prepare_form_fields(fields, values)
+        timings = {}
+
+        if fast and not self._use_form_field_wrapper():
+            fields = await self._fill_form_fast(fields, timings)
+
+        for field, value in fields:
+            start = time.perf_counter()
+            await self._fill_form_field(field, value)
+            timings[field.field_name] = (time.perf_counter() - start) * 1000.0
+
+        return _report_form_timings(timings, self._is_verbose_form_fill(verbose))
+
+    async def _fill_form_field(self, field: SmartLocator, value):
+        kind = await self._get_form_field_kind(field)
+
+        if self._use_form_field_wrapper():
+            target = field
+        else:
+            target = await field._get_cached_element() or field.locator
+
+        return await _apply_form_value(target, kind, value, wrapped=target is field)
+
+    async def _get_form_field_kind(self, field: SmartLocator) -> str:
+        if field.cache_key not in FORM_FIELD_KINDS:
+            target = field if self._use_form_field_wrapper() else field.locator
+            FORM_FIELD_KINDS[field.cache_key] = await target.evaluate(FORM_FIELD_KIND_SCRIPT)
+
+        return FORM_FIELD_KINDS[field.cache_key]
+
+    async def _fill_form_fast(self, fields: list, timings: dict) -> list:
+        items, owned_handles = [], []
+
+        for field, value in fields:
+            handle = await field._get_cached_element()
+
+            if handle is None:
+                handle = await field.locator.element_handle()
+                owned_handles.append(handle)
+
+            items.append({"element": handle, "value": value})
+
+        try:
+            results = await self.page.evaluate(FAST_FORM_FILL_SCRIPT, items) if items else []
+        finally:
+            for handle in owned_handles:
+                await handle.dispose()
+
+        return _apply_fast_form_results(fields, results, timings)
+
+    async def _make_step_delay(self):
+        step_delay_seconds = self._get_step_delay_seconds()
+
+        if step_delay_seconds > 0.0:
+            await asyncio.sleep(step_delay_seconds)
+
+    def __str__(self):
+        return f"<AsyncSmartPage {self.__class__.__name__}>"
+
+    __repr__ = __str__
@@ -0,0 +1,92 @@
+from playwright.sync_api import Locator
+from common.constnts import KEYWORD_PLACEHOLDER
+from utils.async_utils import get_async_class, is_async_object
+from wrappers.smart_locator import SmartLocator
+
+
+class SmartComponent:
+    """
+    SmartComponent groups SmartLocator fields of one UI block (product card, cart row)
+    under a root element:
+    - Child SmartLocators resolve relative to the root locator instead of the whole document.
+    - Keyword anchoring happens once in the root selector, child selectors stay simple.
+    - A component can be repeated over every element its root selector matches.
+    - Components can be nested, a nested component resolves inside its parent root.
+    - Components of pages driven by playwright.async_api become AsyncSmartComponent objects.
+    """
+
+    def __new__(cls, owner=None, *args, **kwargs):
+        if is_async_object(owner):
+            from wrappers.async_smart_component import AsyncSmartComponent
+            cls = get_async_class(cls, AsyncSmartComponent)
+        return super().__new__(cls)
+
+    def __init__(self, owner, root_selector):
+        self.owner = owner
+        self.page = owner.page
+        self.config = owner.config
+        self.placeholder_manager = owner.placeholder_manager
+        self.root_selector = str(root_selector)
+        # Index of the root match for repeated components, None for all matches
+        self.index = None
+
+    @property
+    def keyword(self):
+        return self.owner.keyword
+
+    def get_keyword(self):
+        return self.owner.get_keyword()
+
+    def _scope(self):
+        if isinstance(self.owner, SmartComponent):
+            return self.owner.root_locator()
+        return self.page
+
+    def root_locator(self) -> Locator:
+        """Returns the locator of the component root element."""
+        selector = self.root_selector
+        keyword = self.get_keyword()
+
+        if keyword:
+            selector = selector.replace(KEYWORD_PLACEHOLDER, keyword)
+
+        root = self._scope().locator(selector)
+        return root if self.index is None else root.nth(self.index)
+
+    def count(self) -> int:
+        """Returns the number of elements matching the component root selector."""
+        return self.with_owner(self.owner, None).root_locator().count()
+
+    def nth(self, index: int) -> "SmartComponent":
+        """Returns a copy of this component bound to the n-th root element."""
+        return self.with_owner(self.owner, index)
+
+    def all(self) -> list:
+        """Returns one component per element matching the root selector."""
+        return [self.nth(i) for i in range(self.count())]
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def with_owner(self, owner, index=None) -> "SmartComponent":
+        """
+        Returns a copy of this component resolving through another owner,
+        with all child SmartLocators and components rebound to the copy.
+        """
+        clone = object.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.owner = owner
+        clone.index = index
+
+        for name, value in self.__dict__.items():
+            if isinstance(value, SmartLocator) and value.owner is self:
+                clone.__dict__[name] = value.with_owner(clone)
+            elif isinstance(value, SmartComponent) and value.owner is self:
+                clone.__dict__[name] = value.with_owner(clone, value.index)
+
+        return clone
+
+    def __str__(self):
+        return f"<SmartComponent {self.__class__.__name__} root='{self.root_selector}' index={self.index}>"
+
+    __repr__ = __str__
@@ -1,11 +1,92 @@
+import asyncio
+import inspect
+import re
+import time
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
 from playwright.sync_api import expect as pw_expect, Page, Locator, APIResponse
 from helpers.record_mode_helper import fix_noname_parameter_value
+from helpers.span_recorder import start_span
+from utils.async_utils import is_async_object, is_async_page
 from utils.code_utils import normalize_args
+from utils.web_utils import DOM_GENERATION_FUNCTION
 from wrappers.smart_locator import SmartLocator
 
 EXPECTED_TYPE = "expected"
+# Default timeout of expectations in milliseconds, the one of Playwright's expect()
+EXPECT_TIMEOUT = 5000
 # Global cache for runtime expected value fixes
 FIXED_EXPECTS = {}
+# Grouped matchers: name -> (check kind, negated)
+GROUP_MATCHERS = {
+    "to_have_text": ("text", False),
+    "not_to_have_text": ("text", True),
+    "to_have_value": ("value", False),
+    "not_to_have_value": ("value", True),
+    "to_be_visible": ("visible", False),
+    "to_be_hidden": ("visible", True),
+    "to_be_checked": ("checked", False),
+    "not_to_be_checked": ("checked", True),
+    "to_have_url": ("url", False),
+    "not_to_have_url": ("url", True),
+}
+# Polling intervals of grouped expectations in milliseconds, the last one repeats
+GROUP_POLL_INTERVALS = [100, 250, 500, 1000]
+# Evaluates all grouped conditions in one round trip
+GROUP_CHECK_SCRIPT = r"""
+(arg) => {
+    %s
+
+    const normalize = s => (s ?? '').replace(/\s+/g, ' ').trim();
+    const matches = (actual, expected) => {
+        if (actual === null || actual === undefined) return false;
+        if (expected.regex) return new RegExp(expected.regex.source, expected.regex.flags).test(actual);
+        return normalize(actual) === normalize(expected.text);
+    };
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const results = arg.checks.map((check, i) => {
+        if (check.kind === 'url') {
+            const actual = location.href;
+            return { pass: matches(actual, check.expected) !== check.negated, actual };
+        }
+
+        const elements = arg.elements[i];
+        if (elements.length > 1) {
+            return { pass: false, actual: `strict mode violation: ${elements.length} elements` };
+        }
+
+        const el = elements[0];
+        let pass = false;
+        let actual = null;
+
+        if (el) {
+            if (check.kind === 'text') {
+                actual = el.textContent;
+                pass = matches(actual, check.expected);
+            } else if (check.kind === 'value') {
+                actual = 'value' in el ? String(el.value) : null;
+                pass = matches(actual, check.expected);
+            } else if (check.kind === 'visible') {
+                pass = isVisible(el);
+                actual = pass ? 'visible' : 'hidden';
+            } else if (check.kind === 'checked') {
+                pass = ('checked' in el) ? el.checked : el.getAttribute('aria-checked') === 'true';
+                actual = pass ? 'checked' : 'unchecked';
+            }
+        } else {
+            actual = 'element not found';
+        }
+
+        return { pass: pass !== check.negated, actual };
+    });
+
+    const stale = arg.elements.some(list => list.some(el => !el.isConnected));
+    return { generation: smartDomGeneration(), stale, results };
+}
+""" % DOM_GENERATION_FUNCTION
 
 
 class SmartExpect:
@@ -40,25 +121,35 @@ class SmartExpect:
 
                 # Attempt recovery if SmartLocator is available
                 if self._smart_locator:
+                    smart_locator = self._smart_locator
+
+                    with start_span(f"expect.{item}", "expect", cache_key=self.cache_key,
+                                    selector=smart_locator.selector) as span:
+                        try:
+                            element_style = None
+                            failed = False
+                            args, kwargs = normalize_args(target, *args, **kwargs)
+                            args, kwargs = self._validate_arguments(args, kwargs)
+                            element_style = smart_locator._highlight_element_with_delay()
+
+                            target = getattr(self._inner, item)
+
+                            with start_span(item, "wait", cache_key=self.cache_key):
+                                return target(*args, **kwargs)
+
+                        except Exception as e:
+                            failed = True
+                            span.set(retries=1)
+
+                            with start_span("healing", "healing", cache_key=self.cache_key):
+                                target, args, kwargs = self._handle_error(item, target, args, kwargs, e)
 
-                    try:
-                        element_style = None
-                        failed = False
-                        args, kwargs = normalize_args(target, *args, **kwargs)
-                        args, kwargs = self._validate_arguments(args, kwargs)
-                        element_style = self._smart_locator._highlight_element_with_delay()
-
-                        target = getattr(self._inner, item)
-                        return target(*args, **kwargs)
-
-                    except Exception as e:
-                        failed = True
-                        target, args, kwargs = self._handle_error(item, target, args, kwargs, e)
-                        # Retry with fixed expected value
-                        return target(*args, **kwargs)
-                    finally:
-                        if not failed:
-                            self._smart_locator._restore_element_style(element_style)
+                            # Retry with fixed expected value
+                            with start_span(item, "wait", cache_key=self.cache_key, retry=True):
+                                return target(*args, **kwargs)
+                        finally:
+                            if not failed:
+                                smart_locator._restore_element_style(element_style)
 
             return wrapper
         return target
@@ -122,8 +213,315 @@ class SmartExpect:
     def __dir__(self):
         return dir(self._inner)
 
+    @staticmethod
+    def group(timeout: float = None) -> "ExpectGroup":
+        """Returns a group of expectations verified together in one polling loop."""
+        return ExpectGroup(timeout)
+
+
+class ExpectCondition:
+    """One deferred expectation of an ExpectGroup."""
+
+    def __init__(self, actual, matcher: str, expected=None):
+        if matcher not in GROUP_MATCHERS:
+            raise ValueError(f"Unsupported grouped matcher: {matcher}")
+
+        self.actual = actual
+        self.matcher = matcher
+        self.kind, self.negated = GROUP_MATCHERS[matcher]
+        self.expected = expected
+
+    def args(self) -> tuple:
+        return () if self.expected is None else (self.expected,)
+
+    def page(self):
+        if isinstance(self.actual, SmartLocator):
+            return self.actual.page
+        if isinstance(self.actual, (Locator, AsyncLocator)):
+            return self.actual.page
+        if isinstance(self.actual, (Page, AsyncPage)):
+            return self.actual
+        raise ValueError(f"Unsupported type: {type(self.actual)}")
+
+    def locator(self):
+        """Returns the Playwright locator of the condition, None for URL conditions."""
+        if self.kind == "url":
+            return None
+        if isinstance(self.actual, SmartLocator):
+            return self.actual.locator
+        return self.actual
+
+    def to_check(self) -> dict:
+        expected = self.expected
+
+        if isinstance(self.actual, SmartLocator) and isinstance(expected, str):
+            expected = self.actual.placeholder_manager.replace_placeholders_with_values(expected)
+
+        if isinstance(expected, re.Pattern):
+            expected = {"regex": {"source": expected.pattern, "flags": _regex_flags(expected)}}
+        else:
+            expected = {"text": None if expected is None else str(expected)}
+
+        return {"kind": self.kind, "negated": self.negated, "expected": expected}
+
+    def __str__(self):
+        expected = "" if self.expected is None else f"({self.expected!r})"
+        return f"{self.actual} {self.matcher}{expected}"
+
+
+class _GroupedExpect:
+    """Records grouped matchers called on one actual value."""
+
+    def __init__(self, group, actual):
+        self._group = group
+        self._actual = actual
+
+    def __getattr__(self, item):
+        if item not in GROUP_MATCHERS:
+            raise AttributeError(f"Matcher '{item}' is not supported in expectation groups")
+
+        def matcher(expected=None):
+            self._group.conditions.append(ExpectCondition(self._actual, item, expected))
+            return self._group
+
+        return matcher
+
+
+class ExpectGroup:
+    """
+    ExpectGroup verifies many expectations together:
+    - All conditions are checked in one page evaluate per poll.
+    - Element handles are resolved once and reused while the DOM generation is unchanged.
+    - Returns once all conditions pass, or reports every failing condition at once.
+    - In record mode conditions run one by one through SmartExpect to keep self-healing.
+    - For async pages verify() returns a coroutine, use "async with SmartExpect.group()".
+    """
+
+    def __init__(self, timeout: float = None):
+        self.timeout = timeout
+        self.conditions = []
+
+    def expect(self, actual) -> _GroupedExpect:
+        return _GroupedExpect(self, actual)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            result = self.verify()
+
+            if inspect.isawaitable(result):
+                result.close()
+                raise TypeError("Use 'async with SmartExpect.group()' for async pages")
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.verify()
+        return False
+
+    def verify(self, timeout: float = None):
+        if not self.conditions:
+            return
+
+        config = next((c.actual.config for c in self.conditions
+                       if isinstance(c.actual, SmartLocator)), {})
+
+        if config.get("record_mode"):
+            for condition in self.conditions:
+                getattr(expect(condition.actual), condition.matcher)(*condition.args())
+            return
+
+        if timeout is None:
+            timeout = self.timeout if self.timeout is not None else config.get("timeout", 5000)
+
+        pages = {id(c.page()): c.page() for c in self.conditions}
+        if len(pages) != 1:
+            raise ValueError("All grouped expectations must belong to the same page")
+        page = next(iter(pages.values()))
+
+        checks = [c.to_check() for c in self.conditions]
+        deadline = time.monotonic() + float(timeout) / 1000.0
+
+        if is_async_page(page):
+            return self._verify_async(page, checks, deadline)
+
+        elements = None
+        generation = None
+        attempt = 0
+        handles = {}
+
+        try:
+            while True:
+                if elements is None:
+                    # Handles of the previous resolution point to a changed DOM
+                    _dispose_handles(handles)
+                    locators = self._get_locators()
+                    handles = {key: locator.element_handles() for key, locator in locators.items()}
+                    elements = self._get_elements(handles)
+                    generation = None
+
+                state = page.evaluate(GROUP_CHECK_SCRIPT, {"checks": checks, "elements": elements})
+
+                if generation is None:
+                    generation = state["generation"]
+
+                changed = state["stale"] or state["generation"] != generation
+
+                if changed:
+                    # DOM changed since elements were resolved, resolve them again after the delay
+                    elements = None
+
+                if self._check_state(state, deadline, changed):
+                    return
+
+                time.sleep(_get_poll_delay(attempt, deadline))
+                attempt += 1
+        finally:
+            _dispose_handles(handles)
+
+    async def _verify_async(self, page, checks: list, deadline: float):
+        elements = None
+        generation = None
+        attempt = 0
+        handles = {}
+
+        try:
+            while True:
+                if elements is None:
+                    # Handles of the previous resolution point to a changed DOM
+                    await _dispose_handles_async(handles)
+                    locators = self._get_locators()
+                    # Distinct locators are resolved concurrently
+                    resolved = await asyncio.gather(*(locator.element_handles() for locator in locators.values()))
+                    handles = dict(zip(locators, resolved))
+                    elements = self._get_elements(handles)
+                    generation = None
+
+                state = await page.evaluate(GROUP_CHECK_SCRIPT, {"checks": checks, "elements": elements})
+
+                if generation is None:
+                    generation = state["generation"]
+
+                changed = state["stale"] or state["generation"] != generation
+
+                if changed:
+                    # DOM changed since elements were resolved, resolve them again after the delay
+                    elements = None
+
+                if self._check_state(state, deadline, changed):
+                    return
+
+                await asyncio.sleep(_get_poll_delay(attempt, deadline))
+                attempt += 1
+        finally:
+            await _dispose_handles_async(handles)
+
+    def _get_locators(self) -> dict:
+        """Distinct locators of the conditions: locator key -> locator, URL conditions have none."""
+        locators = {}
+
+        for condition in self.conditions:
+            locator = condition.locator()
+            if locator is not None:
+                locators.setdefault(repr(locator), locator)
+
+        return locators
+
+    def _get_elements(self, handles: dict) -> list:
+        """Element handles per condition, conditions on the same locator share them."""
+        elements = []
+
+        for condition in self.conditions:
+            locator = condition.locator()
+            elements.append([] if locator is None else handles[repr(locator)])
+
+        return elements
+
+    def _check_state(self, state: dict, deadline: float, changed: bool = False) -> bool:
+        """
+        Returns True if all conditions passed on an unchanged DOM, raises once the
+        deadline is over. Results of a changed DOM are not trusted, they are only
+        reported if the deadline is over.
+        """
+        failed = [(c, r) for c, r in zip(self.conditions, state["results"]) if not r["pass"]]
+
+        if not failed and not changed:
+            return True
+
+        if time.monotonic() >= deadline:
+            if not failed:
+                raise AssertionError(
+                    f"{len(self.conditions)} expectations could not be verified, "
+                    "the page DOM kept changing until the timeout")
+
+            details = "\n".join(f"  - {c}: actual {r['actual']!r}" for c, r in failed)
+            raise AssertionError(
+                f"{len(failed)} of {len(self.conditions)} expectations failed:\n{details}")
+
+        return False
+
 # ---------------- helpers ---------------- #
 
 def expect(actual):
     """Public entry point: works with SmartLocator or native Playwright objects."""
+    if is_async_object(actual):
+        from wrappers.async_smart_expect import AsyncSmartExpect
+        return AsyncSmartExpect(actual)
+
     return SmartExpect(actual)
+
+
+def expect_all(conditions: list, timeout: float = None):
+    """
+    Verifies many expectations in one polling loop.
+
+    Example:
+        expect_all([
+            (page, "to_have_url", url),
+            (inventory_page.header, "to_have_text", "Swag Labs"),
+            (inventory_page.product_image, "to_be_visible"),
+        ])
+
+    For async pages returns a coroutine to await.
+    """
+    group = ExpectGroup(timeout)
+
+    for actual, matcher, *args in conditions:
+        getattr(group.expect(actual), matcher)(*args)
+
+    return group.verify()
+
+
+def _get_poll_delay(attempt: int, deadline: float) -> float:
+    interval = GROUP_POLL_INTERVALS[min(attempt, len(GROUP_POLL_INTERVALS) - 1)]
+    return min(interval / 1000.0, max(deadline - time.monotonic(), 0.0))
+
+
+def _dispose_handles(handles: dict):
+    for resolved in handles.values():
+        for handle in resolved:
+            handle.dispose()
+    handles.clear()
+
+
+async def _dispose_handles_async(handles: dict):
+    for resolved in handles.values():
+        for handle in resolved:
+            await handle.dispose()
+    handles.clear()
+
+
+def _regex_flags(pattern: re.Pattern) -> str:
+    flags = ""
+    if pattern.flags & re.IGNORECASE:
+        flags += "i"
+    if pattern.flags & re.MULTILINE:
+        flags += "m"
+    if pattern.flags & re.DOTALL:
+        flags += "s"
+    return flags
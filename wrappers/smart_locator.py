@@ -1,13 +1,17 @@
 import inspect
 import re
 import time
-from playwright.sync_api import Locator
+from playwright.sync_api import Error, Locator
 from common.constnts import KEYWORD_PLACEHOLDER
+from utils.async_utils import get_async_class, is_async_object
 from helpers.record_mode_helper import (fix_noname_parameter_value,
                                         handle_missing_locator,
                                         update_source_file)
+from helpers.span_recorder import start_span
 from utils.code_utils import normalize_args
-from utils.web_utils import highlight_element, reset_element_style
+from utils.smart_selector import xpath_to_smart_selector
+from utils.web_utils import (highlight_element, reset_element_style, get_dom_generation,
+                             get_selector_relative_to)
 
 
 PARAMETER_TYPE = "input"
@@ -16,6 +20,17 @@ PARAMETER_TYPE = "input"
 FIXED_SELECTORS = {}
 # Global cache for runtime parameter None value fixes
 FIXED_VALUES = {}
+# Locator methods that can run on a cached element handle
+ELEMENT_HANDLE_METHODS = {
+    "click", "dblclick", "hover", "focus", "tap", "press", "type", "fill",
+    "check", "uncheck", "set_checked", "select_option", "select_text",
+    "set_input_files", "inner_text", "inner_html", "text_content", "input_value",
+    "get_attribute", "is_visible", "is_hidden", "is_enabled", "is_disabled",
+    "is_checked", "is_editable", "bounding_box", "scroll_into_view_if_needed",
+}
+# Errors of element handles whose element or document is gone
+STALE_HANDLE_ERRORS = ("not attached", "Execution context was destroyed",
+                       "Cannot find context", "has been disposed")
 
 
 class SmartLocator:
@@ -26,9 +41,23 @@ class SmartLocator:
       to let the user enter a corrected selector (only if GUI available).
     - Runtime caching: corrected locators are stored in a global map.
     - File patching: the page object source file is updated automatically.
+    - Element caching (opt-in): the resolved element is reused until the DOM changes.
+    - Locators of pages driven by playwright.async_api become AsyncSmartLocator objects.
     """
 
+    def __new__(cls, owner=None, *args, **kwargs):
+        if is_async_object(owner):
+            cls = get_async_class(cls, cls._async_base())
+        return super().__new__(cls)
+
+    @classmethod
+    def _async_base(cls):
+        from wrappers.async_smart_locator import AsyncSmartLocator
+        return AsyncSmartLocator
+
     def __init__(self, owner, selector):
+        # (locator key, DOM generation, element handle) of the last resolved element
+        self._element_cache = None
         self.page = owner.page
         self.config = owner.config
         self.owner = owner
@@ -63,7 +92,23 @@ class SmartLocator:
 
         if self.selector and keyword:
             self.selector = self.selector.replace(KEYWORD_PLACEHOLDER, keyword)
-        return self.page.locator(self.selector)
+        return self._scope().locator(self.selector)
+
+    def _scope(self):
+        # SmartComponent owners narrow the lookup to their root element
+        from wrappers.smart_component import SmartComponent
+
+        if isinstance(self.owner, SmartComponent):
+            return self.owner.root_locator()
+        return self.page
+
+    def with_owner(self, owner) -> "SmartLocator":
+        """Returns a copy of this SmartLocator resolving through another owner."""
+        clone = object.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.owner = owner
+        clone._element_cache = None
+        return clone
 
     @property
     def locator(self):
@@ -74,26 +119,48 @@ class SmartLocator:
 
         if callable(target):
             def wrapper(*args, **kwargs):
-
-                # Normalize so all kwargs become positional
-                args, kwargs = normalize_args(target, *args, **kwargs)
-                # Validate None values and fix them if any
-                args, kwargs = self._validate_arguments(args, kwargs)
-                # Validate if selector is None or empty
-                locator = self._validate_locator(self._locator())
-                element_style = None
-                failed = False
-
-                try:
-                    element_style = self._highlight_element_with_delay()
-                    return getattr(locator, item)(*args, **kwargs)
-                except Exception:
-                    failed = True
-                    new_locator, args, kwargs = self._handle_error(args, kwargs)
-                    return getattr(new_locator, item)(*args, **kwargs)
-                finally:
-                    if not failed:
-                        self._restore_element_style(element_style)
+                with start_span(f"locator.{item}", "locator", field=self.field_name,
+                                cache_key=self.cache_key, selector=self.selector) as span:
+                    # Normalize so all kwargs become positional
+                    args, kwargs = normalize_args(target, *args, **kwargs)
+                    # Validate None values and fix them if any
+                    args, kwargs = self._validate_arguments(args, kwargs)
+                    # Validate if selector is None or empty
+                    locator = self._validate_locator(self._locator())
+                    handle = None
+                    element_style = None
+
+                    try:
+                        # Resolved once per call, highlighting and the action share it
+                        if item in ELEMENT_HANDLE_METHODS:
+                            handle = self._get_cached_element()
+
+                        element_style = self._highlight_element_with_delay(handle)
+
+                        if handle and accepts_arguments(getattr(handle, item), args, kwargs):
+                            try:
+                                with start_span(item, "wait", cache_key=self.cache_key, cached=True):
+                                    return getattr(handle, item)(*args, **kwargs)
+                            except Error as e:
+                                if not is_stale_handle_error(e):
+                                    raise
+                                # Element went stale, fall back to the locator
+                                self._clear_element_cache()
+                                handle = None
+
+                        with start_span(item, "wait", cache_key=self.cache_key):
+                            return getattr(locator, item)(*args, **kwargs)
+                    except Exception:
+                        span.set(retries=1)
+
+                        with start_span("healing", "healing", cache_key=self.cache_key):
+                            new_locator, args, kwargs = self._handle_error(args, kwargs)
+
+                        with start_span(item, "wait", cache_key=self.cache_key, retry=True):
+                            return getattr(new_locator, item)(*args, **kwargs)
+                    finally:
+                        # Failed and healed actions leave no highlight behind either
+                        self._restore_element_style(element_style, handle)
             return wrapper
         return target
 
@@ -111,10 +178,13 @@ class SmartLocator:
 
         new_selector = handle_missing_locator(
             self.page, self.cache_key, str(self.selector), keyword)
+        # Prefer the indexed smart engine over keyword anchored XPath
+        new_selector = xpath_to_smart_selector(new_selector) or new_selector
+        new_selector = self._scope_selector(new_selector)
         update_source_file(
             self.source_file, self.field_name, self.cache_key, keyword, new_selector)
         print(f"New selector: {new_selector}")
-        new_locator = self.page.locator(new_selector)
+        new_locator = self._scope().locator(new_selector)
 
         if keyword:
             new_selector = new_selector.replace(keyword, KEYWORD_PLACEHOLDER)
@@ -126,6 +196,18 @@ class SmartLocator:
 
         return new_locator
 
+    def _scope_selector(self, selector: str) -> str:
+        """
+        Makes a document-level selector of the element picker find the same
+        element under the component root the field resolves in.
+        """
+        scope = self._scope()
+
+        if scope is self.page:
+            return selector
+
+        return get_selector_relative_to(scope, self.page.locator(selector), selector)
+
     def _validate_arguments(self, args, kwargs) -> tuple:
         args = list(args)
 
@@ -156,7 +238,7 @@ class SmartLocator:
 
         if self.config.get("record_mode"):
             try:
-                count = self.page.locator(self.selector).count()
+                count = self._element_count()
             except Exception:
                 count = 0
             # Fix locator
@@ -189,17 +271,20 @@ class SmartLocator:
 
         return locator
 
-    def _highlight_element_with_delay(self):
+    def _get_step_delay_seconds(self) -> float:
         step_delay_milliseconds = self.config.get("step_delay")
 
         try:
-            step_delay_seconds = float(step_delay_milliseconds) / 1000.0
+            return float(step_delay_milliseconds) / 1000.0
         except (TypeError, ValueError):
-            step_delay_seconds = 0.0
+            return 0.0
+
+    def _highlight_element_with_delay(self, handle=None):
+        step_delay_seconds = self._get_step_delay_seconds()
 
         if self.config.get("highlight"):
             try:
-                element_style = highlight_element(self._locator())
+                element_style = highlight_element(handle or self._locator())
                 time.sleep(step_delay_seconds)
                 return element_style
             except Exception:
@@ -208,8 +293,71 @@ class SmartLocator:
         elif step_delay_seconds > 0.0:
             time.sleep(step_delay_seconds)
 
-    def _restore_element_style(self, element_style):
+    def _restore_element_style(self, element_style, handle=None):
 
-        if self.config.get("highlight") and self.page.locator(self.selector).count() > 0:
+        if self.config.get("highlight") and (handle or self._element_count() > 0):
             if not element_style:
-                reset_element_style(self._locator(), element_style)
+                reset_element_style(handle or self._locator(), element_style)
+
+    def _get_cached_element(self):
+        """
+        Returns the element handle of the locator if element caching is enabled,
+        the locator matches exactly one element and the page DOM has not changed
+        since it was resolved, else None. Locators matching no or several elements
+        are left to Playwright, so strict mode violations and healing still apply.
+
+        The DOM generation is checked with one evaluate call per action, so a cache
+        hit saves the selector query, not a round trip: the cache pays off for costly
+        selectors used by multi-step interactions, a single plain action costs one
+        extra call.
+        """
+        if not self.config.get("element_cache"):
+            return None
+
+        locator = self._locator()
+        # The locator representation covers the selector and any component scope
+        key = repr(locator)
+        generation = get_dom_generation(self.page)
+        cached = self._element_cache
+
+        if cached and cached[0] == key and cached[1] == generation:
+            return cached[2]
+
+        self._clear_element_cache()
+        handles = locator.element_handles()
+
+        if len(handles) != 1:
+            for handle in handles:
+                handle.dispose()
+            # Remember the miss, the selector is not queried again until the DOM changes
+            self._element_cache = (key, generation, None)
+            return None
+
+        self._element_cache = (key, generation, handles[0])
+        return handles[0]
+
+    def _element_count(self) -> int:
+        return self._locator().count()
+
+    def _clear_element_cache(self):
+        if self._element_cache and self._element_cache[2]:
+            try:
+                self._element_cache[2].dispose()
+            except Exception:
+                pass # Handle is already gone with its document
+        self._element_cache = None
+
+
+def accepts_arguments(method, args, kwargs) -> bool:
+    """True if the method takes the arguments, element handles miss some Locator options."""
+    try:
+        inspect.signature(method).bind(*args, **kwargs)
+    except TypeError:
+        return False
+    except ValueError:
+        pass # No signature to check
+    return True
+
+
+def is_stale_handle_error(error: Exception) -> bool:
+    return isinstance(error, Error) and any(text in str(error) for text in STALE_HANDLE_ERRORS)
@@ -0,0 +1,202 @@
+import re
+import time
+from utils.async_utils import then
+from wrappers.smart_expect import EXPECT_TIMEOUT
+from wrappers.smart_locator import SmartLocator
+
+# Reads text, value, visibility, attributes and sub-fields of all matches at once
+SNAPSHOT_SCRIPT = r"""
+(elements, options) => {
+    const normalize = s => (s ?? '').replace(/\s+/g, ' ').trim();
+    const read = el => el ? {
+        text: normalize(el.textContent),
+        value: 'value' in el ? String(el.value) : null,
+        visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+            && getComputedStyle(el).visibility !== 'hidden',
+        attributes: Object.fromEntries(options.attributes.map(a => [a, el.getAttribute(a)]))
+    } : null;
+
+    return elements.map(el => {
+        const row = read(el);
+        row.fields = {};
+        for (const [name, selector] of Object.entries(options.fields)) {
+            row.fields[name] = read(el.querySelector(selector));
+        }
+        return row;
+    });
+}
+"""
+# Polling intervals of bulk expectations in milliseconds, the last one repeats
+POLL_INTERVALS = [100, 250, 500, 1000]
+
+
+class SmartLocatorList(SmartLocator):
+    """
+    SmartLocatorList is a list-valued SmartLocator that provides:
+    - One evaluate call to read texts, values, attributes and visibility of all matches.
+    - Named sub-fields (CSS selectors inside every match) for table-like lists.
+    - Keyed lookup of matches by a sub-field value, e.g. product cards by product name.
+    - Bulk expectations over all matches with Playwright-like retrying.
+    Read methods and expectations return coroutines for pages driven by playwright.async_api.
+    """
+
+    @classmethod
+    def _async_base(cls):
+        from wrappers.async_smart_locator_list import AsyncSmartLocatorList
+        return AsyncSmartLocatorList
+
+    def __init__(self, owner, selector, fields: dict | None = None, attributes=()):
+        super().__init__(owner, selector)
+        self.fields = dict(fields or {})
+        self.attributes = list(attributes)
+
+    def snapshot(self, attributes=()) -> list[dict]:
+        """
+        Returns one entry per match:
+        {"text", "value", "visible", "attributes": {...}, "fields": {name: entry | None}}
+        """
+        options = {
+            "fields": self.fields,
+            "attributes": list(dict.fromkeys(self.attributes + list(attributes))),
+        }
+        return self._locator().evaluate_all(SNAPSHOT_SCRIPT, options)
+
+    def texts(self, field: str = None) -> list:
+        return then(self.snapshot(), lambda snapshot: [
+            _get_item(entry, field, "text") for entry in snapshot])
+
+    def values(self, field: str = None) -> list:
+        return then(self.snapshot(), lambda snapshot: [
+            _get_item(entry, field, "value") for entry in snapshot])
+
+    def visibility(self, field: str = None) -> list:
+        return then(self.snapshot(), lambda snapshot: [
+            bool(_get_item(entry, field, "visible")) for entry in snapshot])
+
+    def attribute_values(self, name: str) -> list:
+        return then(self.snapshot(attributes=[name]), lambda snapshot: [
+            entry["attributes"].get(name) for entry in snapshot])
+
+    def rows(self) -> list[dict]:
+        """Returns a flat dict per match: its text plus the text of every sub-field."""
+        return then(self.snapshot(), lambda snapshot: [_to_row(entry) for entry in snapshot])
+
+    def rows_by(self, key_field: str) -> dict:
+        """Returns rows keyed by the text of a sub-field, e.g. rows_by("name")["Backpack"]."""
+        return then(self.rows(), lambda rows: {row[key_field]: row for row in rows})
+
+    def row_by(self, key_field: str, key: str) -> dict | None:
+        key = self.placeholder_manager.replace_placeholders_with_values(key)
+        return then(self.rows_by(key_field), lambda rows: rows.get(key))
+
+    # ---------------- bulk expectations ---------------- #
+
+    def expect_count(self, count: int, timeout: float = None):
+        return self._retry(lambda snapshot: None if len(snapshot) == count
+                           else f"expected {count} elements, got {len(snapshot)}", timeout)
+
+    def expect_texts(self, expected: list, field: str = None, timeout: float = None):
+        """Expects texts of all matches (or of their sub-field) to equal the list."""
+        expected = [self._resolve(value) for value in expected]
+
+        def check(snapshot):
+            actual = [_get_item(entry, field, "text") for entry in snapshot]
+            if actual != expected:
+                return f"expected texts {expected}, got {actual}"
+
+        return self._retry(check, timeout)
+
+    def expect_all_texts_match(self, pattern, field: str = None, timeout: float = None):
+        """Expects every match (or its sub-field) to have a text matching the regex."""
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        def check(snapshot):
+            if not snapshot:
+                return "no elements found"
+            failed = [text for text in (_get_item(entry, field, "text") for entry in snapshot)
+                      if text is None or not regex.search(text)]
+            if failed:
+                return f"texts not matching {regex.pattern!r}: {failed}"
+
+        return self._retry(check, timeout)
+
+    def expect_all_visible(self, field: str = None, timeout: float = None):
+        def check(snapshot):
+            if not snapshot:
+                return "no elements found"
+            hidden = [i for i, entry in enumerate(snapshot) if not _get_item(entry, field, "visible")]
+            if hidden:
+                return f"elements at indexes {hidden} are not visible"
+
+        return self._retry(check, timeout)
+
+    def expect_fields_by_key(self, key_field: str, value_field: str, expected: dict,
+                             timeout: float = None):
+        """
+        Expects the value_field text of the row keyed by key_field for every expected key,
+        e.g. expect_fields_by_key("name", "price", {"Backpack": "$29.99"}).
+        """
+        expected = {self._resolve(k): self._resolve(v) for k, v in expected.items()}
+
+        def check(snapshot):
+            rows = {row.get(key_field): row for row in map(_to_row, snapshot)}
+            mismatches = {}
+            for key, value in expected.items():
+                actual = rows[key].get(value_field) if key in rows else None
+                if actual != value:
+                    mismatches[key] = f"expected {value!r}, got {actual!r}"
+            if mismatches:
+                return f"{value_field} mismatches: {mismatches}"
+
+        return self._retry(check, timeout)
+
+    def _resolve(self, value):
+        if isinstance(value, str):
+            return self.placeholder_manager.replace_placeholders_with_values(value)
+        return value
+
+    def _get_deadline(self, timeout: float = None) -> float:
+        # Bulk expectations wait as long as SmartExpect, not as long as actions
+        if timeout is None:
+            timeout = EXPECT_TIMEOUT
+
+        return time.monotonic() + float(timeout) / 1000.0
+
+    def _retry(self, check, timeout: float = None):
+        """Polls snapshots until check() returns None or the timeout (ms) expires."""
+        deadline = self._get_deadline(timeout)
+        attempt = 0
+
+        while True:
+            try:
+                error = check(self.snapshot())
+            except Exception as e:
+                error = str(e)
+
+            if error is None:
+                return
+
+            if time.monotonic() >= deadline:
+                raise AssertionError(f"{self}: {error}")
+
+            interval = POLL_INTERVALS[min(attempt, len(POLL_INTERVALS) - 1)]
+            time.sleep(min(interval / 1000.0, max(deadline - time.monotonic(), 0.0)))
+            attempt += 1
+
+    def __str__(self):
+        return f"<SmartLocatorList field='{self.field_name}' selector='{self.selector}'>"
+
+    __repr__ = __str__
+
+
+def _get_item(entry: dict, field: str | None, name: str):
+    if field is not None:
+        entry = entry["fields"].get(field)
+    return entry[name] if entry else None
+
+
+def _to_row(entry: dict) -> dict:
+    row = {"text": entry["text"], "value": entry["value"], "visible": entry["visible"]}
+    for name, field_entry in entry["fields"].items():
+        row[name] = field_entry["text"] if field_entry else None
+    return row
@@ -3,10 +3,14 @@ import os
 import time
 from playwright.sync_api import Page
 from helpers.placeholder_manager import PlaceholderManager
+from helpers.test_context import set_current_keyword, start_page_step
 from helpers.record_mode_helper import (handle_missing_locator,
                                         fix_noname_parameter_value,
                                         update_source_file)
+from helpers.span_recorder import start_span
+from utils.async_utils import get_async_class, is_async_page
 from utils.code_utils import normalize_args
+from wrappers.smart_locator import SmartLocator, FIXED_VALUES, PARAMETER_TYPE
 
 # Global cache for runtime URL or navigation fixes
 FIXED_PAGE_PARAMETERS = {}
@@ -18,6 +22,8 @@ FIXED_PLACEHOLDER_NAMES = {}
 FIXED_PLACEHOLDER_VALUES = {}
 # Global cache for runtime page selector fixes
 FIXED_PAGE_SELECTORS = {}
+# Global cache for detected form field kinds (fill, check, select, file)
+FORM_FIELD_KINDS = {}
 PAGE_URL = "page url"
 SELECTOR = "selector"
 FRAME_URL = "frame url"
@@ -26,6 +32,67 @@ KEYWORD_TYPE = "keyword"
 PLACEHOLDER_NAME_TYPE = "placeholder name"
 PLACEHOLDER_VALUE_TYPE = "placeholder value"
 UNSET_VALUE = '=UNSET_VALUE='
+# Page methods marking a test step (trace chunk boundary) outside service steps
+NAVIGATION_METHODS = ("goto", "reload", "go_back", "go_forward")
+
+# Detects how a value is applied to a form element
+FORM_FIELD_KIND_FUNCTION = r"""
+function smartFormFieldKind(el) {
+    const tag = el.tagName.toLowerCase();
+    if (tag === 'select') return 'select';
+    if (tag === 'input') {
+        const type = (el.getAttribute('type') || 'text').toLowerCase();
+        if (type === 'checkbox' || type === 'radio') return 'check';
+        if (type === 'file') return 'file';
+    }
+    return 'fill';
+}
+"""
+FORM_FIELD_KIND_SCRIPT = f"el => {{ {FORM_FIELD_KIND_FUNCTION} return smartFormFieldKind(el); }}"
+# Sets values of all form fields in one call and dispatches input/change events.
+# File inputs cannot be set from page scripts and are reported back as skipped.
+FAST_FORM_FILL_SCRIPT = r"""
+(items) => {
+    %s
+    const dispatch = el => {
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    };
+
+    return items.map(({ element: el, value }) => {
+        const start = performance.now();
+        const kind = smartFormFieldKind(el);
+        // Trusted fills write None as an empty value too
+        const text = value == null ? '' : String(value);
+
+        if (kind === 'file') {
+            return { kind, skipped: true, ms: 0 };
+        }
+        if (kind === 'check') {
+            // click() toggles the state and fires click, input and change like a user
+            if (el.checked !== Boolean(value)) el.click();
+        } else if (kind === 'select') {
+            const values = [].concat(value).map(String);
+            for (const option of el.options) {
+                option.selected = values.includes(option.value) || values.includes(option.label);
+            }
+            dispatch(el);
+        } else if (el.isContentEditable) {
+            el.focus();
+            el.textContent = text;
+            dispatch(el);
+        } else {
+            // Native setter keeps framework value trackers (e.g. React) in sync
+            const proto = el instanceof HTMLTextAreaElement
+                ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            el.focus();
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+            dispatch(el);
+        }
+        return { kind, skipped: false, ms: performance.now() - start };
+    });
+}
+""" % FORM_FIELD_KIND_FUNCTION
 
 class SmartPage:
     """
@@ -34,8 +101,15 @@ class SmartPage:
     - Self-healing: if navigation or selector fails in record_mode, user can fix it interactively.
     - Placeholder management for dynamic URLs and form data.
     - Runtime caching of fixed values and updated navigation URLs.
+    - Page objects created for a playwright.async_api page become AsyncSmartPage objects.
     """
 
+    def __new__(cls, page=None, *args, **kwargs):
+        if is_async_page(page):
+            from wrappers.async_smart_page import AsyncSmartPage
+            cls = get_async_class(cls, AsyncSmartPage)
+        return super().__new__(cls)
+
     def __init__(self, page: Page, config: dict):
         self.page = page
         self.config = config
@@ -65,34 +139,189 @@ class SmartPage:
     def set_keyword(self, keyword: str):
         self.keyword = keyword
         self._validate_keyword_value()
+        set_current_keyword(self.keyword)
 
     def get_keyword(self):
         return self.keyword
 
     def reset_keyword(self):
         self.keyword = None
+        set_current_keyword(None)
 
     def clear_keyword(self):
         self.keyword = None
+        set_current_keyword(None)
+
+    def fill_fields(self, fields, *values, fast: bool = None, verbose: bool = None) -> dict:
+        """
+        Fills several form fields at once. Named fill_fields rather than fill_form,
+        which page objects such as LoginPage.fill_form define on top of it.
+
+        Args:
+            fields (dict | tuple): Field name (or SmartLocator) -> value, or a tuple of
+                field names (or SmartLocators) whose values follow as positional arguments.
+                Checkboxes and radio buttons take booleans, selects take an option
+                value/label or a list, file inputs take file paths, all other fields take text.
+            values: Field values for a tuple of fields. Record mode traces None values
+                back to the page object method parameters passed here.
+            fast (bool): Set values in the page DOM with one call instead of
+                trusted input actions. Defaults to config "fast_form_fill".
+            verbose (bool): Print the field timings. Defaults to record mode.
+
+        Returns:
+            dict: Field name -> time in milliseconds spent on the field.
+        """
+        if fast is None:
+            fast = self.config.get("fast_form_fill", False)
+
+        fields = self._prepare_form_fields(fields, values)
+        timings = {}
+
+        if fast and not self._use_form_field_wrapper():
+            fields = self._fill_form_fast(fields, timings)
+
+        for field, value in fields:
+            start = time.perf_counter()
+            self._fill_form_field(field, value)
+            timings[field.field_name] = (time.perf_counter() - start) * 1000.0
+
+        return _report_form_timings(timings, self._is_verbose_form_fill(verbose))
+
+    def _is_verbose_form_fill(self, verbose: bool | None) -> bool:
+        return bool(self.config.get("record_mode")) if verbose is None else verbose
+
+    def _use_form_field_wrapper(self) -> bool:
+        return bool(self.config.get("record_mode") or self.config.get("highlight"))
+
+    def _prepare_form_fields(self, fields, values: tuple) -> list:
+        if isinstance(fields, dict):
+            if values:
+                raise TypeError("Form field values are given in the fields dict")
+            fields, values = tuple(fields), tuple(fields.values())
+        else:
+            if len(fields) != len(values):
+                raise TypeError(f"Got {len(values)} values for {len(fields)} form fields")
+            values = self._validate_form_values(fields, values)
+
+        fields = [self._get_form_field(name) for name in fields]
+
+        # Self-healing and highlighting need the SmartLocator wrapper for every action
+        if self._use_form_field_wrapper():
+            return list(zip(fields, values))
+
+        # Replace placeholders once per value, the fields are filled without the wrapper
+        return [(field, self._replace_form_value(value)) for field, value in zip(fields, values)]
+
+    def _validate_form_values(self, fields: tuple, values: tuple) -> list:
+        values = list(values)
+
+        for i, name in enumerate(fields):
+
+            if self.config.get("record_mode") and values[i] is None:
+                field = self._get_form_field(name)
+
+                if field.cache_key not in FIXED_VALUES:
+                    # The fields tuple is the first argument of fill_fields()
+                    FIXED_VALUES[field.cache_key] = fix_noname_parameter_value(
+                        PARAMETER_TYPE, self.page, i + 1, "None",
+                        self.keyword, self.placeholder_manager)
+
+                values[i] = FIXED_VALUES[field.cache_key][1]
+
+        return values
+
+    def _get_form_field(self, name) -> SmartLocator:
+        field = name
+
+        if isinstance(name, str):
+            field = self
+            for part in name.split("."):
+                field = getattr(field, part)
+
+        if not isinstance(field, SmartLocator):
+            raise TypeError(f"Form field '{name}' is not a SmartLocator: {field!r}")
+
+        return field
+
+    def _replace_form_value(self, value):
+        if isinstance(value, str):
+            return self.placeholder_manager.replace_placeholders_with_values(value)
+        if isinstance(value, (list, tuple)):
+            return [self._replace_form_value(item) for item in value]
+        return value
+
+    def _fill_form_field(self, field: SmartLocator, value):
+        kind = self._get_form_field_kind(field)
+
+        if self._use_form_field_wrapper():
+            target = field
+        else:
+            # Skip the SmartLocator wrapper, the value is already prepared
+            target = field._get_cached_element() or field.locator
+
+        return _apply_form_value(target, kind, value, wrapped=target is field)
+
+    def _get_form_field_kind(self, field: SmartLocator) -> str:
+        if field.cache_key not in FORM_FIELD_KINDS:
+            target = field if self._use_form_field_wrapper() else field.locator
+            FORM_FIELD_KINDS[field.cache_key] = target.evaluate(FORM_FIELD_KIND_SCRIPT)
+
+        return FORM_FIELD_KINDS[field.cache_key]
+
+    def _fill_form_fast(self, fields: list, timings: dict) -> list:
+        """
+        Sets field values with one page evaluate call.
+        Returns the fields that still need trusted actions (file inputs).
+        """
+        items, owned_handles = [], []
+
+        for field, value in fields:
+            handle = field._get_cached_element()
+
+            if handle is None:
+                handle = field.locator.element_handle()
+                owned_handles.append(handle)
+
+            items.append({"element": handle, "value": value})
+
+        try:
+            results = self.page.evaluate(FAST_FORM_FILL_SCRIPT, items) if items else []
+        finally:
+            for handle in owned_handles:
+                handle.dispose()
+
+        return _apply_fast_form_results(fields, results, timings)
 
     def __getattr__(self, item):
         target = getattr(self.page, item)
 
         if callable(target):
             def wrapper(*args, **kwargs):
-                args, kwargs = normalize_args(target, *args, **kwargs)
-                args, kwargs = self._validate_arguments(item, args, kwargs)
-                args, kwargs = self._replace_placeholders(args, kwargs)
-                self._make_step_delay()
+                if item in NAVIGATION_METHODS:
+                    start_page_step(item)
 
-                try:
-                    return target(*args, **kwargs)
+                with start_span(f"page.{item}", "page", cache_key=self.cache_key) as span:
+                    args, kwargs = normalize_args(target, *args, **kwargs)
+                    args, kwargs = self._validate_arguments(item, args, kwargs)
 
-                except Exception as e:
-                    # Handle page parameter error
-                    args, kwargs = self._handle_error(e, item, args, kwargs)
+                    with start_span("placeholders", "placeholders", cache_key=self.cache_key):
+                        args, kwargs = self._replace_placeholders(args, kwargs)
 
-                    return target(*args, **kwargs)
+                    self._make_step_delay()
+
+                    try:
+                        with start_span(item, "wait", cache_key=self.cache_key):
+                            return target(*args, **kwargs)
+
+                    except Exception as e:
+                        span.set(retries=1)
+
+                        # Handle page parameter error
+                        with start_span("healing", "healing", cache_key=self.cache_key):
+                            args, kwargs = self._handle_error(e, item, args, kwargs)
+
+                        with start_span(item, "wait", cache_key=self.cache_key, retry=True):
+                            return target(*args, **kwargs)
 
             return wrapper
         return target
@@ -241,15 +470,52 @@ class SmartPage:
 
         return args, kwargs
 
-    def _make_step_delay(self):
+    def _get_step_delay_seconds(self) -> float:
         step_delay_milliseconds = self.config.get("step_delay")
 
         try:
-            step_delay_seconds = float(step_delay_milliseconds) / 1000.0
+            return float(step_delay_milliseconds) / 1000.0
         except (TypeError, ValueError):
-            step_delay_seconds = 0.0
+            return 0.0
+
+    def _make_step_delay(self):
+        step_delay_seconds = self._get_step_delay_seconds()
 
         if step_delay_seconds > 0.0:
             time.sleep(step_delay_seconds)
 
     __repr__ = __str__
+
+
+def _apply_fast_form_results(fields: list, results: list, timings: dict) -> list:
+    """Records timings and field kinds, returns the fields skipped by the page script."""
+    remaining = []
+
+    for (field, value), result in zip(fields, results):
+        FORM_FIELD_KINDS[field.cache_key] = result["kind"]
+
+        if result["skipped"]:
+            remaining.append((field, value))
+        else:
+            timings[field.field_name] = result["ms"]
+
+    return remaining
+
+
+def _apply_form_value(target, kind: str, value, wrapped: bool):
+    if kind == "check":
+        return target.set_checked(bool(value))
+    if kind == "select":
+        return target.select_option(value)
+    if kind == "file":
+        return target.set_input_files(value)
+    if wrapped:
+        # SmartLocator validates None values itself
+        return target.fill(value)
+    return target.fill("" if value is None else str(value))
+
+
+def _report_form_timings(timings: dict, verbose: bool) -> dict:
+    if verbose:
+        print("Form filled: " + ", ".join(f"{k}={v:.1f}ms" for k, v in timings.items()))
+    return timings